@@ -0,0 +1,100 @@
+"""Measures how many records per second each installed JSON backend writes as JSON Lines, the
+format of `--format NDJSON`, compared to the per-record `json.dumps` of `--format RAW-JSON`.
+
+Usage:
+    python benchmarks/json_lines_backends.py [--records 100000] [--repeat 3]
+"""
+import argparse
+import json
+import time
+
+from code42cli.json_lines import get_available_backends
+from code42cli.json_lines import get_dumps_lines
+from code42cli.output_formats import to_json
+
+_BATCH_SIZE = 1000
+
+
+def _create_file_event(i):
+    return {
+        "eventId": "0_1d71796f-af5b-4231-9d8e-df6434da4663_{}".format(i),
+        "eventType": "READ_BY_APP",
+        "eventTimestamp": "2020-10-08T10:14:07.123Z",
+        "insertionTimestamp": "2020-10-08T10:16:01.456Z",
+        "filePath": "C:/Users/test.user/Documents/",
+        "fileName": "report-{}.docx".format(i),
+        "fileType": "FILE",
+        "fileCategory": "DOCUMENT",
+        "fileSize": 1048576 + i,
+        "fileOwner": "test.user",
+        "md5Checksum": "d41d8cd98f00b204e9800998ecf8427e",
+        "sha256Checksum": "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855",
+        "deviceUserName": "test.user@example.com",
+        "osHostName": "TEST-LAPTOP",
+        "publicIpAddress": "203.0.113.7",
+        "privateIpAddresses": ["10.0.0.12", "fe80::1"],
+        "deviceUid": "935873453596901068",
+        "userUid": "912338501981077099",
+        "actor": None,
+        "shared": False,
+        "sharedWith": [],
+        "exposure": ["ApplicationRead"],
+        "processOwner": "test.user",
+        "processName": "chrome.exe",
+        "tabUrl": "https://example.com/upload?file={}".format(i),
+        "removableMediaCapacity": None,
+        "outsideActiveHours": False,
+    }
+
+
+def _time(write, records, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        write(records)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(records) / best
+
+
+def _write_json_lines(dumps_lines):
+    def write(records):
+        for i in range(0, len(records), _BATCH_SIZE):
+            dumps_lines(records[i : i + _BATCH_SIZE])
+
+    return write
+
+
+def _write_raw_json(records):
+    for record in records:
+        to_json(record)
+
+
+def _write_formatted_json(records):
+    for record in records:
+        json.dumps(record, indent=4)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    records = [_create_file_event(i) for i in range(args.records)]
+    results = [
+        ("RAW-JSON (json.dumps per record)", _write_raw_json),
+        ("JSON (json.dumps with indent=4)", _write_formatted_json),
+    ]
+    results.extend(
+        ("NDJSON ({})".format(backend), _write_json_lines(get_dumps_lines(backend)))
+        for backend in get_available_backends()
+    )
+    print("{} records, best of {} runs".format(args.records, args.repeat))
+    for name, write in results:
+        rate = _time(write, records, args.repeat)
+        print("{:<36}{:>14,.0f} records/sec".format(name, rate))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,52 @@
 import os
+from math import ceil
+from threading import Lock
 
 import click
+import py42.settings
+from py42.exceptions import Py42Error
 
+from code42cli.bulk_jobs import BulkRejectsWriter
+from code42cli.bulk_jobs import create_job_journal
+from code42cli.bulk_jobs import get_rejects_path
+from code42cli.bulk_jobs import resume_job_journal
+from code42cli.bulk_validation import validate_row
+from code42cli.cmds.shared import cache_user_ids
+from code42cli.cmds.shared import get_user_id_cache
+from code42cli.errors import Code42CLIError
 from code42cli.errors import LoggedCLIError
 from code42cli.logger import get_main_cli_logger
+from code42cli.worker import AdaptiveConcurrency
+from code42cli.worker import RetryPolicy
 from code42cli.worker import Worker
+from code42cli.worker import WorkerStats
 
 _logger = get_main_cli_logger()
 
+DEFAULT_MIN_WORKERS = 1
+DEFAULT_MAX_WORKERS = 20
+DEFAULT_MAX_ATTEMPTS = 3
+_INITIAL_WORKERS = 5
+DEFAULT_QUEUED_ROWS_PER_WORKER = 2
+_MAX_GROUPED_ROWS = 1000
+
+
+class BulkConfig:
+    """Settings shared by all `bulk` subcommands, populated from the options added by
+    :func:`code42cli.options.bulk_options`."""
+
+    def __init__(self):
+        self.min_workers = DEFAULT_MIN_WORKERS
+        self.max_workers = DEFAULT_MAX_WORKERS
+        # The most times to try a row that fails with a transient HTTP error (429 or 5xx).
+        self.max_attempts = DEFAULT_MAX_ATTEMPTS
+        # The most rows read ahead of the workers. Defaults to a multiple of max_workers.
+        self.max_queue_size = None
+        # The ID of a previous bulk job to resume, skipping the rows that job completed.
+        self.resume = None
+        # True to only validate the rows of the file, without processing them.
+        self.dry_run = False
+
 
 class BulkCommandType:
     ADD = "add"
@@ -67,21 +106,110 @@ def generate_template_cmd_factory(group_name, commands_dict):
     return generate_template
 
 
-def run_bulk_process(row_handler, rows, progress_label=None):
+def is_rewindable(rows):
+    """True if `rows` can be iterated more than once, such as a list or the rows of a regular
+    file, so that they can be checked before they are processed."""
+    return getattr(rows, "is_rewindable", isinstance(rows, (list, tuple)))
+
+
+def prefetch_user_ids(sdk, rows, username_column="username"):
+    """Looks up the user IDs for a bulk file all at once, before its rows are processed, when
+    that takes fewer requests than looking up each user as its row is processed.
+
+    The distinct usernames in `rows` that aren't already cached are collected first, and the
+    number of users in the tenant is requested. If there are more uncached usernames than pages
+    of users, every user is fetched with `sdk.users.get_all()`, a page of users per request,
+    and their IDs are cached for :func:`code42cli.cmds.shared.get_user_id`. Otherwise, or if
+    the users can't be fetched, each row looks up its own user as usual.
+
+    Rows that can only be read once, such as from stdin, are not prefetched.
+
+    Args:
+        sdk (py42.sdk.SDKClient): The py42 sdk.
+        rows (iterable): The rows to process. CSV rows are dicts; flat file rows are usernames.
+        username_column (str): The CSV column holding the username.
+    """
+    if not is_rewindable(rows):
+        return
+    usernames = _get_uncached_usernames(sdk, rows, username_column)
+    # Fetching every user takes at least one request, so it's never worth it for one user.
+    if len(usernames) <= 1:
+        return
+    try:
+        total_users = sdk.users.get_page(1, page_size=1)["totalCount"]
+        if len(usernames) <= ceil(total_users / py42.settings.items_per_page):
+            return
+        for page in sdk.users.get_all():
+            cache_user_ids(
+                sdk, [(user["username"], user["userUid"]) for user in page["users"]]
+            )
+    except Py42Error:
+        _logger.log_verbose_error()
+
+
+def _get_uncached_usernames(sdk, rows, username_column):
+    cache = get_user_id_cache(sdk)
+    usernames = set()
+    for row in rows:
+        username = row.get(username_column) if isinstance(row, dict) else row.strip()
+        if username and not (cache and cache.get(username)):
+            usernames.add(username)
+    return usernames
+
+
+def run_bulk_process(
+    row_handler,
+    rows,
+    progress_label=None,
+    config=None,
+    group_by=None,
+    journal=None,
+    rejects=None,
+    retry_rows=False,
+):
     """Runs a bulk process.
 
     Args:
         row_handler (callable): A callable that you define to process values from the row as
             either *args or **kwargs.
         rows (iterable): the rows to process.
+        progress_label (str): The label to show next to the progress bar.
+        config (BulkConfig): Settings from the `bulk` subcommand options.
+        group_by (str): A CSV column to group rows by. See :class:`BulkProcessor`.
+        journal (BulkJobJournal): The journal of the job. See :class:`BulkProcessor`.
+        rejects (BulkRejectsWriter): Writes the rows that fail. See :class:`BulkProcessor`.
+        retry_rows (bool): Whether rows are safe to retry. See :class:`BulkProcessor`.
     """
-    processor = _create_bulk_processor(row_handler, rows, progress_label)
+    config = config or BulkConfig()
+    if config.min_workers > config.max_workers:
+        raise Code42CLIError("--min-workers can't be greater than --max-workers.")
+    processor = _create_bulk_processor(
+        row_handler,
+        rows,
+        progress_label,
+        config,
+        group_by,
+        journal,
+        rejects,
+        retry_rows,
+    )
     processor.run()
 
 
-def _create_bulk_processor(row_handler, rows, progress_label):
+def _create_bulk_processor(
+    row_handler, rows, progress_label, config, group_by, journal, rejects, retry_rows
+):
     """A factory method to create the bulk processor, useful for testing purposes."""
-    return BulkProcessor(row_handler, rows, progress_label=progress_label)
+    return BulkProcessor(
+        row_handler,
+        rows,
+        progress_label=progress_label,
+        config=config,
+        journal=journal,
+        rejects=rejects,
+        group_by=group_by,
+        retry_rows=retry_rows,
+    )
 
 
 class BulkProcessor:
@@ -93,57 +221,254 @@ class BulkProcessor:
             and first row `1,test`, then `row_handler` should receive kwargs
             `prop_a: '1', prop_b: 'test'` when processing the first row. If it's a flat file, then
             `row_handler` only needs to take an extra arg.
-        reader (CSVReader or FlatFileReader): A generator that reads rows and yields data into `row_handler`.
+        rows (iterable): The rows to process, such as a :class:`code42cli.file_readers.CSVReader` or
+            :class:`code42cli.file_readers.FlatFileReader`, which read rows lazily from a file.
+        worker (Worker): The worker to process rows with. Defaults to a worker that adapts its
+            concurrency between `config.min_workers` and `config.max_workers`.
+        progress_label (str): The label to show next to the progress bar.
+        config (BulkConfig): Settings from the `bulk` subcommand options.
+        journal (BulkJobJournal): Records the outcome of each row so the job can be resumed.
+            Defaults to a new journal, or the journal of the job given by `config.resume`.
+            Jobs that can't be resumed use a :class:`code42cli.bulk_jobs.UnrecordedJobJournal`.
+        rejects (BulkRejectsWriter): Writes each row that fails, along with its error, so the
+            failed rows can be retried on their own. Defaults to a rejects file for the job.
+        group_by (str): A CSV column to group rows by, so rows sharing a value are processed
+            with a single call. `row_handler` then receives the shared value and a list of the
+            rows' kwargs instead of each row's kwargs. Rows are grouped within windows of up to
+            1000 rows read, so the whole file is never held in memory. Each row in a group
+            succeeds or fails with its group, except that rows the reader's `validators` find
+            a problem with fail on their own instead of being grouped.
+        retry_rows (bool): True if `row_handler` makes at most one change per call, after any
+            lookups, so that a row failing with a transient HTTP error (429 or 5xx) can be run
+            again from the start, up to `config.max_attempts` times. Handlers that make several
+            changes must not set this, since a retry would repeat the changes that already
+            succeeded; their rows fail on the first error instead.
     """
 
-    def __init__(self, row_handler, rows, worker=None, progress_label=None):
-        total = len(rows)
+    def __init__(
+        self,
+        row_handler,
+        rows,
+        worker=None,
+        progress_label=None,
+        config=None,
+        journal=None,
+        rejects=None,
+        group_by=None,
+        retry_rows=False,
+    ):
+        config = config or BulkConfig()
+        self._journal = journal or _open_journal(config)
+        self._rejects = rejects or BulkRejectsWriter(
+            get_rejects_path(self._journal.job_id),
+            fieldnames=getattr(rows, "fieldnames", None),
+        )
+        self._is_resumed = bool(config.resume)
+        self._total_skipped = 0
         self._rows = rows
         self._row_handler = row_handler
         self._progress_bar = click.progressbar(
-            length=len(self._rows),
+            iterable=rows,
+            length=_get_progress_length(rows),
             item_show_func=self._show_stats,
             label=progress_label,
         )
-        self.__worker = worker or Worker(5, total, bar=self._progress_bar)
-        self._stats = self.__worker.stats
+        self._progress_lock = Lock()
+        self._bytes_dispatched = 0
+        self._group_by = group_by
+        self._groups = {}
+        self._total_grouped = 0
+        self._validators = getattr(rows, "validators", {})
+        self.__worker = worker or _create_worker(
+            _get_row_count(rows), config, retry_rows
+        )
+        # Stats are kept by row rather than by worker task, since a task may process a group.
+        self._stats = WorkerStats(_get_row_count(rows))
 
     def run(self):
-        """Processes the csv rows specified in the ctor, calling `self.row_handler` on each row."""
-        for row in self._rows:
-            self._process_row(row)
+        """Processes the csv rows specified in the ctor, calling `self.row_handler` on each row.
+        Rows are dispatched to the worker as they are read, so processing starts before the whole
+        file has been read. Reading pauses whenever the worker's queue is full, so only a bounded
+        number of rows are held in memory regardless of file size.
+
+        Each row's outcome is recorded in the job journal and rows that fail are written to the
+        rejects file. If the job was resumed, rows that succeeded in a previous run are
+        skipped."""
+        self._print_job_id()
+        for row_number, row in enumerate(self._rows):
+            self._process_row(row_number, row)
+        self._process_groups()
         self.__worker.wait()
+        self._finish_progress()
         self._print_results()
 
-    def _process_row(self, row):
-        if isinstance(row, dict):
-            self._process_csv_row(row)
+    def _process_row(self, row_number, row):
+        progress = self._get_row_progress()
+        task = None
+        if self._journal.has_succeeded(row_number):
+            self._total_skipped += 1
+        elif isinstance(row, dict) and self._group_by:
+            self._add_to_group(row_number, row, progress)
+            return
+        elif isinstance(row, dict):
+            task = self._process_csv_row(row)
         elif row:
-            self._process_flat_file_row(row.strip())
+            task = self._process_flat_file_row(row.strip())
 
-    def _process_csv_row(self, row):
-        # Removes problems from including extra columns. Error messages from out of order args
-        # are more indicative this way too.
-        row.pop(None, None)
+        if task:
+            rows = [(row_number, row, progress)]
+            task.add_done_callback(lambda t: self._handle_rows_outcome(rows, t))
+        else:
+            self._update_progress(progress)
 
-        row_values = {key: val if val != "" else None for key, val in row.items()}
-        self.__worker.do_async(
+    def _process_csv_row(self, row):
+        row_values = _get_csv_row_values(row)
+        return self.__worker.do_async(
             lambda *args, **kwargs: self._handle_row(*args, **kwargs), **row_values
         )
 
+    def _add_to_group(self, row_number, row, progress):
+        row_values = _get_csv_row_values(row)
+        problems = list(validate_row(row_values, self._validators))
+        if problems:
+            # The call for the group would fail for every row in it because of this one.
+            error = Code42CLIError(" ".join(problems))
+            _logger.log_error(error)
+            self._record_rows_outcome([(row_number, row, progress)], error)
+            return
+        group = self._groups.setdefault(row_values.get(self._group_by), [])
+        group.append((row_number, row, progress))
+        self._total_grouped += 1
+        if self._total_grouped >= _MAX_GROUPED_ROWS:
+            self._process_groups()
+
+    def _process_groups(self):
+        for key, rows in self._groups.items():
+            group_values = [_get_csv_row_values(row) for _, row, _ in rows]
+            task = self.__worker.do_async(self._row_handler, key, group_values)
+            task.add_done_callback(
+                lambda t, rows=rows: self._handle_rows_outcome(rows, t)
+            )
+        self._groups = {}
+        self._total_grouped = 0
+
     def _process_flat_file_row(self, row):
         if row:
-            self.__worker.do_async(
+            return self.__worker.do_async(
                 lambda *args, **kwargs: self._handle_row(*args, **kwargs), row
             )
 
     def _handle_row(self, *args, **kwargs):
         self._row_handler(*args, **kwargs)
 
+    def _handle_rows_outcome(self, rows, task):
+        self._record_rows_outcome(rows, task.exception())
+
+    def _record_rows_outcome(self, rows, error):
+        for row_number, row, progress in rows:
+            self._journal.record(row_number, error is None)
+            if error is not None:
+                self._rejects.write(row, error)
+                self._stats.increment_total_errors()
+            self._stats.increment_total_processed()
+            self._update_progress(progress)
+
+    def _get_row_progress(self):
+        """Returns how far the progress bar should advance once the last row read is processed.
+        When reading from a file of known size, progress is measured in bytes read rather than
+        rows, so it can be estimated without reading the whole file first."""
+        if getattr(self._rows, "total_bytes", None) is None:
+            return 1
+        bytes_read = self._rows.bytes_read
+        progress = bytes_read - self._bytes_dispatched
+        self._bytes_dispatched = bytes_read
+        return progress
+
+    def _update_progress(self, progress):
+        with self._progress_lock:
+            self._progress_bar.update(progress)
+
+    def _finish_progress(self):
+        bar = self._progress_bar
+        if bar.length is not None and bar.pos < bar.length:
+            self._update_progress(bar.length - bar.pos)
+
     def _show_stats(self, _):
         return str(self._stats)
 
+    def _print_job_id(self):
+        job_id = self._journal.job_id
+        if self._is_resumed:
+            click.echo("Resuming bulk job {}.".format(job_id))
+        elif not self._journal.is_resumable:
+            click.echo("Starting bulk job {}.".format(job_id))
+        else:
+            click.echo(
+                "Starting bulk job {0}. If it is interrupted, rerun the command with "
+                "`--resume {0}` to process only the remaining rows.".format(job_id)
+            )
+
     def _print_results(self):
         click.echo("")
+        if self._total_skipped:
+            click.echo(
+                "Skipped {} rows that succeeded in a previous run.".format(
+                    self._total_skipped
+                )
+            )
+        self._rejects.close()
         if self._stats.total_errors:
+            self._journal.close()
+            for line in self._rejects.describe_rejects():
+                click.echo(line)
+            if self._journal.is_resumable:
+                click.echo(
+                    "To retry the failed rows, rerun the command with `--resume {}` or "
+                    "run it on the failed rows file.".format(self._journal.job_id)
+                )
             raise LoggedCLIError("Some problems occurred during bulk processing.")
+        self._journal.delete()
+
+
+def _get_csv_row_values(row):
+    # Removes problems from including extra columns. Error messages from out of order args
+    # are more indicative this way too.
+    row.pop(None, None)
+    return {key: val if val != "" else None for key, val in row.items()}
+
+
+def _open_journal(config):
+    ctx = click.get_current_context(silent=True)
+    command = ctx.command_path if ctx else None
+    if config.resume:
+        return resume_job_journal(config.resume, command=command)
+    return create_job_journal(command=command)
+
+
+def _get_progress_length(rows):
+    total_bytes = getattr(rows, "total_bytes", None)
+    return total_bytes if total_bytes is not None else _get_row_count(rows)
+
+
+def _get_row_count(rows):
+    try:
+        return len(rows)
+    except TypeError:
+        return None
+
+
+def _create_worker(total, config, retry_rows):
+    concurrency = AdaptiveConcurrency(
+        config.min_workers, config.max_workers, initial_limit=_INITIAL_WORKERS
+    )
+    max_queue_size = (
+        config.max_queue_size or config.max_workers * DEFAULT_QUEUED_ROWS_PER_WORKER
+    )
+    retry_policy = RetryPolicy(max_attempts=config.max_attempts) if retry_rows else None
+    return Worker(
+        config.max_workers,
+        total,
+        concurrency=concurrency,
+        max_queue_size=max_queue_size,
+        retry_policy=retry_policy,
+    )
@@ -0,0 +1,228 @@
+import csv
+import os
+import re
+from threading import Lock
+from uuid import uuid4
+
+from code42cli.errors import Code42CLIError
+from code42cli.util import get_user_project_path
+
+_JOB_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+_SUCCEEDED = "S"
+_FAILED = "F"
+
+
+def get_bulk_jobs_dir():
+    """The directory where bulk job journals are stored."""
+    return get_user_project_path("bulk_jobs")
+
+
+def create_job_journal(command=None):
+    """Starts the journal for a new bulk job with a newly generated job ID."""
+    return BulkJobJournal(uuid4().hex[:12], command=command)
+
+
+def resume_job_journal(job_id, command=None):
+    """Opens the journal of an existing bulk job so it can be resumed. Raises
+    :class:`code42cli.errors.Code42CLIError` if the job does not exist or was started by a
+    different command."""
+    return BulkJobJournal(job_id, command=command, resume=True)
+
+
+class BulkJobJournal:
+    """An append-only record of the outcome of each row a bulk job processes, stored in the
+    `bulk_jobs` directory of the user project path.
+
+    The first line records the command that started the job. Each following line holds the
+    position of a completed row in the input and whether it succeeded (`S`) or failed (`F`),
+    e.g. `42 S`. When resuming, rows that already succeeded are skipped.
+
+    Args:
+        job_id (str): The ID of the bulk job.
+        command (str): The command running the job, e.g. `code42 legal-hold bulk add`.
+        resume (bool): True to load and append to the existing journal for `job_id`.
+    """
+
+    is_resumable = True
+
+    def __init__(self, job_id, command=None, resume=False):
+        if not _JOB_ID_PATTERN.match(job_id):
+            raise Code42CLIError("Invalid bulk job ID '{}'.".format(job_id))
+        self.job_id = job_id
+        self.path = os.path.join(get_bulk_jobs_dir(), "{}.journal".format(job_id))
+        self._succeeded_rows = set()
+        self._lock = Lock()
+        if resume:
+            self._load(command)
+            self._file = open(self.path, "a", encoding="utf-8")
+        else:
+            self._file = open(self.path, "w", encoding="utf-8")
+            self._write_line("# {}".format(command or ""))
+
+    @property
+    def total_succeeded(self):
+        """The number of rows recorded as succeeded, including rows from previous runs."""
+        return len(self._succeeded_rows)
+
+    def has_succeeded(self, row_number):
+        """Returns True if the row at `row_number` succeeded in a previous run of this job."""
+        return row_number in self._succeeded_rows
+
+    def record(self, row_number, succeeded):
+        """Appends the outcome of the row at `row_number` to the journal. Safe to call from
+        multiple threads."""
+        outcome = _SUCCEEDED if succeeded else _FAILED
+        with self._lock:
+            self._write_line("{} {}".format(row_number, outcome))
+            if succeeded:
+                self._succeeded_rows.add(row_number)
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    def delete(self):
+        """Closes and removes the journal, such as once every row has succeeded and there is
+        nothing left to resume."""
+        self.close()
+        os.remove(self.path)
+
+    def _write_line(self, line):
+        self._file.write("{}\n".format(line))
+        self._file.flush()
+
+    def _load(self, command):
+        try:
+            with open(self.path, encoding="utf-8") as journal:
+                header = next(journal, "").rstrip("\n")
+                for line in journal:
+                    self._load_line(line)
+        except FileNotFoundError:
+            raise Code42CLIError("No bulk job with ID '{}' exists.".format(self.job_id))
+        recorded_command = header[2:]
+        if command and recorded_command and recorded_command != command:
+            raise Code42CLIError(
+                "Bulk job '{}' was started by '{}' and can't be resumed by '{}'.".format(
+                    self.job_id, recorded_command, command
+                )
+            )
+
+    def _load_line(self, line):
+        parts = line.split()
+        # A partially written last line from an interrupted run is ignored.
+        if len(parts) == 2 and parts[0].isdigit() and parts[1] == _SUCCEEDED:
+            self._succeeded_rows.add(int(parts[0]))
+
+
+class UnrecordedJobJournal:
+    """Stands in for a :class:`BulkJobJournal` in bulk jobs that can't be resumed, such as
+    detection list syncs, whose rows are worked out from the server's current state each time
+    they run. It has a job ID, for naming the job's rejects files, but records nothing."""
+
+    is_resumable = False
+    total_succeeded = 0
+
+    def __init__(self):
+        self.job_id = uuid4().hex[:12]
+
+    def has_succeeded(self, row_number):
+        return False
+
+    def record(self, row_number, succeeded):
+        pass
+
+    def close(self):
+        pass
+
+    def delete(self):
+        pass
+
+
+REJECT_COLUMNS = ["error_class", "error_message", "http_status"]
+
+
+def get_rejects_path(job_id, kind=None):
+    """The path of the rejects file for the bulk job with the given ID. Jobs with more than one
+    rejects file name each with a `kind`, such as `add`."""
+    name = "{}_{}".format(job_id, kind) if kind else job_id
+    return os.path.join(get_bulk_jobs_dir(), "{}_rejects.csv".format(name))
+
+
+class BulkRejectsWriter:
+    """Writes the rows of a bulk job that failed to a file as they fail, so that a later run
+    can process only the failed rows by using the file as its input.
+
+    CSV rows are written with their original columns followed by :data:`REJECT_COLUMNS`
+    describing the error. Extra columns are ignored when a bulk command reads a file with a
+    header row, so the rejects file can be passed back to the same command. Flat file rows
+    are written one per line after a `#` comment line, since they have no columns to
+    describe the error with.
+
+    The file is only created once the first row is rejected.
+
+    Args:
+        path (str): The path of the file to write.
+        fieldnames (list): The columns of the input CSV file, or None to use the keys of the
+            first rejected row.
+    """
+
+    def __init__(self, path, fieldnames=None):
+        self.path = path
+        self.total_rejected = 0
+        self._fieldnames = list(fieldnames) if fieldnames else None
+        self._file = None
+        self._writer = None
+        self._lock = Lock()
+
+    def write(self, row, error):
+        """Writes a rejected row along with the error that caused it to fail. Safe to call from
+        multiple threads."""
+        with self._lock:
+            if isinstance(row, dict):
+                self._write_csv_row(row, error)
+            else:
+                self._write_flat_row(row)
+            self._file.flush()
+            self.total_rejected += 1
+
+    def close(self):
+        with self._lock:
+            if self._file:
+                self._file.close()
+
+    def describe_rejects(self):
+        """Returns lines describing the rejects file for the results of the job."""
+        if not self.total_rejected:
+            return []
+        return [
+            "Wrote {} failed rows and their errors to {}.".format(
+                self.total_rejected, self.path
+            )
+        ]
+
+    def _write_csv_row(self, row, error):
+        if not self._writer:
+            fieldnames = (self._fieldnames or list(row)) + REJECT_COLUMNS
+            self._file = open(self.path, "w", newline="", encoding="utf-8")
+            self._writer = csv.DictWriter(
+                self._file, fieldnames=fieldnames, extrasaction="ignore"
+            )
+            self._writer.writeheader()
+        row = dict(row)
+        row.update(_describe_error(error))
+        self._writer.writerow(row)
+
+    def _write_flat_row(self, row):
+        if not self._file:
+            self._file = open(self.path, "w", encoding="utf-8")
+            self._file.write("# Rows that failed during bulk processing.\n")
+        self._file.write("{}\n".format(row.strip()))
+
+
+def _describe_error(error):
+    response = getattr(error, "response", None)
+    return {
+        "error_class": type(error).__name__,
+        "error_message": str(error),
+        "http_status": getattr(response, "status_code", None),
+    }
@@ -0,0 +1,118 @@
+from datetime import datetime
+
+import click
+
+from code42cli.errors import Code42CLIError
+
+
+def required(value):
+    """Validates that a column has a value."""
+    if not value:
+        return "A value is required."
+
+
+def date_format(date_format):
+    """Returns a validator for columns that hold a date in the given `strptime` format. Empty
+    values are valid."""
+
+    def validate(value):
+        if not value:
+            return
+        try:
+            datetime.strptime(value, date_format)
+        except ValueError:
+            return "Invalid date {}, valid date format {}.".format(value, date_format)
+
+    return validate
+
+
+def one_or_more_of(choices):
+    """Returns a validator for columns that hold whitespace-separated values, each of which must
+    be one of `choices`. Empty values are valid."""
+
+    def validate(value):
+        invalid_values = [item for item in (value or "").split() if item not in choices]
+        if invalid_values:
+            return "Invalid value {}, choose from {}.".format(
+                ", ".join(invalid_values), ", ".join(choices)
+            )
+
+    return validate
+
+
+def all_of(*validators):
+    """Returns a validator that applies each of `validators` in turn and returns the first
+    problem found."""
+
+    def validate(value):
+        for validator in validators:
+            error = validator(value)
+            if error:
+                return error
+
+    return validate
+
+
+def validate_row(row, validators):
+    """Yields a message for each of a CSV row's values that the validator for its column finds
+    a problem with.
+
+    Args:
+        row (dict): The row's values, by column name.
+        validators (dict): Maps column names to validators. See :func:`validate_rows`.
+    """
+    for column, validate in validators.items():
+        error = validate(row.get(column))
+        if error:
+            yield "{}: {}".format(column, error)
+
+
+def validate_rows(rows, validators=None):
+    """Checks every row of a bulk file without processing any, yielding a (line number, message)
+    tuple for each problem found.
+
+    CSV rows must have a value for each of the reader's headers, and each value is checked with
+    the validator for its column. Extra values at the end of a row are ignored, as they are when
+    the row is processed, so a rejects file passes. Flat file rows aren't checked, and blank
+    lines are skipped when processed.
+
+    Args:
+        rows (iterable): The rows of the file, such as a
+            :class:`code42cli.file_readers.CSVReader` or
+            :class:`code42cli.file_readers.FlatFileReader`.
+        validators (dict): Maps column names to functions that take a row's value for that
+            column and return a message describing what's wrong with it, or None if it's valid.
+            Defaults to the reader's `validators`.
+    """
+    if validators is None:
+        validators = getattr(rows, "validators", {})
+    headers = getattr(rows, "headers", None)
+    for row_number, row in enumerate(rows, start=1):
+        line_number = getattr(rows, "line_num", row_number)
+        if not isinstance(row, dict):
+            continue
+        if None in row.values():
+            yield line_number, "Column count doesn't match expected headers: {}".format(
+                headers
+            )
+            continue
+        for message in validate_row(row, validators):
+            yield line_number, message
+
+
+def run_validation(rows):
+    """Validates every row of a bulk file for `--dry-run`, printing each problem with its line
+    number. Raises a :class:`code42cli.errors.Code42CLIError` if any problems were found."""
+    total_problems = 0
+    for line_number, message in validate_rows(rows):
+        total_problems += 1
+        click.echo("Line {}: {}".format(line_number, message))
+    if total_problems:
+        raise Code42CLIError(
+            "Found {} problems in {}.".format(total_problems, _get_file_name(rows))
+        )
+    click.echo("No problems found in {}.".format(_get_file_name(rows)))
+
+
+def _get_file_name(rows):
+    return getattr(rows, "name", None) or "the file"
@@ -0,0 +1,125 @@
+from collections import OrderedDict
+from functools import wraps
+from threading import Event
+from threading import Lock
+
+from py42.exceptions import Py42ForbiddenError
+from py42.exceptions import Py42NotFoundError
+
+DEFAULT_MAXSIZE = 1024
+DEFAULT_NEGATIVE_ERRORS = (Py42ForbiddenError, Py42NotFoundError)
+
+
+class SingleFlightCache:
+    """A thread-safe, least-recently-used cache that loads each missing key only once, even when
+    many threads ask for it at the same time: the first thread loads the value while the others
+    wait for it and share its outcome.
+
+    Errors in `negative_errors`, such as an HTTP 404 or 403, are cached like values and raised
+    again on later lookups of the same key, since asking again would only fail again. Any other
+    error is raised to the threads waiting on that load and is not cached.
+
+    Args:
+        maxsize (int): The most keys to cache before evicting the least recently used.
+        negative_errors (tuple): The exception types to cache.
+    """
+
+    def __init__(
+        self, maxsize=DEFAULT_MAXSIZE, negative_errors=DEFAULT_NEGATIVE_ERRORS
+    ):
+        self._maxsize = maxsize
+        self._negative_errors = tuple(negative_errors)
+        self._entries = OrderedDict()
+        self._loads = {}
+        self._lock = Lock()
+
+    def get(self, key, load):
+        """Returns the cached value for `key`, calling `load()` to get it if it isn't cached.
+
+        Args:
+            key (hashable): The key of the value.
+            load (callable): Returns the value for `key`, or raises an error.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            else:
+                pending_load = self._loads.get(key)
+                is_loading = pending_load is not None
+                if not is_loading:
+                    pending_load = _Outcome()
+                    self._loads[key] = pending_load
+        if entry is not None:
+            return entry.resolve()
+        if is_loading:
+            pending_load.wait()
+            return pending_load.resolve()
+        return self._load(key, load, pending_load)
+
+    def clear(self):
+        """Removes every cached value."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _load(self, key, load, outcome):
+        try:
+            outcome.value = load()
+        except Exception as err:
+            outcome.error = err
+        with self._lock:
+            del self._loads[key]
+            if outcome.error is None or isinstance(
+                outcome.error, self._negative_errors
+            ):
+                self._entries[key] = outcome
+                if len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+        outcome.set_done()
+        if outcome.error is not None:
+            raise outcome.error
+        return outcome.value
+
+
+class _Outcome:
+    def __init__(self):
+        self.value = None
+        self.error = None
+        self._done = Event()
+
+    def wait(self):
+        self._done.wait()
+
+    def set_done(self):
+        self._done.set()
+
+    def resolve(self):
+        if self.error is not None:
+            raise self.error.with_traceback(None)
+        return self.value
+
+
+def single_flight_cache(
+    maxsize=DEFAULT_MAXSIZE, negative_errors=DEFAULT_NEGATIVE_ERRORS
+):
+    """Decorator that caches a function's results in a :class:`SingleFlightCache`, keyed by its
+    positional arguments. Use in place of `functools.lru_cache` for functions that make HTTP
+    requests from :class:`code42cli.worker.Worker` threads. The cache is available as
+    `func.cache` and can be emptied with `func.cache_clear()`.
+    """
+
+    def decorator(func):
+        cache = SingleFlightCache(maxsize=maxsize, negative_errors=negative_errors)
+
+        @wraps(func)
+        def wrapper(*args):
+            return cache.get(args, lambda: func(*args))
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
@@ -7,10 +7,14 @@ from py42.util import format_json
 
 from code42cli import PRODUCT_NAME
 from code42cli.bulk import generate_template_cmd_factory
+from code42cli.bulk import prefetch_user_ids
 from code42cli.bulk import run_bulk_process
+from code42cli.bulk_validation import required
+from code42cli.cache import single_flight_cache
 from code42cli.cmds.shared import get_user_id
 from code42cli.errors import Code42CLIError
 from code42cli.file_readers import read_csv_arg
+from code42cli.options import bulk_options
 from code42cli.options import format_option
 from code42cli.options import OrderedGroup
 from code42cli.options import sdk_options
@@ -108,6 +112,7 @@ def bulk(state):
 
 
 ALERT_RULES_CSV_HEADERS = ["rule_id", "username"]
+ALERT_RULES_CSV_VALIDATORS = {"rule_id": required, "username": required}
 
 alert_rules_generate_template = generate_template_cmd_factory(
     group_name="alert_rules",
@@ -121,16 +126,24 @@ bulk.add_command(alert_rules_generate_template)
         ",".join(ALERT_RULES_CSV_HEADERS)
     )
 )
-@read_csv_arg(headers=ALERT_RULES_CSV_HEADERS)
+@read_csv_arg(headers=ALERT_RULES_CSV_HEADERS, validators=ALERT_RULES_CSV_VALIDATORS)
+@bulk_options
 @sdk_options()
 def add(state, csv_rows):
     sdk = state.sdk
+    rule_ids = _get_all_rule_ids(sdk)
 
     def handle_row(rule_id, username):
-        _add_user(sdk, rule_id, username)
+        _check_rule_id(rule_ids, rule_id)
+        sdk.alerts.rules.add_user(rule_id, get_user_id(sdk, username))
 
+    prefetch_user_ids(sdk, csv_rows)
     run_bulk_process(
-        handle_row, csv_rows, progress_label="Adding users to alert-rules:"
+        handle_row,
+        csv_rows,
+        progress_label="Adding users to alert-rules:",
+        config=state.bulk_config,
+        retry_rows=True,
     )
 
 
@@ -139,16 +152,24 @@ def add(state, csv_rows):
         ",".join(ALERT_RULES_CSV_HEADERS)
     )
 )
-@read_csv_arg(headers=ALERT_RULES_CSV_HEADERS)
+@read_csv_arg(headers=ALERT_RULES_CSV_HEADERS, validators=ALERT_RULES_CSV_VALIDATORS)
+@bulk_options
 @sdk_options()
 def remove(state, csv_rows):
     sdk = state.sdk
+    rule_ids = _get_all_rule_ids(sdk)
 
     def handle_row(rule_id, username):
-        _remove_user(sdk, rule_id, username)
+        _check_rule_id(rule_ids, rule_id)
+        sdk.alerts.rules.remove_user(rule_id, get_user_id(sdk, username))
 
+    prefetch_user_ids(sdk, csv_rows)
     run_bulk_process(
-        handle_row, csv_rows, progress_label="Removing users from alert-rules:"
+        handle_row,
+        csv_rows,
+        progress_label="Removing users from alert-rules:",
+        config=state.bulk_config,
+        retry_rows=True,
     )
 
 
@@ -174,6 +195,22 @@ def _get_all_rules_metadata(sdk):
     return _handle_rules_results(selected_rules)
 
 
+def _get_all_rule_ids(sdk):
+    """Returns the IDs of every alert rule, so bulk rows can be checked against them without
+    looking up each row's rule."""
+    return {
+        rule["observerRuleId"]
+        for rules in sdk.alerts.rules.get_all()
+        for rule in rules["ruleMetadata"]
+    }
+
+
+def _check_rule_id(rule_ids, rule_id):
+    if rule_id not in rule_ids:
+        raise Code42CLIError("No alert rules with RuleId {} found.".format(rule_id))
+
+
+@single_flight_cache()
 def _get_rule_metadata(sdk, rule_id):
     rules = sdk.alerts.rules.get_by_observer_id(rule_id)["ruleMetadata"]
     return _handle_rules_results(rules, rule_id)
@@ -13,11 +13,13 @@ import code42cli.errors as errors
 import code42cli.options as opt
 from code42cli.cmds.search.cursor_store import AlertCursorStore
 from code42cli.cmds.search.extraction import handle_no_events
+from code42cli.cmds.search.schemas import ALERT_FIELDS
+from code42cli.cmds.search.schemas import get_columns
 from code42cli.logger import get_logger_for_server
-from code42cli.options import format_option
 from code42cli.options import server_options
 from code42cli.output_formats import JsonOutputFormat
 from code42cli.output_formats import OutputFormatter
+from code42cli.output_formats import SearchOutputFormat
 
 
 SEARCH_DEFAULT_HEADER = OrderedDict()
@@ -28,6 +30,8 @@ SEARCH_DEFAULT_HEADER["state"] = "Status"
 SEARCH_DEFAULT_HEADER["severity"] = "Severity"
 SEARCH_DEFAULT_HEADER["description"] = "Description"
 
+SEARCH_CSV_COLUMNS = get_columns(SEARCH_DEFAULT_HEADER, ALERT_FIELDS)
+
 
 search_options = searchopt.create_search_options("alerts")
 
@@ -129,6 +133,14 @@ description_option = click.option(
     help="Filter alerts by description. Does fuzzy search by default.",
 )
 
+search_format_option = click.option(
+    "-f",
+    "--format",
+    type=click.Choice(SearchOutputFormat(), case_sensitive=False),
+    help="The output format of the result. Defaults to table format.",
+    default=SearchOutputFormat.TABLE,
+)
+
 send_to_format_options = click.option(
     "-f",
     "--format",
@@ -174,16 +186,21 @@ def clear_checkpoint(state, checkpoint_name):
 def _call_extractor(
     cli_state, handlers, begin, end, or_query, advanced_query, **kwargs
 ):
-    extractor = _get_alert_extractor(cli_state.sdk, handlers)
-    extractor.use_or_query = or_query
-    if advanced_query:
-        extractor.extract_advanced(advanced_query)
-    else:
-        if begin or end:
-            cli_state.search_filters.append(
-                ext.create_time_range_filter(f.DateObserved, begin, end)
-            )
-        extractor.extract(*cli_state.search_filters)
+    if not advanced_query and (begin or end):
+        cli_state.search_filters.append(
+            ext.create_time_range_filter(f.DateObserved, begin, end)
+        )
+    sdk = cli_state.sdk
+
+    def extract(extraction_handlers):
+        extractor = _get_alert_extractor(sdk, extraction_handlers)
+        extractor.use_or_query = or_query
+        if advanced_query:
+            extractor.extract_advanced(advanced_query)
+        else:
+            extractor.extract(*cli_state.search_filters)
+
+    ext.extract_in_background(extract, handlers)
 
 
 @alerts.command()
@@ -199,7 +216,7 @@ def _call_extractor(
     is_flag=True,
     help="Display simple properties of the primary level of the nested response.",
 )
-@format_option
+@search_format_option
 def search(
     cli_state,
     format,
@@ -215,7 +232,9 @@ def search(
     output_header = ext.try_get_default_header(
         include_all, SEARCH_DEFAULT_HEADER, format
     )
-    formatter = OutputFormatter(format, output_header)
+    formatter = OutputFormatter(
+        format, output_header, SEARCH_CSV_COLUMNS, streaming=True
+    )
     cursor = _get_alert_cursor_store(cli_state.profile.name) if use_checkpoint else None
     handlers = ext.create_handlers(
         cli_state.sdk,
@@ -1,8 +1,16 @@
+from datetime import datetime
+
 import click
 from py42.exceptions import Py42NotFoundError
 
 from code42cli.bulk import generate_template_cmd_factory
+from code42cli.bulk import is_rewindable
+from code42cli.bulk import prefetch_user_ids
 from code42cli.bulk import run_bulk_process
+from code42cli.bulk_validation import date_format
+from code42cli.bulk_validation import required
+from code42cli.cmds.detectionlists import sync_detection_list
+from code42cli.cmds.detectionlists import SyncAction
 from code42cli.cmds.detectionlists import update_user
 from code42cli.cmds.detectionlists.options import cloud_alias_option
 from code42cli.cmds.detectionlists.options import notes_option
@@ -11,6 +19,7 @@ from code42cli.cmds.shared import get_user_id
 from code42cli.errors import Code42CLIError
 from code42cli.file_readers import read_csv_arg
 from code42cli.file_readers import read_flat_file_arg
+from code42cli.options import bulk_options
 from code42cli.options import OrderedGroup
 from code42cli.options import sdk_options
 
@@ -65,10 +74,18 @@ def bulk(state):
 
 
 DEPARTING_EMPLOYEE_CSV_HEADERS = ["username", "cloud_alias", "departure_date", "notes"]
+DEPARTING_EMPLOYEE_CSV_VALIDATORS = {
+    "username": required,
+    "departure_date": date_format(DATE_FORMAT),
+}
 
 departing_employee_generate_template = generate_template_cmd_factory(
     group_name="departing_employee",
-    commands_dict={"add": DEPARTING_EMPLOYEE_CSV_HEADERS, "remove": "username"},
+    commands_dict={
+        "add": DEPARTING_EMPLOYEE_CSV_HEADERS,
+        "remove": "username",
+        "sync": DEPARTING_EMPLOYEE_CSV_HEADERS,
+    },
 )
 bulk.add_command(departing_employee_generate_template)
 
@@ -78,33 +95,25 @@ bulk.add_command(departing_employee_generate_template)
     help="Bulk add users to the departing employees detection list using a CSV file with "
     "format: {}".format(",".join(DEPARTING_EMPLOYEE_CSV_HEADERS)),
 )
-@read_csv_arg(headers=DEPARTING_EMPLOYEE_CSV_HEADERS)
+@read_csv_arg(
+    headers=DEPARTING_EMPLOYEE_CSV_HEADERS, validators=DEPARTING_EMPLOYEE_CSV_VALIDATORS
+)
+@bulk_options
 @sdk_options()
-@click.pass_context
-def bulk_add(ctx, state, csv_rows):
+def bulk_add(state, csv_rows):
+    sdk = state.sdk
+    departure_dates = _validate_departure_dates(csv_rows)
+
     def handle_row(username, cloud_alias, departure_date, notes):
-        if departure_date:
-            try:
-                departure_date = click.DateTime(formats=[DATE_FORMAT]).convert(
-                    departure_date, None, None
-                )
-            except click.exceptions.BadParameter:
-                message = "Invalid date {}, valid date format {}".format(
-                    departure_date, DATE_FORMAT
-                )
-                raise Code42CLIError(message)
-        ctx.invoke(
-            add,
-            username=username,
-            cloud_alias=cloud_alias,
-            departure_date=departure_date,
-            notes=notes,
-        )
+        departure_date = _get_departure_date(departure_date, departure_dates)
+        _add_departing_employee(sdk, username, cloud_alias, departure_date, notes)
 
+    prefetch_user_ids(state.sdk, csv_rows)
     run_bulk_process(
         handle_row,
         csv_rows,
         progress_label="Adding users to departing employee detection list:",
+        config=state.bulk_config,
     )
 
 
@@ -114,6 +123,7 @@ def bulk_add(ctx, state, csv_rows):
     "file of usernames.",
 )
 @read_flat_file_arg
+@bulk_options
 @sdk_options()
 def bulk_remove(state, file_rows):
     sdk = state.sdk
@@ -121,13 +131,109 @@ def bulk_remove(state, file_rows):
     def handle_row(username):
         _remove_departing_employee(sdk, username)
 
+    prefetch_user_ids(sdk, file_rows)
     run_bulk_process(
         handle_row,
         file_rows,
         progress_label="Removing users from departing employee detection list:",
+        config=state.bulk_config,
+        retry_rows=True,
+    )
+
+
+@bulk.command(
+    name="sync",
+    help="Sync the departing employees detection list with a CSV file with format: {}. "
+    "Users in the file who aren't on the list are added, and users on the list who aren't in "
+    "the file are removed. Users on the list and in the file are left as they are.".format(
+        ",".join(DEPARTING_EMPLOYEE_CSV_HEADERS)
+    ),
+)
+@read_csv_arg(
+    headers=DEPARTING_EMPLOYEE_CSV_HEADERS, validators=DEPARTING_EMPLOYEE_CSV_VALIDATORS
+)
+@bulk_options
+@sdk_options()
+def bulk_sync(state, csv_rows):
+    sdk = state.sdk
+    departure_dates = _validate_departure_dates(csv_rows)
+
+    def handle_row(
+        action,
+        username,
+        cloud_alias=None,
+        departure_date=None,
+        notes=None,
+        user_id=None,
+    ):
+        if action == SyncAction.REMOVE:
+            sdk.detectionlists.departing_employee.remove(user_id)
+            return
+        departure_date = _get_departure_date(departure_date, departure_dates)
+        _add_departing_employee(sdk, username, cloud_alias, departure_date, notes)
+
+    sync_detection_list(
+        state,
+        sdk.detectionlists.departing_employee,
+        csv_rows,
+        DEPARTING_EMPLOYEE_CSV_HEADERS,
+        handle_row,
+        "departing employee",
     )
 
 
+def _validate_departure_dates(csv_rows):
+    """Checks the departure date of every row before any are processed, so that a file with
+    invalid dates fails before making any changes. Only the `departure_date` column is
+    checked; other problems with a row fail that row when it's processed.
+
+    Returns a dict mapping each departure date in the file to the date in `DATE_FORMAT`, such
+    as `2020-1-5` to `2020-01-05`, for :func:`_get_departure_date`. Rows that can only be read
+    once, such as from stdin, aren't checked here, and None is returned."""
+    if not is_rewindable(csv_rows):
+        return None
+    validate = date_format(DATE_FORMAT)
+    departure_dates = {}
+    invalid_dates = []
+    for row_number, row in enumerate(csv_rows, start=1):
+        departure_date = row.get("departure_date")
+        if not departure_date or departure_date in departure_dates:
+            continue
+        error = validate(departure_date)
+        if error:
+            line_number = getattr(csv_rows, "line_num", row_number)
+            invalid_dates.append(
+                "line {}: departure_date: {}".format(line_number, error)
+            )
+        else:
+            departure_dates[departure_date] = _parse_departure_date(departure_date)
+    if invalid_dates:
+        raise Code42CLIError(
+            "Invalid departure dates:\n  {}".format("\n  ".join(invalid_dates))
+        )
+    return departure_dates
+
+
+def _get_departure_date(departure_date, departure_dates):
+    """Returns a row's departure date in `DATE_FORMAT`, looking it up in the dates from
+    :func:`_validate_departure_dates`, or parsing it if the file's dates weren't checked."""
+    if departure_dates is None:
+        return _parse_departure_date(departure_date)
+    return departure_dates.get(departure_date)
+
+
+def _parse_departure_date(departure_date):
+    if not departure_date:
+        return None
+    try:
+        return datetime.strptime(departure_date, DATE_FORMAT).strftime(DATE_FORMAT)
+    except ValueError:
+        message = "Invalid date {}, valid date format {}".format(
+            departure_date, DATE_FORMAT
+        )
+        raise Code42CLIError(message)
+
+
 def _add_departing_employee(sdk, username, cloud_alias, departure_date, notes):
     user_id = get_user_id(sdk, username)
     sdk.detectionlists.departing_employee.add(user_id, departure_date)
@@ -1,8 +1,24 @@
+import click
+
+from code42cli.bulk import prefetch_user_ids
+from code42cli.bulk import run_bulk_process
+from code42cli.bulk_jobs import BulkRejectsWriter
+from code42cli.bulk_jobs import get_rejects_path
+from code42cli.bulk_jobs import UnrecordedJobJournal
 from code42cli.cmds.shared import get_user_id
+from code42cli.errors import Code42CLIError
+from code42cli.errors import UserDoesNotExistError
+
+
+class SyncAction:
+    ADD = "add"
+    REMOVE = "remove"
 
 
 def update_user(sdk, username, cloud_alias=None, risk_tag=None, notes=None):
-    """Updates a detection list user.
+    """Updates a detection list user. The user's detection list profile is fetched once and
+    compared with the given values, and only the values that differ are updated, so applying
+    the same values again makes no further changes.
 
     Args:
         sdk (py42.sdk.SDKClient): py42 sdk.
@@ -11,32 +27,189 @@ def update_user(sdk, username, cloud_alias=None, risk_tag=None, notes=None):
         risk_tag (iter[str or unicode]): A list of risk tags associated with user.
         notes (str or unicode): Notes about the user.
     """
+    risk_tag = handle_list_args(risk_tag)
+    if not cloud_alias and not risk_tag and not notes:
+        return
     user_id = get_user_id(sdk, username)
-    _update_cloud_alias(sdk, user_id, cloud_alias)
-    _update_risk_tags(sdk, username, risk_tag)
-    _update_notes(sdk, user_id, notes)
+    profile = sdk.detectionlists.get_user_by_id(user_id)
+    _update_cloud_alias(sdk, user_id, profile, cloud_alias)
+    _update_risk_tags(sdk, user_id, profile, risk_tag)
+    _update_notes(sdk, user_id, profile, notes)
 
 
-def _update_cloud_alias(sdk, user_id, cloud_alias):
+def _update_cloud_alias(sdk, user_id, profile, cloud_alias):
     if cloud_alias:
-        profile = sdk.detectionlists.get_user_by_id(user_id)
         cloud_aliases = profile.data.get("cloudUsernames") or []
         for alias in cloud_aliases:
-            if alias != profile["userName"]:
+            if alias != profile["userName"] and alias != cloud_alias:
                 sdk.detectionlists.remove_user_cloud_alias(user_id, alias)
-        sdk.detectionlists.add_user_cloud_alias(user_id, cloud_alias)
+        if cloud_alias not in cloud_aliases:
+            sdk.detectionlists.add_user_cloud_alias(user_id, cloud_alias)
 
 
-def _update_risk_tags(sdk, username, risk_tag):
+def _update_risk_tags(sdk, user_id, profile, risk_tag):
     if risk_tag:
-        add_risk_tags(sdk, username, risk_tag)
+        current_risk_tags = profile.data.get("riskFactors") or []
+        risk_tag = [tag for tag in risk_tag if tag not in current_risk_tags]
+        if risk_tag:
+            sdk.detectionlists.add_user_risk_tags(user_id, risk_tag)
 
 
-def _update_notes(sdk, user_id, notes):
-    if notes:
+def _update_notes(sdk, user_id, profile, notes):
+    if notes and notes != profile.data.get("notes"):
         sdk.detectionlists.update_user_notes(user_id, notes)
 
 
+def get_sync_rows(sdk, list_client, rows):
+    """Compares the users in a bulk sync file with the users currently on a detection list and
+    returns bulk rows for only the changes needed to make the list match the file. The list is
+    paged once and compared with the file by user UID.
+
+    Rows for users in the file but not on the list are the file's rows with an `action` of
+    :attr:`SyncAction.ADD`. Rows for users on the list but not in the file have an `action` of
+    :attr:`SyncAction.REMOVE`, along with their `username` and `user_id`. Users in the file
+    that don't exist are returned as adds, so that they fail and are reported like in
+    `bulk add`.
+
+    Args:
+        sdk (py42.sdk.SDKClient): py42 sdk.
+        list_client: The py42 client of the detection list, such as
+            `sdk.detectionlists.departing_employee`.
+        rows (iterable): The rows of the sync file, each with a `username`.
+    """
+    current_users = {}
+    for page in list_client.get_all():
+        for item in page["items"]:
+            current_users[item["userId"]] = item["userName"]
+    sync_rows = []
+    listed_user_ids = set()
+    for row in rows:
+        user_id = _get_file_user_id(sdk, row["username"])
+        if user_id in current_users:
+            listed_user_ids.add(user_id)
+        else:
+            sync_rows.append(dict(row, action=SyncAction.ADD))
+    for user_id, username in current_users.items():
+        if user_id not in listed_user_ids:
+            sync_rows.append(
+                {"action": SyncAction.REMOVE, "username": username, "user_id": user_id}
+            )
+    return sync_rows
+
+
+def sync_detection_list(
+    state, list_client, csv_rows, csv_headers, handle_row, list_name
+):
+    """Makes a detection list match a bulk sync file by adding and removing only the users that
+    differ, using `handle_row` to process each change in a bulk process. See
+    :func:`get_sync_rows` for the rows `handle_row` is called with.
+
+    Syncs can't be resumed, since running one again makes only the changes that remain. The
+    changes that fail are written to files that `bulk add` and `bulk remove` can retry; see
+    :class:`SyncRejectsWriter`.
+
+    Args:
+        state (code42cli.options.CLIState): The CLI state.
+        list_client: The py42 client of the detection list.
+        csv_rows (iterable): The rows of the sync file.
+        csv_headers (list): The columns of the sync file, which match those of `bulk add`.
+        handle_row (callable): Adds or removes a user.
+        list_name (str): The name of the detection list, for messages.
+    """
+    if state.bulk_config.resume:
+        raise Code42CLIError(
+            "Bulk sync jobs can't be resumed. Run the sync again to make only the changes "
+            "that remain."
+        )
+    sdk = state.sdk
+    prefetch_user_ids(sdk, csv_rows)
+    sync_rows = get_sync_rows(sdk, list_client, csv_rows)
+    total_adds = sum(1 for row in sync_rows if row["action"] == SyncAction.ADD)
+    click.echo(
+        "Adding {} users to and removing {} users from the {} detection list.".format(
+            total_adds, len(sync_rows) - total_adds, list_name
+        )
+    )
+    if sync_rows:
+        journal = UnrecordedJobJournal()
+        run_bulk_process(
+            handle_row,
+            sync_rows,
+            progress_label="Syncing {} detection list:".format(list_name),
+            config=state.bulk_config,
+            journal=journal,
+            rejects=SyncRejectsWriter(journal.job_id, csv_headers, _get_bulk_group()),
+        )
+
+
+class SyncRejectsWriter:
+    """Writes the changes of a bulk sync that fail to files that can be retried with the
+    detection list's other bulk commands: failed adds as CSV rows with the columns of
+    `bulk add`, followed by the error columns, and failed removes as a flat file of usernames
+    for `bulk remove`.
+
+    Args:
+        job_id (str): The ID of the bulk job.
+        csv_headers (list): The columns of the `bulk add` file.
+        bulk_group (str): The command path of the detection list's `bulk` group, for messages.
+    """
+
+    def __init__(self, job_id, csv_headers, bulk_group="bulk"):
+        self._bulk_group = bulk_group
+        self._adds = BulkRejectsWriter(
+            get_rejects_path(job_id, SyncAction.ADD), fieldnames=csv_headers
+        )
+        self._removes = BulkRejectsWriter(get_rejects_path(job_id, SyncAction.REMOVE))
+
+    @property
+    def total_rejected(self):
+        return self._adds.total_rejected + self._removes.total_rejected
+
+    def write(self, row, error):
+        if row["action"] == SyncAction.REMOVE:
+            self._removes.write(row["username"], error)
+        else:
+            self._adds.write(row, error)
+
+    def close(self):
+        self._adds.close()
+        self._removes.close()
+
+    def describe_rejects(self):
+        lines = []
+        if self._adds.total_rejected:
+            lines.append(
+                "Wrote {} users that failed to be added, and their errors, to {}. To retry "
+                "them, run `{} add` on the file.".format(
+                    self._adds.total_rejected, self._adds.path, self._bulk_group
+                )
+            )
+        if self._removes.total_rejected:
+            lines.append(
+                "Wrote {} users that failed to be removed to {}. To retry them, run "
+                "`{} remove` on the file.".format(
+                    self._removes.total_rejected, self._removes.path, self._bulk_group
+                )
+            )
+        return lines
+
+
+def _get_bulk_group():
+    ctx = click.get_current_context(silent=True)
+    if ctx and ctx.parent:
+        return ctx.parent.command_path
+    return "bulk"
+
+
+def _get_file_user_id(sdk, username):
+    if not username:
+        return None
+    try:
+        return get_user_id(sdk, username)
+    except UserDoesNotExistError:
+        return None
+
+
 def add_risk_tags(sdk, username, risk_tag):
     risk_tag = handle_list_args(risk_tag)
     user_id = get_user_id(sdk, username)
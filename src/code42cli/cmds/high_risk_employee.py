@@ -3,10 +3,16 @@ from py42.clients.detectionlists import RiskTags
 from py42.exceptions import Py42NotFoundError
 
 from code42cli.bulk import generate_template_cmd_factory
+from code42cli.bulk import prefetch_user_ids
 from code42cli.bulk import run_bulk_process
+from code42cli.bulk_validation import all_of
+from code42cli.bulk_validation import one_or_more_of
+from code42cli.bulk_validation import required
 from code42cli.cmds.detectionlists import add_risk_tags as _add_risk_tags
 from code42cli.cmds.detectionlists import handle_list_args
 from code42cli.cmds.detectionlists import remove_risk_tags as _remove_risk_tags
+from code42cli.cmds.detectionlists import sync_detection_list
+from code42cli.cmds.detectionlists import SyncAction
 from code42cli.cmds.detectionlists import update_user
 from code42cli.cmds.detectionlists.options import cloud_alias_option
 from code42cli.cmds.detectionlists.options import notes_option
@@ -15,6 +21,7 @@ from code42cli.cmds.shared import get_user_id
 from code42cli.errors import Code42CLIError
 from code42cli.file_readers import read_csv_arg
 from code42cli.file_readers import read_flat_file_arg
+from code42cli.options import bulk_options
 from code42cli.options import OrderedGroup
 from code42cli.options import sdk_options
 
@@ -86,13 +93,22 @@ def bulk(state):
 
 
 HIGH_RISK_EMPLOYEE_CSV_HEADERS = ["username", "cloud_alias", "risk_tag", "notes"]
+HIGH_RISK_EMPLOYEE_CSV_VALIDATORS = {
+    "username": required,
+    "risk_tag": one_or_more_of(RiskTags.choices()),
+}
 RISK_TAG_CSV_HEADERS = ["username", "tag"]
+RISK_TAG_CSV_VALIDATORS = {
+    "username": required,
+    "tag": all_of(required, one_or_more_of(RiskTags.choices())),
+}
 
 high_risk_employee_generate_template = generate_template_cmd_factory(
     group_name="high_risk_employee",
     commands_dict={
         "add": HIGH_RISK_EMPLOYEE_CSV_HEADERS,
         "remove": "username",
+        "sync": HIGH_RISK_EMPLOYEE_CSV_HEADERS,
         "add-risk-tags": RISK_TAG_CSV_HEADERS,
         "remove-risk-tags": RISK_TAG_CSV_HEADERS,
     },
@@ -105,7 +121,10 @@ bulk.add_command(high_risk_employee_generate_template)
     help="Bulk add users to the high risk employees detection list using a CSV file with "
     "format: {}".format(",".join(HIGH_RISK_EMPLOYEE_CSV_HEADERS)),
 )
-@read_csv_arg(headers=HIGH_RISK_EMPLOYEE_CSV_HEADERS)
+@read_csv_arg(
+    headers=HIGH_RISK_EMPLOYEE_CSV_HEADERS, validators=HIGH_RISK_EMPLOYEE_CSV_VALIDATORS
+)
+@bulk_options
 @sdk_options()
 def bulk_add(state, csv_rows):
     sdk = state.sdk
@@ -113,10 +132,12 @@ def bulk_add(state, csv_rows):
     def handle_row(username, cloud_alias, risk_tag, notes):
         _add_high_risk_employee(sdk, username, cloud_alias, risk_tag, notes)
 
+    prefetch_user_ids(sdk, csv_rows)
     run_bulk_process(
         handle_row,
         csv_rows,
         progress_label="Adding users to high risk employee detection list:",
+        config=state.bulk_config,
     )
 
 
@@ -126,6 +147,7 @@ def bulk_add(state, csv_rows):
     "file of usernames.",
 )
 @read_flat_file_arg
+@bulk_options
 @sdk_options()
 def bulk_remove(state, file_rows):
     sdk = state.sdk
@@ -133,10 +155,47 @@ def bulk_remove(state, file_rows):
     def handle_row(username):
         _remove_high_risk_employee(sdk, username)
 
+    prefetch_user_ids(sdk, file_rows)
     run_bulk_process(
         handle_row,
         file_rows,
         progress_label="Removing users from high risk employee detection list:",
+        config=state.bulk_config,
+        retry_rows=True,
+    )
+
+
+@bulk.command(
+    name="sync",
+    help="Sync the high risk employees detection list with a CSV file with format: {}. "
+    "Users in the file who aren't on the list are added, and users on the list who aren't in "
+    "the file are removed. Users on the list and in the file are left as they are.".format(
+        ",".join(HIGH_RISK_EMPLOYEE_CSV_HEADERS)
+    ),
+)
+@read_csv_arg(
+    headers=HIGH_RISK_EMPLOYEE_CSV_HEADERS, validators=HIGH_RISK_EMPLOYEE_CSV_VALIDATORS
+)
+@bulk_options
+@sdk_options()
+def bulk_sync(state, csv_rows):
+    sdk = state.sdk
+
+    def handle_row(
+        action, username, cloud_alias=None, risk_tag=None, notes=None, user_id=None
+    ):
+        if action == SyncAction.REMOVE:
+            sdk.detectionlists.high_risk_employee.remove(user_id)
+            return
+        _add_high_risk_employee(sdk, username, cloud_alias, risk_tag, notes)
+
+    sync_detection_list(
+        state,
+        sdk.detectionlists.high_risk_employee,
+        csv_rows,
+        HIGH_RISK_EMPLOYEE_CSV_HEADERS,
+        handle_row,
+        "high risk employee",
     )
 
 
@@ -146,16 +205,23 @@ def bulk_remove(state, file_rows):
         ",".join(RISK_TAG_CSV_HEADERS)
     ),
 )
-@read_csv_arg(headers=RISK_TAG_CSV_HEADERS)
+@read_csv_arg(headers=RISK_TAG_CSV_HEADERS, validators=RISK_TAG_CSV_VALIDATORS)
+@bulk_options
 @sdk_options()
 def bulk_add_risk_tags(state, csv_rows):
     sdk = state.sdk
 
-    def handle_row(username, tag):
-        _add_risk_tags(sdk, username, tag)
+    def handle_rows(username, rows):
+        _add_risk_tags(sdk, username, _get_risk_tags_from_rows(rows))
 
+    prefetch_user_ids(sdk, csv_rows)
     run_bulk_process(
-        handle_row, csv_rows, progress_label="Adding risk tags to users:",
+        handle_rows,
+        csv_rows,
+        progress_label="Adding risk tags to users:",
+        config=state.bulk_config,
+        group_by="username",
+        retry_rows=True,
     )
 
 
@@ -165,19 +231,37 @@ def bulk_add_risk_tags(state, csv_rows):
         ",".join(RISK_TAG_CSV_HEADERS)
     ),
 )
-@read_csv_arg(headers=RISK_TAG_CSV_HEADERS)
+@read_csv_arg(headers=RISK_TAG_CSV_HEADERS, validators=RISK_TAG_CSV_VALIDATORS)
+@bulk_options
 @sdk_options()
 def bulk_remove_risk_tags(state, csv_rows):
     sdk = state.sdk
 
-    def handle_row(username, tag):
-        _remove_risk_tags(sdk, username, tag)
+    def handle_rows(username, rows):
+        _remove_risk_tags(sdk, username, _get_risk_tags_from_rows(rows))
 
+    prefetch_user_ids(sdk, csv_rows)
     run_bulk_process(
-        handle_row, csv_rows, progress_label="Removing risk tags from users:",
+        handle_rows,
+        csv_rows,
+        progress_label="Removing risk tags from users:",
+        config=state.bulk_config,
+        group_by="username",
+        retry_rows=True,
     )
 
 
+def _get_risk_tags_from_rows(rows):
+    """Combines the risk tags of bulk rows for the same user, so they can be added or removed
+    with one request."""
+    risk_tags = []
+    for row in rows:
+        for risk_tag in handle_list_args(row["tag"]) or []:
+            if risk_tag not in risk_tags:
+                risk_tags.append(risk_tag)
+    return risk_tags
+
+
 def _add_high_risk_employee(sdk, username, cloud_alias, risk_tag, notes):
     risk_tag = handle_list_args(risk_tag)
     user_id = get_user_id(sdk, username)
@@ -1,16 +1,20 @@
 import json
 from collections import OrderedDict
-from functools import lru_cache
 from pprint import pformat
 
 import click
 from click import echo
 
 from code42cli.bulk import generate_template_cmd_factory
+from code42cli.bulk import prefetch_user_ids
 from code42cli.bulk import run_bulk_process
+from code42cli.bulk_validation import required
+from code42cli.cache import single_flight_cache
+from code42cli.cache import SingleFlightCache
 from code42cli.cmds.shared import get_user_id
 from code42cli.errors import UserNotInLegalHoldError
 from code42cli.file_readers import read_csv_arg
+from code42cli.options import bulk_options
 from code42cli.options import format_option
 from code42cli.options import OrderedGroup
 from code42cli.options import sdk_options
@@ -132,6 +136,7 @@ def bulk(state):
 
 
 LEGAL_HOLD_CSV_HEADERS = ["matter_id", "username"]
+LEGAL_HOLD_CSV_VALIDATORS = {"matter_id": required, "username": required}
 
 
 legal_hold_generate_template = generate_template_cmd_factory(
@@ -147,7 +152,8 @@ bulk.add_command(legal_hold_generate_template)
         ",".join(LEGAL_HOLD_CSV_HEADERS)
     ),
 )
-@read_csv_arg(headers=LEGAL_HOLD_CSV_HEADERS)
+@read_csv_arg(headers=LEGAL_HOLD_CSV_HEADERS, validators=LEGAL_HOLD_CSV_VALIDATORS)
+@bulk_options
 @sdk_options()
 def bulk_add(state, csv_rows):
     sdk = state.sdk
@@ -155,7 +161,14 @@ def bulk_add(state, csv_rows):
     def handle_row(matter_id, username):
         _add_user_to_legal_hold(sdk, matter_id, username)
 
-    run_bulk_process(handle_row, csv_rows, progress_label="Adding users to legal hold:")
+    prefetch_user_ids(sdk, csv_rows)
+    run_bulk_process(
+        handle_row,
+        csv_rows,
+        progress_label="Adding users to legal hold:",
+        config=state.bulk_config,
+        retry_rows=True,
+    )
 
 
 @bulk.command(
@@ -163,16 +176,23 @@ def bulk_add(state, csv_rows):
         ",".join(LEGAL_HOLD_CSV_HEADERS)
     )
 )
-@read_csv_arg(headers=LEGAL_HOLD_CSV_HEADERS)
+@read_csv_arg(headers=LEGAL_HOLD_CSV_HEADERS, validators=LEGAL_HOLD_CSV_VALIDATORS)
+@bulk_options
 @sdk_options()
 def remove(state, csv_rows):
     sdk = state.sdk
+    memberships = _LegalHoldMembershipIndex(sdk)
 
     def handle_row(matter_id, username):
-        _remove_user_from_legal_hold(sdk, matter_id, username)
+        _remove_user_from_legal_hold(sdk, matter_id, username, memberships=memberships)
 
+    prefetch_user_ids(sdk, csv_rows)
     run_bulk_process(
-        handle_row, csv_rows, progress_label="Removing users from legal hold:"
+        handle_row,
+        csv_rows,
+        progress_label="Removing users from legal hold:",
+        config=state.bulk_config,
+        retry_rows=True,
     )
 
 
@@ -182,10 +202,11 @@ def _add_user_to_legal_hold(sdk, matter_id, username):
     sdk.legalhold.add_to_matter(user_id, matter_id)
 
 
-def _remove_user_from_legal_hold(sdk, matter_id, username):
+def _remove_user_from_legal_hold(sdk, matter_id, username, memberships=None):
     _check_matter_is_accessible(sdk, matter_id)
+    memberships = memberships or _LegalHoldMembershipIndex(sdk)
     membership_id = _get_legal_hold_membership_id_for_user_and_matter(
-        sdk, username, matter_id
+        sdk, username, matter_id, memberships
     )
     sdk.legalhold.remove_from_matter(membership_id)
 
@@ -196,13 +217,43 @@ def _get_and_print_preservation_policy(sdk, policy_uid):
     echo(pformat(json.loads(preservation_policy.text)))
 
 
-def _get_legal_hold_membership_id_for_user_and_matter(sdk, username, matter_id):
+def _get_legal_hold_membership_id_for_user_and_matter(
+    sdk, username, matter_id, memberships
+):
     user_id = get_user_id(sdk, username)
-    memberships = _get_legal_hold_memberships_for_matter(sdk, matter_id, active=True)
-    for member in memberships:
-        if member["user"]["userUid"] == user_id:
-            return member["legalHoldMembershipUid"]
-    raise UserNotInLegalHoldError(username, matter_id)
+    membership_id = memberships.get_membership_id(matter_id, user_id)
+    if membership_id is None:
+        raise UserNotInLegalHoldError(username, matter_id)
+    return membership_id
+
+
+class _LegalHoldMembershipIndex:
+    """Maps the user UIDs of each matter's active custodians to their legal hold membership
+    UIDs. A matter's memberships are fetched the first time a custodian of that matter is looked
+    up and reused for every later lookup, so bulk removals page through each matter's custodians
+    only once. Safe to share across threads; concurrent lookups for a matter that isn't loaded
+    yet wait for a single fetch."""
+
+    def __init__(self, sdk):
+        self._sdk = sdk
+        self._matters = SingleFlightCache()
+
+    def get_membership_id(self, matter_id, user_id):
+        """Returns the membership UID of the user in the matter, or None if the user is not
+        an active custodian of the matter."""
+        memberships = self._matters.get(
+            matter_id, lambda: self._get_matter_memberships(matter_id)
+        )
+        return memberships.get(user_id)
+
+    def _get_matter_memberships(self, matter_id):
+        memberships = _get_legal_hold_memberships_for_matter(
+            self._sdk, matter_id, active=True
+        )
+        return {
+            member["user"]["userUid"]: member["legalHoldMembershipUid"]
+            for member in memberships
+        }
 
 
 def _get_legal_hold_memberships_for_matter(sdk, matter_id, active=True):
@@ -238,6 +289,6 @@ def _print_matter_members(username_list, member_type="active"):
         echo("No {} matter members.\n".format(member_type))
 
 
-@lru_cache(maxsize=None)
+@single_flight_cache()
 def _check_matter_is_accessible(sdk, matter_id):
     return sdk.legalhold.get_matter_by_uid(matter_id)
@@ -46,6 +46,21 @@ disable_ssl_option = click.option(
     "This is not recommended, except for specific scenarios like testing.",
 )
 
+rate_limit_option = click.option(
+    "--rate-limit",
+    type=click.FloatRange(min=0),
+    help="The most API requests per second to make with this profile, counting every HTTP "
+    "request made by all threads of a command, such as the requests for each row of a bulk "
+    "command and for each page of a search. Use 0 to remove the limit. Unlimited by default.",
+)
+
+rate_limit_burst_option = click.option(
+    "--rate-limit-burst",
+    type=click.IntRange(min=1),
+    help="The most API requests to make at once before --rate-limit applies. Defaults to one "
+    "second's worth of requests.",
+)
+
 
 @profile.command()
 @profile_name_arg
@@ -56,6 +71,10 @@ def show(profile_name):
     echo("\t* username = {}".format(c42profile.username))
     echo("\t* authority url = {}".format(c42profile.authority_url))
     echo("\t* ignore-ssl-errors = {}".format(c42profile.ignore_ssl_errors))
+    if c42profile.rate_limit:
+        echo("\t* rate-limit = {} requests per second".format(c42profile.rate_limit))
+    if c42profile.rate_limit_burst:
+        echo("\t* rate-limit-burst = {}".format(c42profile.rate_limit_burst))
     if cliprofile.get_stored_password(c42profile.name) is not None:
         echo("\t* A password is set.")
     echo("")
@@ -68,9 +87,20 @@ def show(profile_name):
 @username_option
 @password_option
 @disable_ssl_option
-def create(name, server, username, password, disable_ssl_errors):
+@rate_limit_option
+@rate_limit_burst_option
+def create(
+    name,
+    server,
+    username,
+    password,
+    disable_ssl_errors,
+    rate_limit=None,
+    rate_limit_burst=None,
+):
     """Create profile settings. The first profile created will be the default."""
     cliprofile.create_profile(name, server, username, disable_ssl_errors)
+    _update_rate_limit(name, rate_limit, rate_limit_burst)
     if password:
         _set_pw(name, password)
     else:
@@ -84,10 +114,21 @@ def create(name, server, username, password, disable_ssl_errors):
 @username_option
 @password_option
 @disable_ssl_option
-def update(name, server, username, password, disable_ssl_errors):
+@rate_limit_option
+@rate_limit_burst_option
+def update(
+    name,
+    server,
+    username,
+    password,
+    disable_ssl_errors,
+    rate_limit=None,
+    rate_limit_burst=None,
+):
     """Update an existing profile."""
     c42profile = cliprofile.get_profile(name)
     cliprofile.update_profile(c42profile.name, server, username, disable_ssl_errors)
+    _update_rate_limit(c42profile.name, rate_limit, rate_limit_burst)
     if password:
         _set_pw(name, password)
     else:
@@ -157,6 +198,11 @@ def delete_all():
         echo("\nNo profiles exist. Nothing to delete.")
 
 
+def _update_rate_limit(profile_name, rate_limit, rate_limit_burst):
+    if rate_limit is not None or rate_limit_burst is not None:
+        cliprofile.update_rate_limit(profile_name, rate_limit, rate_limit_burst)
+
+
 def _prompt_for_allow_password_set(profile_name):
     if does_user_agree("Would you like to set a password? (y/n): "):
         password = getpass()
@@ -1,13 +1,24 @@
-from code42cli.output_formats import OutputFormat
+from code42cli.output_formats import SearchOutputFormat
 
 IS_CHECKPOINT_KEY = "use_checkpoint"
 
 
-class FileEventsOutputFormat(OutputFormat):
+class FileEventsOutputFormat(SearchOutputFormat):
     CEF = "CEF"
+    PARQUET = "PARQUET"
 
     def __iter__(self):
-        return iter([self.TABLE, self.CSV, self.JSON, self.RAW, self.CEF])
+        return iter(
+            [
+                self.TABLE,
+                self.CSV,
+                self.JSON,
+                self.RAW,
+                self.NDJSON,
+                self.CEF,
+                self.PARQUET,
+            ]
+        )
 
 
 class ServerProtocol:
@@ -1,4 +1,7 @@
 import json
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
 
 import click
 from c42eventextractor import ExtractionHandlers
@@ -14,6 +17,8 @@ from code42cli.util import warn_interrupt
 logger = get_main_cli_logger()
 
 _ALERT_DETAIL_BATCH_SIZE = 100
+_MAX_ALERT_DETAIL_WORKERS = 5
+_MAX_BUFFERED_PAGES = 2
 INTERRUPT_WARNING = (
     "Attempting to cancel cleanly to keep checkpoint data accurate. One moment..."
 )
@@ -31,26 +36,103 @@ def try_get_default_header(include_all, default_header, output_format):
 
 
 def _get_alert_details(sdk, alert_summary_list):
+    """Fetches the details of a page of alerts in batches of `_ALERT_DETAIL_BATCH_SIZE`, with up
+    to `_MAX_ALERT_DETAIL_WORKERS` batches fetched at once."""
     alert_ids = [alert["id"] for alert in alert_summary_list]
     batches = [
         alert_ids[i : i + _ALERT_DETAIL_BATCH_SIZE]
         for i in range(0, len(alert_ids), _ALERT_DETAIL_BATCH_SIZE)
     ]
-    results = []
-    for batch in batches:
-        r = sdk.alerts.get_details(batch)
-        results.extend(r["alerts"])
+    if not batches:
+        return []
+    thread_count = min(len(batches), _MAX_ALERT_DETAIL_WORKERS)
+    with ThreadPoolExecutor(max_workers=thread_count) as pool:
+        # `map` yields each batch's details in the order of the batches.
+        responses = pool.map(lambda batch: _get_alert_detail_batch(sdk, batch), batches)
+        results = [alert for r in responses for alert in r["alerts"]]
     results = sorted(results, key=lambda x: x["createdAt"], reverse=True)
     return results
 
 
+def _get_alert_detail_batch(sdk, alert_ids):
+    return sdk.alerts.get_details(alert_ids)
+
+
+class _PipelineHandlers(ExtractionHandlers):
+    """Extraction handlers that pass what an extractor running on a background thread hands
+    them to a queue, to be handled in order by :func:`extract_in_background`."""
+
+    RESPONSE = "response"
+    ERROR = "error"
+    CURSOR = "cursor"
+
+    def __init__(self, items, cursor_position):
+        self._items = items
+        # The extractor builds the query for its next page from the cursor it recorded for the
+        # previous one, so the latest cursor is kept here even before it has been handled.
+        self._cursor_position = cursor_position
+
+    def handle_response(self, response):
+        self._items.put((self.RESPONSE, response))
+
+    def handle_error(self, exception):
+        self._items.put((self.ERROR, exception))
+
+    def record_cursor_position(self, cursor):
+        self._cursor_position = cursor
+        self._items.put((self.CURSOR, cursor))
+
+
+def extract_in_background(extract, handlers, max_buffered_pages=_MAX_BUFFERED_PAGES):
+    """Runs an extraction on a background thread so that the next page of results is fetched
+    while the current one is handled.
+
+    `extract` is called on the background thread with handlers that buffer each page, and the
+    pages are passed to `handlers.handle_response` on the calling thread in the order they were
+    fetched. At most `max_buffered_pages` pages are fetched ahead of the one being handled. Each
+    page's cursor is recorded with `handlers.record_cursor_position` only after the page has
+    been handled, so checkpoints never get ahead of the output.
+
+    Args:
+        extract (callable): Takes the handlers to create an extractor with and runs it.
+        handlers (c42eventextractor.ExtractionHandlers): The handlers to handle the results with.
+        max_buffered_pages (int): The most pages to fetch ahead.
+    """
+    # Each page is followed by its cursor.
+    items = queue.Queue(maxsize=max_buffered_pages * 2)
+    pipeline_handlers = _PipelineHandlers(items, handlers.get_cursor_position())
+    done = object()
+
+    def run_extraction():
+        try:
+            extract(pipeline_handlers)
+        except Exception as err:
+            items.put((done, err))
+        else:
+            items.put((done, None))
+
+    Thread(target=run_extraction, daemon=True).start()
+    while True:
+        kind, value = items.get()
+        if kind == _PipelineHandlers.RESPONSE:
+            handlers.handle_response(value)
+        elif kind == _PipelineHandlers.CURSOR:
+            handlers.record_cursor_position(value)
+        elif kind == _PipelineHandlers.ERROR:
+            handlers.handle_error(value)
+        elif value is not None:
+            raise value
+        else:
+            return
+
+
 def _set_handlers(cursor_store, checkpoint_name):
     handlers = ExtractionHandlers()
     handlers.TOTAL_EVENTS = 0
 
     def handle_error(exception):
         if isinstance(exception, OSError):  # let click handle it
-            raise
+            raise exception
 
         errors.ERRORED = True
         if hasattr(exception, "response") and hasattr(exception.response, "text"):
@@ -97,7 +179,7 @@ def create_handlers(
         total_events = len(events)
         handlers.TOTAL_EVENTS += total_events
 
-        if total_events > 10 or force_pager:
+        if not formatter.is_streaming and (total_events > 10 or force_pager):
             click.echo_via_pager(formatter.get_formatted_output(events))
         else:
             formatter.echo_formatted_list(events)
@@ -0,0 +1,119 @@
+FILE_EVENT_FIELDS = (
+    "eventId",
+    "eventType",
+    "eventTimestamp",
+    "insertionTimestamp",
+    "fieldErrors",
+    "filePath",
+    "fileName",
+    "fileType",
+    "fileCategory",
+    "identifiedExtensionCategory",
+    "currentExtensionCategory",
+    "fileSize",
+    "fileOwner",
+    "md5Checksum",
+    "sha256Checksum",
+    "createTimestamp",
+    "modifyTimestamp",
+    "deviceUserName",
+    "osHostName",
+    "domainName",
+    "publicIpAddress",
+    "privateIpAddresses",
+    "deviceUid",
+    "userUid",
+    "actor",
+    "directoryId",
+    "source",
+    "url",
+    "shared",
+    "sharedWith",
+    "sharingTypeAdded",
+    "cloudDriveId",
+    "detectionSourceAlias",
+    "fileId",
+    "exposure",
+    "processOwner",
+    "processName",
+    "windowTitle",
+    "tabUrl",
+    "removableMediaVendor",
+    "removableMediaName",
+    "removableMediaSerialNumber",
+    "removableMediaCapacity",
+    "removableMediaBusType",
+    "removableMediaMediaName",
+    "removableMediaVolumeName",
+    "removableMediaPartitionId",
+    "syncDestination",
+    "syncDestinationUsername",
+    "emailDlpPolicyNames",
+    "emailSubject",
+    "emailSender",
+    "emailFrom",
+    "emailRecipients",
+    "outsideActiveHours",
+    "mimeTypeByBytes",
+    "mimeTypeByExtension",
+    "mimeTypeMismatch",
+    "printJobName",
+    "printerName",
+    "printedFilesBackupPath",
+    "remoteActivity",
+    "trusted",
+    "operatingSystemUser",
+    "destinationCategory",
+    "destinationName",
+)
+
+# The file event fields that aren't strings, for output formats with typed columns. Nested
+# fields that aren't lists are written as JSON strings.
+FILE_EVENT_INTEGER_FIELDS = ("fileSize", "removableMediaCapacity")
+FILE_EVENT_BOOLEAN_FIELDS = ("outsideActiveHours", "mimeTypeMismatch", "trusted")
+FILE_EVENT_LIST_FIELDS = (
+    "privateIpAddresses",
+    "directoryId",
+    "sharedWith",
+    "sharingTypeAdded",
+    "exposure",
+    "emailRecipients",
+    "emailDlpPolicyNames",
+)
+
+ALERT_FIELDS = (
+    "id",
+    "type$",
+    "tenantId",
+    "type",
+    "name",
+    "description",
+    "actor",
+    "actorId",
+    "target",
+    "severity",
+    "ruleId",
+    "ruleSource",
+    "createdAt",
+    "state",
+    "stateLastModifiedBy",
+    "stateLastModifiedAt",
+    "observations",
+    "notes",
+)
+
+
+def get_columns(default_header, fields):
+    """Returns the CSV columns for a search command: the keys of `default_header`, in order,
+    followed by the rest of `fields`, in order. Every search with the command writes these
+    columns in this order, whatever fields its results have.
+
+    Args:
+        default_header (dict): A search command's default header, such as
+            `code42cli.cmds.securitydata.SEARCH_DEFAULT_HEADER`.
+        fields (iterable): The known fields of the records the command outputs, such as
+            :data:`FILE_EVENT_FIELDS`.
+    """
+    columns = list(default_header)
+    columns.extend(field for field in fields if field not in default_header)
+    return columns
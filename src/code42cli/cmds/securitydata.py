@@ -14,6 +14,8 @@ import code42cli.cmds.search.options as searchopt
 import code42cli.errors as errors
 from code42cli.cmds.search.cursor_store import FileEventCursorStore
 from code42cli.cmds.search.extraction import handle_no_events
+from code42cli.cmds.search.schemas import FILE_EVENT_FIELDS
+from code42cli.cmds.search.schemas import get_columns
 from code42cli.cmds.securitydata_output_formats import FileEventsOutputFormatter
 from code42cli.logger import get_logger_for_server
 from code42cli.logger import get_main_cli_logger
@@ -43,6 +45,8 @@ SEARCH_DEFAULT_HEADER["fileOwner"] = "FileOwner"
 SEARCH_DEFAULT_HEADER["md5Checksum"] = "MD5Checksum"
 SEARCH_DEFAULT_HEADER["sha256Checksum"] = "SHA256Checksum"
 
+SEARCH_CSV_COLUMNS = get_columns(SEARCH_DEFAULT_HEADER, FILE_EVENT_FIELDS)
+
 
 file_events_format_option = click.option(
     "-f",
@@ -206,19 +210,24 @@ def clear_checkpoint(state, checkpoint_name):
 def _call_extractor(
     state, handlers, begin, end, or_query, advanced_query, saved_search, **kwargs
 ):
-    extractor = _get_file_event_extractor(state.sdk, handlers)
-    extractor.use_or_query = or_query
-    extractor.or_query_exempt_filters.append(f.ExposureType.exists())
-    if advanced_query:
-        extractor.extract_advanced(advanced_query)
-    elif saved_search:
-        extractor.extract(*saved_search._filter_group_list)
-    else:
-        if begin or end:
-            state.search_filters.append(
-                ext.create_time_range_filter(f.EventTimestamp, begin, end)
-            )
-        extractor.extract(*state.search_filters)
+    if not advanced_query and not saved_search and (begin or end):
+        state.search_filters.append(
+            ext.create_time_range_filter(f.EventTimestamp, begin, end)
+        )
+    sdk = state.sdk
+
+    def extract(extraction_handlers):
+        extractor = _get_file_event_extractor(sdk, extraction_handlers)
+        extractor.use_or_query = or_query
+        extractor.or_query_exempt_filters.append(f.ExposureType.exists())
+        if advanced_query:
+            extractor.extract_advanced(advanced_query)
+        elif saved_search:
+            extractor.extract(*saved_search._filter_group_list)
+        else:
+            extractor.extract(*state.search_filters)
+
+    ext.extract_in_background(extract, handlers)
 
 
 @security_data.command()
@@ -235,6 +244,12 @@ def _call_extractor(
     help="Display simple properties of the primary level of the nested response.",
 )
 @file_events_format_option
+@click.option(
+    "--output-file",
+    type=click.Path(dir_okay=False, writable=True),
+    help="The file to write the results to. Required for `--format PARQUET`, which can "
+    "only be written to a file.",
+)
 def search(
     state,
     format,
@@ -245,14 +260,22 @@ def search(
     saved_search,
     or_query,
     include_all,
+    output_file,
     **kwargs
 ):
     """Search for file events."""
     output_header = ext.try_get_default_header(
         include_all, SEARCH_DEFAULT_HEADER, format
     )
-
-    formatter = FileEventsOutputFormatter(format, output_header)
+    _check_output_file(format, output_file)
+
+    formatter = FileEventsOutputFormatter(
+        format,
+        output_header,
+        SEARCH_CSV_COLUMNS,
+        streaming=True,
+        output_file=output_file,
+    )
     cursor = (
         _get_file_event_cursor_store(state.profile.name) if use_checkpoint else None
     )
@@ -264,13 +287,33 @@ def search(
         formatter=formatter,
         force_pager=include_all,
     )
-    _call_extractor(
-        state, handlers, begin, end, or_query, advanced_query, saved_search, **kwargs
-    )
+    try:
+        _call_extractor(
+            state,
+            handlers,
+            begin,
+            end,
+            or_query,
+            advanced_query,
+            saved_search,
+            **kwargs
+        )
+    finally:
+        formatter.close()
 
     handle_no_events(not handlers.TOTAL_EVENTS and not errors.ERRORED)
 
 
+def _check_output_file(output_format, output_file):
+    is_parquet = output_format.upper() == enum.FileEventsOutputFormat.PARQUET
+    if is_parquet and not output_file:
+        raise errors.Code42CLIError("--output-file is required for --format PARQUET.")
+    if output_file and not is_parquet:
+        raise errors.Code42CLIError(
+            "--output-file is only allowed for --format PARQUET."
+        )
+
+
 @security_data.group(cls=OrderedGroup)
 @sdk_options()
 def saved_search(state):
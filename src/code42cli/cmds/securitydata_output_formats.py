@@ -1,3 +1,4 @@
+import json
 from datetime import datetime
 
 from c42eventextractor.logging.formatters import CEF_TEMPLATE
@@ -7,21 +8,151 @@ from c42eventextractor.maps import FILE_EVENT_TO_SIGNATURE_ID_MAP
 from c42eventextractor.maps import JSON_TO_CEF_MAP
 
 import code42cli.cmds.search.enums as enum
+from code42cli.cmds.search.schemas import FILE_EVENT_BOOLEAN_FIELDS
+from code42cli.cmds.search.schemas import FILE_EVENT_FIELDS
+from code42cli.cmds.search.schemas import FILE_EVENT_INTEGER_FIELDS
+from code42cli.cmds.search.schemas import FILE_EVENT_LIST_FIELDS
+from code42cli.errors import Code42CLIError
 from code42cli.output_formats import CEF_DEFAULT_PRODUCT_NAME
 from code42cli.output_formats import CEF_DEFAULT_SEVERITY_LEVEL
 from code42cli.output_formats import OutputFormatter
 
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
 
 class FileEventsOutputFormatter(OutputFormatter):
-    def __init__(self, output_format, header=None):
+    def __init__(
+        self,
+        output_format,
+        header=None,
+        columns=None,
+        streaming=False,
+        output_file=None,
+    ):
         output_format = (
             output_format.upper()
             if output_format
             else enum.FileEventsOutputFormat.TABLE
         )
-        super().__init__(output_format, header)
+        super().__init__(output_format, header, columns, streaming)
         if output_format == enum.FileEventsOutputFormat.CEF:
             self._format_func = to_cef
+        elif output_format == enum.FileEventsOutputFormat.PARQUET:
+            self._stream_formatter = ParquetFileWriter(output_file)
+
+
+class ParquetFileWriter:
+    """Writes file events to a Parquet file as they arrive, one row group for each call of
+    :meth:`format`, such as one for each page of search results. Requires `pyarrow`.
+
+    The file has a column for each of the known file event fields, typed from
+    :mod:`code42cli.cmds.search.schemas`. List fields are written as lists of strings, taking
+    the `cloudUsername` of the users in `sharedWith`, and other nested fields are written as
+    JSON strings. Fields that aren't known are left out.
+
+    Args:
+        path (str): The path of the file to write.
+    """
+
+    def __init__(self, path):
+        if pyarrow is None:
+            raise Code42CLIError(
+                "--format PARQUET requires pyarrow. Install it with "
+                "'pip install code42cli[parquet]'."
+            )
+        self._path = path
+        self._schema = _get_parquet_schema()
+        self._writer = None
+
+    def format(self, events):
+        """Writes `events` as a row group. Yields nothing, since the events go to the file."""
+        if events:
+            table = pyarrow.Table.from_pydict(
+                get_file_event_columns(events), schema=self._schema
+            )
+            self._get_writer().write_table(table)
+        return iter(())
+
+    def close(self):
+        """Finishes the file. The file only has the schema if no events were written."""
+        self._get_writer().close()
+
+    def _get_writer(self):
+        if self._writer is None:
+            self._writer = pyarrow.parquet.ParquetWriter(self._path, self._schema)
+        return self._writer
+
+
+def _get_parquet_schema():
+    def get_type(field):
+        if field in FILE_EVENT_INTEGER_FIELDS:
+            return pyarrow.int64()
+        if field in FILE_EVENT_BOOLEAN_FIELDS:
+            return pyarrow.bool_()
+        if field in FILE_EVENT_LIST_FIELDS:
+            return pyarrow.list_(pyarrow.string())
+        return pyarrow.string()
+
+    return pyarrow.schema([(field, get_type(field)) for field in FILE_EVENT_FIELDS])
+
+
+def get_file_event_columns(events):
+    """Converts file events to a dict that maps each known file event field to a list of its
+    values, one for each event, with nested fields flattened. See :class:`ParquetFileWriter`.
+    """
+    columns = {}
+    for field in FILE_EVENT_FIELDS:
+        if field in FILE_EVENT_INTEGER_FIELDS:
+            convert = _to_int
+        elif field in FILE_EVENT_BOOLEAN_FIELDS:
+            convert = _to_bool
+        elif field in FILE_EVENT_LIST_FIELDS:
+            convert = _to_string_list
+        else:
+            convert = _to_string
+        columns[field] = [convert(event.get(field)) for event in events]
+    return columns
+
+
+def _to_string(value):
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return str(value)
+
+
+def _to_string_list(value):
+    if value is None:
+        return None
+    if not isinstance(value, list):
+        value = [value]
+    return [_flatten_list_item(item) for item in value]
+
+
+def _flatten_list_item(item):
+    if isinstance(item, dict) and "cloudUsername" in item:
+        return item["cloudUsername"]
+    return _to_string(item)
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_bool(value):
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, str) and value.lower() in ("true", "false"):
+        return value.lower() == "true"
+    return None
 
 
 def to_cef(output):
@@ -1,13 +1,69 @@
-from functools import lru_cache
+from weakref import WeakKeyDictionary
 
+from code42cli.cache import DEFAULT_NEGATIVE_ERRORS
+from code42cli.cache import single_flight_cache
 from code42cli.errors import UserDoesNotExistError
 
+_user_id_caches = WeakKeyDictionary()
 
-@lru_cache(maxsize=None)
+
+def enable_user_id_cache(sdk, cache):
+    """Makes :func:`get_user_id` check `cache` before looking up users with `sdk`, and store the
+    user IDs it looks up in it.
+
+    Args:
+        sdk (py42.sdk.SDKClient): The py42 sdk.
+        cache (code42cli.user_cache.UserIdCache): The persistent user ID cache of the profile
+            `sdk` is authenticated with.
+    """
+    _user_id_caches[sdk] = cache
+
+
+def get_user_id_cache(sdk):
+    """Returns the user ID cache enabled for `sdk`, or None."""
+    return _user_id_caches.get(sdk)
+
+
+def cache_user_ids(sdk, users):
+    """Stores user IDs that were looked up in bulk so :func:`get_user_id` doesn't have to look
+    them up one at a time. They are stored in the persistent user ID cache if one is enabled for
+    `sdk`, otherwise only for the current invocation.
+
+    Args:
+        sdk (py42.sdk.SDKClient): The py42 sdk.
+        users (iterable): (username, user UID) pairs.
+    """
+    cache = get_user_id_cache(sdk)
+    if cache is None:
+        cache = _InMemoryUserIdCache()
+        enable_user_id_cache(sdk, cache)
+    cache.set_many(users)
+
+
+class _InMemoryUserIdCache:
+    def __init__(self):
+        self._user_ids = {}
+
+    def get(self, username):
+        return self._user_ids.get(username)
+
+    def set(self, username, user_uid):
+        self._user_ids[username] = user_uid
+
+    def set_many(self, users):
+        self._user_ids.update(users)
+
+
+@single_flight_cache(
+    maxsize=100000, negative_errors=DEFAULT_NEGATIVE_ERRORS + (UserDoesNotExistError,)
+)
 def get_user_id(sdk, username):
     """Returns the user's UID (referred to by `user_id` in detection lists).
     Raises `UserDoesNotExistError` if the user doesn't exist in the Code42 server.
 
+    If a persistent user ID cache is enabled for `sdk`, the user is only looked up when they
+    aren't in the cache.
+
     Args:
         sdk (py42.sdk.SDKClient): The py42 sdk.
         username (str or unicode): The username of the user to get an ID for.
@@ -15,7 +71,14 @@ def get_user_id(sdk, username):
     Returns:
          str: The user ID for the user with the given username.
     """
+    cache = get_user_id_cache(sdk)
+    user_id = cache.get(username) if cache else None
+    if user_id:
+        return user_id
     users = sdk.users.get_by_username(username)["users"]
     if not users:
         raise UserDoesNotExistError(username)
-    return users[0]["userUid"]
+    user_id = users[0]["userUid"]
+    if cache:
+        cache.set(username, user_id)
+    return user_id
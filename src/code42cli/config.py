@@ -19,6 +19,8 @@ class ConfigAccessor:
     AUTHORITY_KEY = "c42_authority_url"
     USERNAME_KEY = "c42_username"
     IGNORE_SSL_ERRORS_KEY = "ignore-ssl-errors"
+    RATE_LIMIT_KEY = "rate-limit"
+    RATE_LIMIT_BURST_KEY = "rate-limit-burst"
     DEFAULT_PROFILE = "default_profile"
     _INTERNAL_SECTION = "Internal"
 
@@ -75,6 +77,20 @@ class ConfigAccessor:
             self._set_ignore_ssl_errors(ignore_ssl_errors, profile)
         self._save()
 
+    def update_rate_limit(self, name, rate_limit=None, rate_limit_burst=None):
+        """Sets the most API requests per second, and the most requests at once, made with the
+        profile. A `rate_limit` of 0 removes the limit."""
+        profile = self.get_profile(name)
+        if rate_limit is not None:
+            if rate_limit:
+                profile[self.RATE_LIMIT_KEY] = str(rate_limit)
+            else:
+                profile.pop(self.RATE_LIMIT_KEY, None)
+                profile.pop(self.RATE_LIMIT_BURST_KEY, None)
+        if rate_limit_burst is not None:
+            profile[self.RATE_LIMIT_BURST_KEY] = str(rate_limit_burst)
+        self._save()
+
     def switch_default_profile(self, new_default_name):
         """Changes what is marked as the default profile in the internal section."""
         if self.get_profile(new_default_name) is None:
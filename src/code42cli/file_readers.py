@@ -1,48 +1,40 @@
 import csv
+import os
+import stat
 
 import click
 
 
-def read_csv_arg(headers):
+def read_csv_arg(headers, validators=None):
     """Helper for defining arguments that read from a csv file. Automatically converts
-    the file name provided on command line to a list of csv rows (passed to command
-    function as `csv_rows` param).
+    the file name provided on command line to a :class:`CSVReader` of csv rows (passed to
+    command function as `csv_rows` param).
+
+    `validators` maps column names to functions that check a row's value for that column, used
+    by `--dry-run` to validate a file without processing it. See
+    :mod:`code42cli.bulk_validation`.
     """
     return click.argument(
         "csv_rows",
         metavar="CSV_FILE",
         type=click.File("r"),
-        callback=lambda ctx, param, arg: read_csv(arg, headers=headers),
+        callback=lambda ctx, param, arg: read_csv(
+            arg, headers=headers, validators=validators
+        ),
     )
 
 
-def read_csv(file, headers=None):
+def read_csv(file, headers=None, validators=None):
     """Helper to read a csv file object into dict rows, automatically removing header row
     if it exists, and errors if column count doesn't match header list length.
     """
-    reader = csv.DictReader(file, fieldnames=headers)
-    first_row = next(reader)
-    if None in first_row or None in first_row.values():
-        raise click.BadParameter(
-            "Column count in {} doesn't match expected headers: {}".format(
-                file.name, headers
-            )
-        )
-    # skip first row if it's the header values
-    if tuple(first_row.keys()) == tuple(first_row.values()):
-        return list(reader)
-    else:
-        return [first_row, *list(reader)]
+    return CSVReader(file, headers=headers, validators=validators)
 
 
 def read_flat_file(file):
     """Helper to read rows of a flat file, automatically removing header comment row if
     it exists, and strips whitespace from each row automatically."""
-    first_row = next(file)
-    if first_row.startswith("#"):
-        return [row.strip() for row in file]
-    else:
-        return [first_row.strip(), *[row.strip() for row in file]]
+    return FlatFileReader(file)
 
 
 read_flat_file_arg = click.argument(
@@ -51,3 +43,158 @@ read_flat_file_arg = click.argument(
     metavar="FILE",
     callback=lambda ctx, param, arg: read_flat_file(arg),
 )
+
+
+class _FileLines:
+    """Iterates the lines of a text file while keeping count of how many bytes have been
+    consumed, so progress through the file can be estimated without knowing the row count."""
+
+    def __init__(self, file):
+        self._file = file
+        self._encoding = getattr(file, "encoding", None) or "utf-8"
+        self.bytes_read = 0
+        self.line_num = 0
+        self.total_bytes = _get_file_size(file)
+        self.is_rewindable = self.total_bytes is not None and _is_seekable(file)
+
+    def rewind(self):
+        self._file.seek(0)
+        self.bytes_read = 0
+        self.line_num = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = next(self._file)
+        self.bytes_read += len(line.encode(self._encoding, errors="replace"))
+        self.line_num += 1
+        return line
+
+
+class _FileReader:
+    def __init__(self, file):
+        self.name = getattr(file, "name", None)
+        self._lines = _FileLines(file)
+        self._iterated = False
+
+    @property
+    def is_rewindable(self):
+        """True if the rows can be iterated more than once, such as when reading a regular
+        file. Each iteration then reads the file again from the start. Files that can't seek,
+        such as stdin, can only be iterated once."""
+        return self._lines.is_rewindable
+
+    def _start_iteration(self):
+        """Returns False if the rows have already been iterated and the file can't be read
+        again."""
+        if not self._iterated:
+            self._iterated = True
+            return True
+        if not self.is_rewindable:
+            return False
+        self._rewind()
+        return True
+
+    def _rewind(self):
+        self._lines.rewind()
+
+    @property
+    def bytes_read(self):
+        """The number of bytes of the file that have been read so far."""
+        return self._lines.bytes_read
+
+    @property
+    def line_num(self):
+        """The line number in the file of the end of the row most recently read."""
+        return self._lines.line_num
+
+    @property
+    def total_bytes(self):
+        """The size of the file in bytes, or None if it can't be determined (e.g. stdin)."""
+        return self._lines.total_bytes
+
+
+class CSVReader(_FileReader):
+    """Lazily reads dict rows from a csv file. The first row is read and validated against
+    `headers` immediately so that malformed files fail before any rows are processed. The
+    remaining rows are read from the file only as they are iterated.
+
+    If the file is rewindable, each iteration reads the rows again from the start of the file.
+    """
+
+    def __init__(self, file, headers=None, validators=None):
+        super().__init__(file)
+        self.headers = headers
+        self.validators = validators or {}
+        self._first_row = self._read_first_row()
+
+    @property
+    def fieldnames(self):
+        return self._reader.fieldnames
+
+    def __iter__(self):
+        if not self._start_iteration():
+            return
+        first_row = self._first_row
+        self._first_row = None
+        if first_row is not None:
+            yield first_row
+        yield from self._reader
+
+    def _rewind(self):
+        super()._rewind()
+        self._first_row = self._read_first_row()
+
+    def _read_first_row(self):
+        headers = self.headers
+        self._reader = csv.DictReader(self._lines, fieldnames=headers)
+        first_row = next(self._reader, None)
+        # skip first row if it's the header values. Extra columns after the headers are
+        # allowed when there is a header row, such as the error columns of a rejects file.
+        if first_row is not None and _is_header_row(first_row):
+            first_row = None
+        elif first_row is not None and (
+            None in first_row or None in first_row.values()
+        ):
+            raise click.BadParameter(
+                "Column count in {} doesn't match expected headers: {}".format(
+                    self.name, headers
+                )
+            )
+        return first_row
+
+
+class FlatFileReader(_FileReader):
+    """Lazily reads whitespace-stripped rows from a file with a single item on each line,
+    skipping the first line if it's a `#` comment."""
+
+    def __iter__(self):
+        if not self._start_iteration():
+            return
+        first_row = next(self._lines, None)
+        if first_row is None:
+            return
+        if not first_row.startswith("#"):
+            yield first_row.strip()
+        for row in self._lines:
+            yield row.strip()
+
+
+def _is_header_row(row):
+    return all(key == value for key, value in row.items() if key is not None)
+
+
+def _is_seekable(file):
+    try:
+        return file.seekable()
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+def _get_file_size(file):
+    try:
+        file_stat = os.fstat(file.fileno())
+    except (AttributeError, OSError, ValueError):
+        return None
+    return file_stat.st_size if stat.S_ISREG(file_stat.st_mode) else None
@@ -0,0 +1,61 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+ORJSON = "orjson"
+UJSON = "ujson"
+STDLIB = "json"
+
+_stdlib_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _orjson_dumps_lines(records):
+    return (b"\n".join(map(orjson.dumps, records)) + b"\n").decode("utf-8")
+
+
+def _ujson_dumps(record):
+    return ujson.dumps(record, ensure_ascii=False, escape_forward_slashes=False)
+
+
+def _ujson_dumps_lines(records):
+    return "\n".join(map(_ujson_dumps, records)) + "\n"
+
+
+def _stdlib_dumps_lines(records):
+    return "\n".join(map(_stdlib_encoder.encode, records)) + "\n"
+
+
+_BACKENDS = {
+    ORJSON: (orjson, _orjson_dumps_lines),
+    UJSON: (ujson, _ujson_dumps_lines),
+    STDLIB: (json, _stdlib_dumps_lines),
+}
+
+
+def get_available_backends():
+    """Returns the names of the installed JSON backends, fastest first. The standard library's
+    `json` module is always available."""
+    return [name for name, (module, _) in _BACKENDS.items() if module is not None]
+
+
+def get_dumps_lines(backend=None):
+    """Returns a function that serializes a list of records to JSON Lines text: one compact JSON
+    object per line, each ending with a newline.
+
+    Args:
+        backend (str): The name of the JSON backend to use, one of :data:`ORJSON`,
+            :data:`UJSON`, or :data:`STDLIB`. Defaults to the fastest installed backend.
+    """
+    backend = backend or get_available_backends()[0]
+    module, dumps_lines = _BACKENDS[backend]
+    if module is None:
+        raise ValueError("The {} JSON backend isn't installed.".format(backend))
+    return dumps_lines
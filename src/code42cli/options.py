@@ -1,12 +1,24 @@
 from collections import OrderedDict
+from functools import wraps
 
 import click
 
+from code42cli.bulk import BulkConfig
+from code42cli.bulk import DEFAULT_MAX_ATTEMPTS
+from code42cli.bulk import DEFAULT_MAX_WORKERS
+from code42cli.bulk import DEFAULT_MIN_WORKERS
+from code42cli.bulk import DEFAULT_QUEUED_ROWS_PER_WORKER
+from code42cli.bulk_validation import run_validation
 from code42cli.cmds.search.enums import ServerProtocol
+from code42cli.cmds.shared import enable_user_id_cache
 from code42cli.errors import Code42CLIError
 from code42cli.output_formats import OutputFormat
 from code42cli.profile import get_profile
+from code42cli.rate_limit import create_rate_limiter
+from code42cli.rate_limit import set_rate_limiter
 from code42cli.sdk_client import create_sdk
+from code42cli.user_cache import DEFAULT_USER_ID_TTL
+from code42cli.user_cache import UserIdCache
 
 
 yes_option = click.option(
@@ -37,6 +49,8 @@ class CLIState:
         self._sdk = None
         self.search_filters = []
         self.assume_yes = False
+        self.bulk_config = BulkConfig()
+        self.refresh_user_cache = False
 
     @property
     def profile(self):
@@ -51,7 +65,14 @@ class CLIState:
     @property
     def sdk(self):
         if self._sdk is None:
+            set_rate_limiter(create_rate_limiter(self.profile))
             self._sdk = create_sdk(self.profile, self.debug)
+            user_cache = UserIdCache(
+                self.profile.name,
+                self.profile.authority_url,
+                refresh=self.refresh_user_cache,
+            )
+            enable_user_id_cache(self._sdk, user_cache)
         return self._sdk
 
     def set_assume_yes(self, param):
@@ -168,3 +189,110 @@ def server_options(f):
     f = hostname_arg(f)
     f = protocol_option(f)
     return f
+
+
+def set_bulk_config_value(ctx, param, value):
+    """Sets the value of an option decorated with @bulk_options on the global state object's
+    `bulk_config`, using the option's name as the attribute name."""
+    if value is not None:
+        setattr(ctx.ensure_object(CLIState).bulk_config, param.name, value)
+
+
+def set_refresh_user_cache(ctx, param, value):
+    """Sets refresh_user_cache to True on the global state object when --refresh-cache is
+    passed to commands decorated with @bulk_options."""
+    if value:
+        ctx.ensure_object(CLIState).refresh_user_cache = value
+
+
+def validate_when_dry_run(f):
+    """Decorator for `bulk` subcommands that, when `--dry-run` is passed, validates the rows of
+    the command's file argument instead of running the command, so that nothing is sent to the
+    server."""
+
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        state = click.get_current_context().ensure_object(CLIState)
+        if state.bulk_config.dry_run:
+            rows = kwargs.get("csv_rows", kwargs.get("file_rows"))
+            return run_validation(rows)
+        return f(*args, **kwargs)
+
+    return wrapper
+
+
+def bulk_options(f):
+    min_workers_option = click.option(
+        "--min-workers",
+        type=click.IntRange(min=1),
+        expose_value=False,
+        callback=set_bulk_config_value,
+        help="The fewest rows to process at once. The CLI scales back to this when the server "
+        "is throttling requests. Defaults to {}.".format(DEFAULT_MIN_WORKERS),
+    )
+    max_workers_option = click.option(
+        "--max-workers",
+        type=click.IntRange(min=1),
+        expose_value=False,
+        callback=set_bulk_config_value,
+        help="The most rows to process at once. The CLI scales up to this while server "
+        "response times stay flat. Defaults to {}.".format(DEFAULT_MAX_WORKERS),
+    )
+    max_attempts_option = click.option(
+        "--max-attempts",
+        type=click.IntRange(min=1),
+        expose_value=False,
+        callback=set_bulk_config_value,
+        help="The most times to try a row that fails because the server is unavailable or "
+        "throttling requests (HTTP 429 or 5xx). Retries wait with exponential backoff. Rows "
+        "that make several changes, such as adding a user to a list and then updating their "
+        "notes, are not retried. Defaults to {}.".format(DEFAULT_MAX_ATTEMPTS),
+    )
+    max_queue_size_option = click.option(
+        "--max-queue-size",
+        type=click.IntRange(min=1),
+        expose_value=False,
+        callback=set_bulk_config_value,
+        help="The most rows to read ahead of the rows being processed. Larger values keep "
+        "more rows in memory. Defaults to {} times --max-workers.".format(
+            DEFAULT_QUEUED_ROWS_PER_WORKER
+        ),
+    )
+    resume_option = click.option(
+        "--resume",
+        metavar="JOB_ID",
+        expose_value=False,
+        callback=set_bulk_config_value,
+        help="Resume the bulk job with the given ID, skipping rows that job already "
+        "processed successfully. The job ID is printed when a bulk command starts.",
+    )
+    refresh_cache_option = click.option(
+        "--refresh-cache",
+        is_flag=True,
+        expose_value=False,
+        callback=set_refresh_user_cache,
+        help="Discard the user IDs cached from previous commands run with this profile and "
+        "look up every user again. User IDs are otherwise cached for {} hours.".format(
+            DEFAULT_USER_ID_TTL // 3600
+        ),
+    )
+    dry_run_option = click.option(
+        "--dry-run",
+        "--validate-only",
+        "dry_run",
+        is_flag=True,
+        expose_value=False,
+        callback=set_bulk_config_value,
+        help="Check every row of the file and report problems, such as missing values, "
+        "invalid dates, or unknown risk tags, with their line numbers, without processing "
+        "any rows or connecting to the server.",
+    )
+    f = validate_when_dry_run(f)
+    f = min_workers_option(f)
+    f = max_workers_option(f)
+    f = max_attempts_option(f)
+    f = max_queue_size_option(f)
+    f = resume_option(f)
+    f = refresh_cache_option(f)
+    f = dry_run_option(f)
+    return f
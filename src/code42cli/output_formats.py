@@ -1,15 +1,23 @@
 import csv
 import io
 import json
+from collections import OrderedDict
 
 import click
 
+from code42cli.json_lines import get_dumps_lines
+from code42cli.util import _PADDING_SIZE
 from code42cli.util import find_format_width
 from code42cli.util import format_to_table
 
 
 CEF_DEFAULT_PRODUCT_NAME = "Advanced Exfiltration Detection"
 CEF_DEFAULT_SEVERITY_LEVEL = "5"
+_CSV_ROWS_PER_CHUNK = 1000
+_TABLE_SAMPLE_SIZE = 100
+_TABLE_MAX_COLUMN_WIDTH = 50
+_TRUNCATION_MARKER = "..."
+_NDJSON_RECORDS_PER_BATCH = 1000
 
 
 class JsonOutputFormat:
@@ -28,6 +36,13 @@ class OutputFormat(JsonOutputFormat):
         return iter([self.TABLE, self.CSV, self.JSON, self.RAW])
 
 
+class SearchOutputFormat(OutputFormat):
+    NDJSON = "NDJSON"
+
+    def __iter__(self):
+        return iter([self.TABLE, self.CSV, self.JSON, self.RAW, self.NDJSON])
+
+
 class SendToFileEventsOutputFormat(JsonOutputFormat):
     CEF = "CEF"
 
@@ -36,16 +51,22 @@ class SendToFileEventsOutputFormat(JsonOutputFormat):
 
 
 class OutputFormatter:
-    def __init__(self, output_format, header=None):
+    def __init__(self, output_format, header=None, columns=None, streaming=False):
         output_format = output_format.upper() if output_format else OutputFormat.TABLE
         self.output_format = output_format
         self._format_func = to_table
         self.header = header
+        # Formats pages of records as they arrive, keeping what it needs between pages.
+        self._stream_formatter = None
 
         if output_format == OutputFormat.CSV:
-            self._format_func = to_csv
+            self._stream_formatter = CSVStreamFormatter(header, columns=columns)
+        elif output_format == SearchOutputFormat.NDJSON:
+            self._stream_formatter = JsonLinesFormatter()
         elif output_format == OutputFormat.RAW:
             self._format_func = to_json
+        elif output_format == OutputFormat.TABLE and streaming:
+            self._stream_formatter = TableStreamFormatter(header)
         elif output_format == OutputFormat.TABLE:
             self._format_func = self._to_table
         elif output_format == OutputFormat.JSON:
@@ -58,7 +79,10 @@ class OutputFormatter:
         return to_table(output, self.header)
 
     def get_formatted_output(self, output):
-        if self._requires_list_output:
+        if self._stream_formatter:
+            # Yields the output in chunks so large pages aren't built into one string.
+            yield from self._stream_formatter.format(output)
+        elif self._requires_list_output:
             yield self._format_output(output)
         else:
             for item in output:
@@ -68,25 +92,217 @@ class OutputFormatter:
         formatted_output = self.get_formatted_output(output_list)
         for output in formatted_output:
             click.echo(output, nl=False)
-        if self.output_format in [OutputFormat.TABLE]:
+        if self.output_format in [OutputFormat.TABLE] and not self._stream_formatter:
             click.echo()
 
+    @property
+    def is_streaming(self):
+        """True if the output is formatted a page at a time as it arrives, so each page must be
+        written straight after the previous one rather than shown in a pager of its own."""
+        return self._stream_formatter is not None
+
+    def close(self):
+        """Finishes writing the output file, if the output format writes to one."""
+        close = getattr(self._stream_formatter, "close", None)
+        if close:
+            close()
+
     @property
     def _requires_list_output(self):
         return self.output_format in (OutputFormat.TABLE, OutputFormat.CSV)
 
 
+class CSVStreamFormatter:
+    """Formats records as CSV over many calls, such as one for each page of search results,
+    writing the header row only once.
+
+    When `columns` is given, the CSV always has exactly those columns, in that order, so the
+    output of different searches can be appended to the same file. Otherwise, the columns are
+    fixed by the first records formatted: every key in them, with the keys of `header` first, in
+    its order, followed by the others in the order they first appear. Either way, keys that
+    aren't columns are left out, since the header has already been written, and a warning naming
+    them is printed to stderr the first time each appears.
+
+    Args:
+        header (iterable): Keys to put first, such as the keys of a command's default header.
+        rows_per_chunk (int): The most rows in each string :meth:`format` yields.
+        columns (iterable): The keys to use as the columns, such as those from
+            :func:`code42cli.cmds.search.schemas.get_columns`.
+    """
+
+    def __init__(self, header=None, rows_per_chunk=_CSV_ROWS_PER_CHUNK, columns=None):
+        self._header = list(header or [])
+        self._rows_per_chunk = rows_per_chunk
+        self._columns = list(columns) if columns else None
+        self._column_set = None
+        self._dropped_keys = set()
+        self._buffer = io.StringIO()
+        self._writer = None
+
+    @property
+    def columns(self):
+        """The columns of the CSV, or None until the first records are formatted when no
+        `columns` were given."""
+        return self._columns
+
+    def format(self, records):
+        """Yields the CSV rows for `records` in chunks of up to `rows_per_chunk` rows, preceded
+        by the header row if these are the first records formatted."""
+        if not records:
+            return
+        if self._writer is None:
+            self._start(records)
+            self._writer.writeheader()
+        rows_in_chunk = 0
+        for record in records:
+            self._check_for_new_keys(record)
+            self._writer.writerow(record)
+            rows_in_chunk += 1
+            if rows_in_chunk == self._rows_per_chunk:
+                yield self._flush()
+                rows_in_chunk = 0
+        if self._buffer.tell():
+            yield self._flush()
+
+    def _start(self, records):
+        if self._columns is None:
+            columns = OrderedDict((key, None) for key in self._header)
+            for record in records:
+                columns.update((key, None) for key in record if key not in columns)
+            self._columns = list(columns)
+        self._column_set = set(self._columns)
+        self._writer = csv.DictWriter(
+            self._buffer, fieldnames=self._columns, extrasaction="ignore"
+        )
+
+    def _check_for_new_keys(self, record):
+        if len(record) <= len(self._column_set) and self._column_set.issuperset(record):
+            return
+        new_keys = record.keys() - self._column_set - self._dropped_keys
+        if new_keys:
+            self._dropped_keys.update(new_keys)
+            click.secho(
+                "Warning: Leaving out fields that aren't CSV columns, since the CSV header "
+                "has already been written: {}".format(", ".join(sorted(new_keys))),
+                err=True,
+                fg="yellow",
+            )
+
+    def _flush(self):
+        chunk = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return chunk
+
+
+class TableStreamFormatter:
+    """Formats records as a table over many calls, such as one for each page of search results,
+    one line at a time and writing the header row only once.
+
+    The columns are sized from a sample of the first records formatted: each column is as wide
+    as its title or its widest value in the sample, up to `max_column_width`. Values wider than
+    their column are cut short and end with "...".
+
+    Args:
+        header (dict): Maps the keys of the records to show to their column titles. Defaults to
+            every key in the sample.
+        sample_size (int): How many of the first records to size the columns from.
+        max_column_width (int): The widest a column can be.
+    """
+
+    def __init__(
+        self,
+        header=None,
+        sample_size=_TABLE_SAMPLE_SIZE,
+        max_column_width=_TABLE_MAX_COLUMN_WIDTH,
+    ):
+        self._header = header
+        self._sample_size = sample_size
+        self._max_column_width = max_column_width
+        self._keys = None
+        self._widths = None
+        self._row_format = None
+
+    def format(self, records):
+        """Yields a line for each of `records`, preceded by the header row if these are the
+        first records formatted."""
+        if not records:
+            return
+        if self._row_format is None:
+            header = self._start(records)
+            yield self._format_row(header.values())
+        keys = self._keys
+        for record in records:
+            yield self._format_row([record.get(key) for key in keys])
+
+    def _start(self, records):
+        sample = records[: self._sample_size]
+        header = self._header or _get_header_from_records(sample)
+        self._keys = list(header)
+        self._widths = [
+            min(
+                max([len(str(title))] + [len(str(r.get(key))) for r in sample]),
+                self._max_column_width,
+            )
+            for key, title in header.items()
+        ]
+        self._row_format = (
+            "".join("{{:<{}}}".format(width + _PADDING_SIZE) for width in self._widths)
+            + "\n"
+        )
+        return header
+
+    def _format_row(self, values):
+        cells = []
+        for value, width in zip(values, self._widths):
+            value = str(value)
+            if len(value) > width:
+                value = _truncate(value, width)
+            cells.append(value)
+        return self._row_format.format(*cells)
+
+
+class JsonLinesFormatter:
+    """Formats records as JSON Lines (NDJSON): one compact JSON object per line. Records are
+    serialized in batches with the fastest installed JSON backend, such as `orjson`.
+
+    Args:
+        records_per_batch (int): The most records in each string :meth:`format` yields.
+        backend (str): The JSON backend to use. See :func:`code42cli.json_lines.get_dumps_lines`.
+    """
+
+    def __init__(self, records_per_batch=_NDJSON_RECORDS_PER_BATCH, backend=None):
+        self._records_per_batch = records_per_batch
+        self._dumps_lines = get_dumps_lines(backend)
+
+    def format(self, records):
+        """Yields the lines for `records` in batches of up to `records_per_batch` records."""
+        size = self._records_per_batch
+        for i in range(0, len(records), size):
+            yield self._dumps_lines(records[i : i + size])
+
+
+def _get_header_from_records(records):
+    header = OrderedDict()
+    for record in records:
+        for key in record:
+            if key not in header and isinstance(key, str):
+                header[key] = key
+    return header
+
+
+def _truncate(value, width):
+    if width <= len(_TRUNCATION_MARKER):
+        return value[:width]
+    return value[: width - len(_TRUNCATION_MARKER)] + _TRUNCATION_MARKER
+
+
 def to_csv(output):
     """Output is a list of records"""
 
     if not output:
         return
-    string_io = io.StringIO()
-    fieldnames = list({k for d in output for k in d.keys()})
-    writer = csv.DictWriter(string_io, fieldnames=fieldnames)
-    writer.writeheader()
-    writer.writerows(output)
-    return string_io.getvalue()
+    return "".join(CSVStreamFormatter().format(output))
 
 
 def to_table(output, header):
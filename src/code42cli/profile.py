@@ -28,6 +28,19 @@ class Code42Profile:
     def ignore_ssl_errors(self):
         return self._profile[ConfigAccessor.IGNORE_SSL_ERRORS_KEY]
 
+    @property
+    def rate_limit(self):
+        """The most API requests per second to make with the profile, or None if unlimited."""
+        rate_limit = self._profile.get(ConfigAccessor.RATE_LIMIT_KEY)
+        return float(rate_limit) if rate_limit else None
+
+    @property
+    def rate_limit_burst(self):
+        """The most API requests to make at once with the profile, or None to allow one
+        second's worth of requests."""
+        burst = self._profile.get(ConfigAccessor.RATE_LIMIT_BURST_KEY)
+        return int(burst) if burst else None
+
     @property
     def has_stored_password(self):
         stored_password = password.get_stored_password(self)
@@ -120,6 +133,10 @@ def update_profile(name, server, username, ignore_ssl_errors):
     config_accessor.update_profile(name, server, username, ignore_ssl_errors)
 
 
+def update_rate_limit(name, rate_limit=None, rate_limit_burst=None):
+    config_accessor.update_rate_limit(name, rate_limit, rate_limit_burst)
+
+
 def get_all_profiles():
     profiles = [
         Code42Profile(profile) for profile in config_accessor.get_all_profiles()
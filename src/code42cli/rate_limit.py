@@ -0,0 +1,105 @@
+from threading import Lock
+from time import monotonic
+from time import sleep
+
+from requests.adapters import BaseAdapter
+
+_rate_limiter = None
+
+
+class TokenBucket:
+    """A thread-safe token bucket that limits how often requests are made. Tokens are added at
+    `rate` per second, up to `burst` tokens, and each request takes one, waiting for a token when
+    the bucket is empty. This allows short bursts of requests while keeping the average rate at
+    or below `rate`.
+
+    Args:
+        rate (float): The most requests per second on average.
+        burst (int): The most requests that can be made at once after the bucket has filled.
+            Defaults to one second's worth of requests.
+    """
+
+    def __init__(self, rate, burst=None, clock=monotonic, sleep=sleep):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0.")
+        self.rate = rate
+        self.burst = max(1, burst if burst else int(rate))
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.burst
+        self._updated_at = clock()
+        self._lock = Lock()
+
+    def acquire(self):
+        """Takes a token from the bucket, first waiting for one to be added if it's empty."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            # Tokens can go negative, which reserves the next token for this caller so that
+            # callers waiting at the same time are spread out instead of all waking at once.
+            self._tokens -= 1
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait_time:
+            self._sleep(wait_time)
+
+
+def create_rate_limiter(profile):
+    """Returns a :class:`TokenBucket` for the rate limit configured on `profile`, or None if the
+    profile doesn't have one."""
+    rate = profile.rate_limit
+    if not rate:
+        return None
+    return TokenBucket(rate, burst=profile.rate_limit_burst)
+
+
+def set_rate_limiter(rate_limiter):
+    """Sets the rate limiter that all API requests made by the CLI wait for, or removes it if
+    `rate_limiter` is None."""
+    global _rate_limiter
+    _rate_limiter = rate_limiter
+
+
+def get_rate_limiter():
+    """Returns the rate limiter set with :func:`set_rate_limiter`, or None."""
+    return _rate_limiter
+
+
+def wait_for_rate_limit():
+    """Waits until the rate limiter allows another request. Returns immediately if no rate
+    limiter is set."""
+    rate_limiter = _rate_limiter
+    if rate_limiter is not None:
+        rate_limiter.acquire()
+
+
+class RateLimitedAdapter(BaseAdapter):
+    """A `requests` transport adapter that calls :func:`wait_for_rate_limit` before sending
+    each HTTP request, including retries and the requests py42 makes to authenticate, and then
+    sends it with `adapter`. The wrapped adapter keeps its own connection pool settings.
+
+    Args:
+        adapter (requests.adapters.BaseAdapter): The adapter to send requests with.
+    """
+
+    def __init__(self, adapter):
+        super().__init__()
+        self.adapter = adapter
+
+    def send(self, request, **kwargs):
+        wait_for_rate_limit()
+        return self.adapter.send(request, **kwargs)
+
+    def close(self):
+        self.adapter.close()
+
+
+def limit_session_rate(session):
+    """Makes every request sent with the `requests` session `session` wait for the rate limiter
+    set with :func:`set_rate_limiter`, by wrapping each adapter mounted on the session in a
+    :class:`RateLimitedAdapter`. Adapters that are already wrapped are left as they are."""
+    for prefix, adapter in list(session.adapters.items()):
+        if not isinstance(adapter, RateLimitedAdapter):
+            session.mount(prefix, RateLimitedAdapter(adapter))
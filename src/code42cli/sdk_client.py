@@ -9,6 +9,13 @@ from requests.exceptions import ConnectionError
 from code42cli.errors import Code42CLIError
 from code42cli.errors import LoggedCLIError
 from code42cli.logger import get_main_cli_logger
+from code42cli.rate_limit import limit_session_rate
+
+try:
+    # Every py42 connection sends its requests with this session, but py42 doesn't expose it.
+    from py42.services._connection import ROOT_SESSION
+except ImportError:
+    ROOT_SESSION = None
 
 py42.settings.items_per_page = 500
 
@@ -29,6 +36,8 @@ def create_sdk(profile, is_debug_mode):
             requests.packages.urllib3.exceptions.InsecureRequestWarning
         )
         py42.settings.verify_ssl_certs = False
+    if profile.rate_limit:
+        limit_py42_request_rate()
     password = profile.get_password()
     return validate_connection(profile.authority_url, profile.username, password)
 
@@ -45,3 +54,13 @@ def validate_connection(authority_url, username, password):
     except Exception as err:
         logger.log_error(str(err))
         raise LoggedCLIError("Unknown problem validating connection.")
+
+
+def limit_py42_request_rate():
+    """Makes every request py42 sends wait for the CLI's rate limiter. See
+    :func:`code42cli.rate_limit.limit_session_rate`."""
+    if ROOT_SESSION is None:
+        raise Code42CLIError(
+            "Rate limits aren't supported with the installed version of py42."
+        )
+    limit_session_rate(ROOT_SESSION)
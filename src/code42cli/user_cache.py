@@ -0,0 +1,96 @@
+import os
+import re
+import sqlite3
+from hashlib import sha256
+from threading import Lock
+from time import time
+
+from code42cli.util import get_user_project_path
+
+DEFAULT_USER_ID_TTL = 24 * 60 * 60
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def get_user_cache_dir():
+    """The directory where each profile's user ID cache is stored."""
+    return get_user_project_path("user_cache")
+
+
+class UserIdCache:
+    """A persistent map of usernames to user UIDs for a profile, stored in a SQLite database in
+    the user project path so that separate CLI invocations can skip looking up the same users.
+
+    Each profile and server has its own cache, so a profile that is changed or recreated to
+    use a different server doesn't get the user IDs of the previous one.
+
+    Entries older than `ttl` seconds are treated as missing, so users that are deactivated or
+    renamed are eventually looked up again. The cache is safe to use from multiple threads.
+
+    Args:
+        profile_name (str): The name of the profile the user IDs belong to.
+        authority_url (str): The URL of the Code42 server the profile uses.
+        ttl (float): Seconds before a cached user ID expires.
+        refresh (bool): True to discard every cached user ID for the profile first.
+    """
+
+    def __init__(
+        self, profile_name, authority_url=None, ttl=DEFAULT_USER_ID_TTL, refresh=False,
+    ):
+        self.path = os.path.join(
+            get_user_cache_dir(), _get_cache_file_name(profile_name, authority_url)
+        )
+        self._ttl = ttl
+        self._lock = Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS user_ids "
+                "(username TEXT PRIMARY KEY, user_uid TEXT NOT NULL, cached_at REAL NOT NULL)"
+            )
+        if refresh:
+            self.clear()
+
+    def get(self, username):
+        """Returns the cached UID for `username`, or None if it isn't cached or has expired."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT user_uid FROM user_ids WHERE username = ? AND cached_at > ?",
+                (username, time() - self._ttl),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, username, user_uid):
+        """Caches the UID for `username`."""
+        self.set_many([(username, user_uid)])
+
+    def set_many(self, users):
+        """Caches the UIDs of many users at once.
+
+        Args:
+            users (iterable): (username, user UID) pairs.
+        """
+        now = time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO user_ids (username, user_uid, cached_at) "
+                "VALUES (?, ?, ?)",
+                ((username, user_uid, now) for username, user_uid in users),
+            )
+
+    def clear(self):
+        """Removes every cached user ID for the profile."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM user_ids")
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+def _get_cache_file_name(profile_name, authority_url):
+    # Profile names can contain any character, so they're made safe for a file name and a
+    # hash of the name and server keeps names that are made the same apart.
+    key = "{}\n{}".format(profile_name, authority_url or "")
+    digest = sha256(key.encode("utf-8")).hexdigest()[:16]
+    safe_name = _UNSAFE_FILENAME_CHARS.sub("_", profile_name)
+    return "{}_{}.db".format(safe_name, digest)
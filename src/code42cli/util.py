@@ -75,9 +75,10 @@ def format_to_table(rows, column_size):
     """Formats given rows into a string of left justified table."""
     lines = []
     for row in rows:
-        line = ""
-        for key in row.keys():
-            line += str(row[key]).ljust(column_size[key] + _PADDING_SIZE)
+        line = "".join(
+            str(value).ljust(column_size[key] + _PADDING_SIZE)
+            for key, value in row.items()
+        )
         lines.append(line)
     return "\n".join(lines)
 
@@ -1,7 +1,15 @@
+import heapq
 import queue
+import random
+from email.utils import parsedate_to_datetime
+from itertools import count
+from statistics import median
+from threading import Condition
+from threading import Event
 from threading import Lock
 from threading import Thread
-from time import sleep
+from time import monotonic
+from time import time
 
 from py42.exceptions import Py42ForbiddenError
 from py42.exceptions import Py42HTTPError
@@ -37,6 +45,10 @@ class WorkerStats:
         return val if val >= 0 else 0
 
     def __str__(self):
+        if self.total is None:
+            return "{} succeeded, {} failed".format(
+                self.total_successes, self._total_errors
+            )
         return "{} succeeded, {} failed out of {}".format(
             self.total_successes, self._total_errors, self.total
         )
@@ -52,32 +64,331 @@ class WorkerStats:
             self._total_errors += 1
 
 
+def is_throttling_error(err):
+    """Returns True if the given error indicates the server is overloaded or rate-limiting us,
+    e.g. an HTTP 429 or 5xx response."""
+    if not isinstance(err, Py42HTTPError):
+        return False
+    status_code = getattr(err.response, "status_code", None)
+    return isinstance(status_code, int) and (status_code == 429 or status_code >= 500)
+
+
+class AdaptiveConcurrency:
+    """Controls how many tasks a :class:`Worker` runs at once using additive-increase,
+    multiplicative-decrease (AIMD). After every `window` completed tasks, the limit grows by one
+    if the median task latency has not risen above `latency_tolerance` times the best median
+    seen so far. Whenever a task fails with a throttling error (HTTP 429 or 5xx), the limit is
+    halved.
+
+    Args:
+        min_limit (int): The fewest tasks allowed to run at once.
+        max_limit (int): The most tasks allowed to run at once.
+        initial_limit (int): The limit to start at. Defaults to `min_limit`.
+        window (int): The number of task latencies to collect before considering growth.
+        latency_tolerance (float): How much the median latency may rise relative to the best
+            observed median and still be considered flat.
+    """
+
+    def __init__(
+        self, min_limit, max_limit, initial_limit=None, window=20, latency_tolerance=1.5
+    ):
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError("Expected 1 <= min_limit <= max_limit.")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        initial_limit = initial_limit or min_limit
+        self._limit = min(max(initial_limit, min_limit), max_limit)
+        self._window = window
+        self._latency_tolerance = latency_tolerance
+        self._latencies = []
+        self._baseline_latency = None
+        self._active = 0
+        self._condition = Condition()
+
+    @property
+    def limit(self):
+        """The number of tasks currently allowed to run at once."""
+        return self._limit
+
+    def acquire(self):
+        """Blocks until there is room under the current limit to run another task."""
+        with self._condition:
+            while self._active >= self._limit:
+                self._condition.wait()
+            self._active += 1
+
+    def release(self, latency=None, throttled=False):
+        """Releases a slot taken with :meth:`acquire` and adjusts the limit.
+
+        Args:
+            latency (float): Seconds the task took to run. Ignored when `throttled` is True.
+            throttled (bool): True if the task failed because the server is throttling requests.
+        """
+        with self._condition:
+            self._active -= 1
+            if throttled:
+                self._decrease()
+            elif latency is not None:
+                self._record_latency(latency)
+            self._condition.notify_all()
+
+    def _record_latency(self, latency):
+        self._latencies.append(latency)
+        if len(self._latencies) < self._window:
+            return
+        current = median(self._latencies)
+        self._latencies = []
+        baseline = self._baseline_latency
+        if baseline is None or current <= baseline * self._latency_tolerance:
+            self._limit = min(self._limit + 1, self.max_limit)
+        self._baseline_latency = current if baseline is None else min(baseline, current)
+
+    def _decrease(self):
+        self._limit = max(self._limit // 2, self.min_limit)
+        self._latencies = []
+        self._baseline_latency = None
+
+
+DEFAULT_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryPolicy:
+    """Decides whether a :class:`Worker` should run a failed task again and how long to wait
+    first. Tasks are retried when they fail with a :class:`py42.exceptions.Py42HTTPError` whose
+    status code is in `retryable_statuses`.
+
+    The delay before each retry grows exponentially from `backoff_base`, is capped at
+    `backoff_cap`, and is randomized between zero and that value ("full jitter") so that many
+    tasks failing at once don't all retry at the same moment. If the response has a
+    `Retry-After` header, its delay is used instead. A `Retry-After` longer than `backoff_cap` is
+    not waited for, and the task fails.
+
+    Args:
+        max_attempts (int): The most times to run a task, including its first attempt.
+        backoff_base (float): Seconds to wait, at most, before the first retry.
+        backoff_cap (float): The longest to wait, in seconds, before any retry.
+        retryable_statuses (iterable): The HTTP status codes that are worth retrying.
+    """
+
+    def __init__(
+        self,
+        max_attempts=3,
+        backoff_base=1.0,
+        backoff_cap=30.0,
+        retryable_statuses=DEFAULT_RETRYABLE_STATUSES,
+    ):
+        if max_attempts < 1:
+            raise ValueError("Expected max_attempts >= 1.")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.retryable_statuses = frozenset(retryable_statuses)
+
+    def get_retry_delay(self, err, attempt):
+        """Returns the seconds to wait before running a task again after it failed with `err`
+        on its `attempt`-th run, or None if it should not be retried."""
+        if attempt >= self.max_attempts or not self._is_retryable(err):
+            return None
+        retry_after = _get_retry_after(err.response)
+        if retry_after is not None:
+            return retry_after if retry_after <= self.backoff_cap else None
+        backoff = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, backoff)
+
+    def _is_retryable(self, err):
+        if not isinstance(err, Py42HTTPError):
+            return False
+        return getattr(err.response, "status_code", None) in self.retryable_statuses
+
+
+def _get_retry_after(response):
+    headers = getattr(response, "headers", None)
+    value = headers.get("Retry-After") if headers else None
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time())
+    except (TypeError, ValueError):
+        return None
+
+
+class _RetryScheduler:
+    """Holds tasks waiting to be retried and hands each back to `enqueue` once its delay has
+    passed, so worker threads never sleep through a backoff."""
+
+    def __init__(self, enqueue):
+        self._enqueue = enqueue
+        self._scheduled = []
+        self._sequence = count()
+        self._condition = Condition()
+        self._thread = None
+
+    def schedule(self, task, delay):
+        with self._condition:
+            heapq.heappush(
+                self._scheduled, (monotonic() + delay, next(self._sequence), task)
+            )
+            if not self._thread:
+                self._thread = Thread(target=self._run)
+                self._thread.daemon = True
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._scheduled:
+                    self._condition.wait()
+                due_time, _, task = self._scheduled[0]
+                remaining = due_time - monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                heapq.heappop(self._scheduled)
+            self._enqueue(task)
+
+
+class WorkerTask:
+    """A handle to a function scheduled with :meth:`Worker.do_async`. Use it to get the outcome of
+    the task once it has run, either by blocking on :meth:`result` or by registering a callback
+    with :meth:`add_done_callback`.
+    """
+
+    def __init__(self, func, args, kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.attempts = 0
+        self._result = None
+        self._exception = None
+        self._callbacks = []
+        self._done_event = Event()
+        self._lock = Lock()
+
+    def done(self):
+        """Returns True if the task has finished running, whether it succeeded or not."""
+        return self._done_event.is_set()
+
+    def result(self, timeout=None):
+        """Blocks until the task completes and returns the value returned by its function. If the
+        function raised an exception, that exception is raised here instead.
+
+        Args:
+            timeout (float): Seconds to wait before raising `TimeoutError`. Waits forever if None.
+        """
+        self._wait(timeout)
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def exception(self, timeout=None):
+        """Blocks until the task completes and returns the exception raised by its function, or
+        None if it succeeded.
+
+        Args:
+            timeout (float): Seconds to wait before raising `TimeoutError`. Waits forever if None.
+        """
+        self._wait(timeout)
+        return self._exception
+
+    def add_done_callback(self, callback):
+        """Calls `callback` with this task as its only argument once the task has completed. If the
+        task has already completed, `callback` is called immediately. Callbacks run on the worker
+        thread that executed the task.
+        """
+        with self._lock:
+            if not self.done():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def _wait(self, timeout):
+        if not self._done_event.wait(timeout):
+            raise TimeoutError(
+                "Task did not complete within {} seconds.".format(timeout)
+            )
+
+    def _run(self):
+        self.attempts += 1
+        self._result = self.func(*self.args, **self.kwargs)
+
+    def _set_exception(self, exception):
+        self._exception = exception
+
+    def _complete(self):
+        with self._lock:
+            self._done_event.set()
+            callbacks = self._callbacks
+            self._callbacks = []
+        for callback in callbacks:
+            callback(self)
+
+
 class Worker:
-    def __init__(self, thread_count, expected_total, bar=None):
-        self._queue = queue.Queue()
+    """Executes tasks asynchronously on a pool of `thread_count` threads.
+
+    Args:
+        thread_count (int): The number of threads to start.
+        expected_total (int): The expected number of tasks, used for reporting stats. None if
+            unknown.
+        bar (click.progressbar): A progress bar to update as tasks complete.
+        concurrency (AdaptiveConcurrency): Limits how many of the threads may run tasks at once.
+            All threads run tasks if None.
+        max_queue_size (int): The most tasks that may wait in the queue. Once reached,
+            :meth:`do_async` blocks until a thread takes a task off the queue, so callers can't
+            get ahead of the threads by more than this many tasks. Unbounded if 0.
+        retry_policy (RetryPolicy): Decides which failed tasks to run again. A task waiting to
+            be retried is held aside rather than occupying a thread, and is put back on the queue
+            once its backoff has passed. Tasks are not retried if None.
+    """
+
+    def __init__(
+        self,
+        thread_count,
+        expected_total,
+        bar=None,
+        concurrency=None,
+        max_queue_size=0,
+        retry_policy=None,
+    ):
+        self._queue = queue.Queue(maxsize=max_queue_size)
         self._thread_count = thread_count
+        self._concurrency = concurrency
+        self._retry_policy = retry_policy
+        self._retry_scheduler = _RetryScheduler(self._queue.put)
+        self._pending = 0
+        self._pending_condition = Condition()
         self._stats = WorkerStats(expected_total)
-        self._tasks = 0
         self.__started = False
         self.__start_lock = Lock()
         self._logger = get_main_cli_logger()
         self._bar = bar
 
     def do_async(self, func, *args, **kwargs):
-        """Execute the given func asynchronously given *args and **kwargs.
+        """Execute the given func asynchronously given *args and **kwargs. Blocks while the queue
+        is full if the worker was created with a `max_queue_size`.
 
         Args:
             func (callable): The function to execute asynchronously.
             *args (iter): Positional args to pass to the function.
             **kwargs (dict): Key-value args to pass to the function.
+
+        Returns:
+            :class:`WorkerTask`: A handle for getting the outcome of the task.
         """
         if not self.__started:
             with self.__start_lock:
                 if not self.__started:
                     self.__start()
                     self.__started = True
-        self._queue.put({"func": func, "args": args, "kwargs": kwargs})
-        self._tasks += 1
+        task = WorkerTask(func, args, kwargs)
+        with self._pending_condition:
+            self._pending += 1
+        self._queue.put(task)
+        return task
 
     @property
     def stats(self):
@@ -85,42 +396,84 @@ class Worker:
         """
         return self._stats
 
+    @property
+    def queue_depth(self):
+        """The number of tasks waiting to be picked up by a thread."""
+        return self._queue.qsize()
+
     def wait(self):
-        """Wait for the tasks in the queue to complete. This should usually be called before
-        program termination."""
-        while self._stats.total_processed < self._tasks:
-            sleep(0.5)
+        """Wait for the tasks in the queue, including any waiting to be retried, to complete.
+        This should usually be called before program termination."""
+        with self._pending_condition:
+            while self._pending:
+                self._pending_condition.wait()
 
     def _process_queue(self):
         while True:
+            if self._concurrency:
+                self._concurrency.acquire()
+            task = self._queue.get()
+            start_time = monotonic()
+            error = None
+            retry_delay = None
             try:
-                task = self._queue.get()
-                func = task["func"]
-                args = task["args"]
-                kwargs = task["kwargs"]
-                func(*args, **kwargs)
-            except Code42CLIError as err:
-                self._increment_total_errors()
-                self._logger.log_error(err)
-            except Py42ForbiddenError as err:
-                self._increment_total_errors()
-                self._logger.log_verbose_error(http_request=err.response.request)
-                self._logger.log_error(
-                    "You do not have the necessary permissions to perform this task. "
-                    "Try using or creating a different profile."
-                )
-            except Py42HTTPError as err:
-                self._increment_total_errors()
-                self._logger.log_verbose_error(http_request=err.response.request)
-            except Exception:
-                self._increment_total_errors()
-                self._logger.log_verbose_error()
+                task._run()
+            except Exception as err:
+                error = err
+                retry_delay = self._get_retry_delay(task, err)
+                # Errors are logged here, while their traceback is available, unless the task
+                # will run again.
+                if retry_delay is None:
+                    self._log_task_error(err)
             finally:
-                self._stats.increment_total_processed()
-                if self._bar:
-                    self._bar.update(1)
+                if self._concurrency:
+                    self._concurrency.release(
+                        latency=monotonic() - start_time,
+                        throttled=is_throttling_error(error),
+                    )
+                if retry_delay is not None:
+                    self._retry_scheduler.schedule(task, retry_delay)
+                else:
+                    self._finish_task(task, error)
                 self._queue.task_done()
 
+    def _get_retry_delay(self, task, error):
+        if not self._retry_policy:
+            return None
+        return self._retry_policy.get_retry_delay(error, task.attempts)
+
+    def _finish_task(self, task, error):
+        if error is not None:
+            task._set_exception(error)
+            self._increment_total_errors()
+        self._stats.increment_total_processed()
+        if self._bar:
+            self._bar.update(1)
+        self._complete_task(task)
+        with self._pending_condition:
+            self._pending -= 1
+            self._pending_condition.notify_all()
+
+    def _log_task_error(self, err):
+        if isinstance(err, Code42CLIError):
+            self._logger.log_error(err)
+        elif isinstance(err, Py42ForbiddenError):
+            self._logger.log_verbose_error(http_request=err.response.request)
+            self._logger.log_error(
+                "You do not have the necessary permissions to perform this task. "
+                "Try using or creating a different profile."
+            )
+        elif isinstance(err, Py42HTTPError):
+            self._logger.log_verbose_error(http_request=err.response.request)
+        else:
+            self._logger.log_verbose_error()
+
+    def _complete_task(self, task):
+        try:
+            task._complete()
+        except Exception:
+            self._logger.log_verbose_error()
+
     def __start(self):
         for _ in range(0, self._thread_count):
             t = Thread(target=self._process_queue)
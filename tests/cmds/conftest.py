@@ -17,7 +17,10 @@ TEST_EMPLOYEE = "risky employee"
 
 @pytest.fixture
 def sdk(mocker):
-    return mocker.MagicMock(spec=SDKClient)
+    sdk = mocker.MagicMock(spec=SDKClient)
+    # A tenant too large for bulk commands to prefetch users, unless a test says otherwise.
+    sdk.users.get_page.return_value = {"totalCount": 1000000}
+    return sdk
 
 
 @pytest.fixture()
@@ -93,3 +96,18 @@ def thread_safe_side_effect():
     f.call_count = 0
     f.call_args_list = []
     return f
+
+
+def mock_bulk_process(mocker, path):
+    """Patches `run_bulk_process` at the given path, collecting the rows it is given into the
+    mock's `rows` attribute. The rows are read while the command runs since bulk commands read
+    their files lazily and click closes the file when the command completes."""
+    rows = []
+
+    def run_bulk_process(row_handler, bulk_rows, **kwargs):
+        rows.extend(bulk_rows)
+
+    mock = mocker.patch(path)
+    mock.side_effect = run_bulk_process
+    mock.rows = rows
+    return mock
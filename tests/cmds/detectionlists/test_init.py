@@ -2,6 +2,8 @@ import pytest
 from py42.response import Py42Response
 from requests import Response
 
+from code42cli.cmds.detectionlists import get_sync_rows
+from code42cli.cmds.detectionlists import SyncAction
 from code42cli.cmds.detectionlists import update_user
 
 
@@ -56,3 +58,95 @@ def test_update_user_when_given_cloud_alias_first_removes_old_alias(
     sdk.detectionlists.remove_user_cloud_alias.assert_called_once_with(
         MOCK_USER_ID, MOCK_ALIAS
     )
+
+
+def test_update_user_fetches_profile_once(
+    sdk, user_response_with_cloud_aliases, mock_user_id
+):
+    sdk.detectionlists.get_user_by_id.return_value = user_response_with_cloud_aliases
+    update_user(
+        sdk,
+        MOCK_USER_NAME,
+        cloud_alias="new.alias@exaple.com",
+        risk_tag=["FLIGHT_RISK"],
+        notes="New notes",
+    )
+    assert sdk.detectionlists.get_user_by_id.call_count == 1
+
+
+def test_update_user_when_nothing_given_does_not_fetch_profile(sdk, mock_user_id):
+    update_user(sdk, MOCK_USER_NAME)
+    assert not sdk.detectionlists.get_user_by_id.call_count
+
+
+def test_update_user_when_cloud_alias_already_set_does_not_update_alias(
+    sdk, user_response_with_cloud_aliases, mock_user_id
+):
+    sdk.detectionlists.get_user_by_id.return_value = user_response_with_cloud_aliases
+    update_user(sdk, MOCK_USER_NAME, cloud_alias=MOCK_ALIAS)
+    assert not sdk.detectionlists.remove_user_cloud_alias.call_count
+    assert not sdk.detectionlists.add_user_cloud_alias.call_count
+
+
+def test_update_user_when_given_risk_tags_only_adds_tags_user_does_not_have(
+    sdk, user_response_with_cloud_aliases, mock_user_id
+):
+    sdk.detectionlists.get_user_by_id.return_value = user_response_with_cloud_aliases
+    update_user(
+        sdk, MOCK_USER_NAME, risk_tag="HIGH_IMPACT_EMPLOYEE FLIGHT_RISK",
+    )
+    sdk.detectionlists.add_user_risk_tags.assert_called_once_with(
+        MOCK_USER_ID, ["FLIGHT_RISK"]
+    )
+
+
+def test_update_user_when_user_has_all_risk_tags_does_not_add_tags(
+    sdk, user_response_with_cloud_aliases, mock_user_id
+):
+    sdk.detectionlists.get_user_by_id.return_value = user_response_with_cloud_aliases
+    update_user(sdk, MOCK_USER_NAME, risk_tag=["HIGH_IMPACT_EMPLOYEE"])
+    assert not sdk.detectionlists.add_user_risk_tags.call_count
+
+
+def test_update_user_when_notes_unchanged_does_not_update_notes(
+    sdk, user_response_with_cloud_aliases, mock_user_id
+):
+    sdk.detectionlists.get_user_by_id.return_value = user_response_with_cloud_aliases
+    update_user(sdk, MOCK_USER_NAME, notes="Notes")
+    assert not sdk.detectionlists.update_user_notes.call_count
+
+
+def test_update_user_when_notes_changed_updates_notes(
+    sdk, user_response_with_cloud_aliases, mock_user_id
+):
+    sdk.detectionlists.get_user_by_id.return_value = user_response_with_cloud_aliases
+    update_user(sdk, MOCK_USER_NAME, notes="New notes")
+    sdk.detectionlists.update_user_notes.assert_called_once_with(
+        MOCK_USER_ID, "New notes"
+    )
+
+
+def test_get_sync_rows_returns_adds_for_unlisted_users_and_removes_for_users_not_in_file(
+    sdk,
+):
+    sdk.users.get_by_username.side_effect = lambda username: {
+        "users": [{"userUid": "{}_id".format(username)}]
+    }
+    list_client = sdk.detectionlists.high_risk_employee
+    list_client.get_all.return_value = [
+        {"items": [{"userId": "listed_id", "userName": "listed"}]},
+        {"items": [{"userId": "former_id", "userName": "former"}]},
+    ]
+    rows = [{"username": "listed", "notes": None}, {"username": "new", "notes": "x"}]
+    sync_rows = get_sync_rows(sdk, list_client, rows)
+    assert sync_rows == [
+        {"username": "new", "notes": "x", "action": SyncAction.ADD},
+        {"username": "former", "user_id": "former_id", "action": SyncAction.REMOVE},
+    ]
+
+
+def test_get_sync_rows_when_user_does_not_exist_returns_add(sdk_without_user):
+    list_client = sdk_without_user.detectionlists.departing_employee
+    list_client.get_all.return_value = [{"items": []}]
+    sync_rows = get_sync_rows(sdk_without_user, list_client, [{"username": "ghost"}])
+    assert sync_rows == [{"username": "ghost", "action": SyncAction.ADD}]
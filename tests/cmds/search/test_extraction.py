@@ -1,14 +1,22 @@
+import json
+from threading import Barrier
+from threading import Event
+
 import pytest
+from c42eventextractor import ExtractionHandlers
 from c42eventextractor.extractors import BaseExtractor
 from py42.response import Py42Response
 from requests import Response
 
 from code42cli import errors
+from code42cli.cmds.search import extraction
 from code42cli.cmds.search.cursor_store import BaseCursorStore
 from code42cli.cmds.search.extraction import create_handlers
 from code42cli.cmds.search.extraction import create_send_to_handlers
+from code42cli.cmds.search.extraction import extract_in_background
 from code42cli.cmds.search.extraction import try_get_default_header
 from code42cli.output_formats import OutputFormat
+from code42cli.output_formats import OutputFormatter
 
 
 key = "events"
@@ -67,6 +75,59 @@ def test_create_handlers_creates_handlers_that_pass_events_to_output_formatter(
     formatter.echo_formatted_list.assert_called_once_with(events)
 
 
+class PagedTestExtractor(BaseExtractor):
+    def __init__(self, handlers, timestamp_filter):
+        timestamp_filter._term = "test_term"
+        super().__init__(key, search, handlers, timestamp_filter, TestQuery)
+
+    def _get_timestamp_from_item(self, item):
+        pass
+
+
+def create_page_response(mocker, events):
+    http_response = mocker.MagicMock(spec=Response)
+    http_response.text = json.dumps({key: events})
+    return Py42Response(http_response)
+
+
+def test_create_handlers_when_formatter_is_not_streaming_shows_large_pages_in_pager(
+    mocker, sdk
+):
+    pager = mocker.patch("click.echo_via_pager")
+    formatter = OutputFormatter(OutputFormat.JSON)
+    handlers = create_handlers(
+        sdk, PagedTestExtractor, None, "chk-name", formatter, force_pager=False
+    )
+    handlers.handle_response(
+        create_page_response(mocker, [{"property": i} for i in range(11)])
+    )
+    assert pager.call_count == 1
+
+
+@pytest.mark.parametrize("force_pager", [True, False])
+def test_create_handlers_when_formatter_is_streaming_writes_pages_without_pager(
+    mocker, sdk, capsys, force_pager
+):
+    pager = mocker.patch("click.echo_via_pager")
+    formatter = OutputFormatter(
+        OutputFormat.TABLE, {"property": "Property"}, streaming=True
+    )
+    handlers = create_handlers(
+        sdk, PagedTestExtractor, None, "chk-name", formatter, force_pager=force_pager
+    )
+    handlers.handle_response(
+        create_page_response(mocker, [{"property": i} for i in range(11)])
+    )
+    handlers.handle_response(
+        create_page_response(mocker, [{"property": i} for i in range(11, 22)])
+    )
+    assert not pager.call_count
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 23
+    assert lines[0].strip() == "Property"
+    assert lines[-1].strip() == "21"
+
+
 def test_send_to_handlers_creates_handlers_that_pass_events_to_logger(
     mocker, sdk, event_extractor_logger
 ):
@@ -88,3 +149,98 @@ def test_send_to_handlers_creates_handlers_that_pass_events_to_logger(
     py42_response = Py42Response(http_response)
     handlers.handle_response(py42_response)
     event_extractor_logger.info.assert_called_once_with(events[0])
+
+
+class RecordingHandlers(ExtractionHandlers):
+    def __init__(self):
+        self.calls = []
+
+    def handle_response(self, response):
+        self.calls.append(("response", response))
+
+    def handle_error(self, exception):
+        self.calls.append(("error", exception))
+
+    def record_cursor_position(self, cursor):
+        self.calls.append(("cursor", cursor))
+        self._cursor_position = cursor
+
+
+def test_extract_in_background_handles_pages_and_cursors_in_order():
+    handlers = RecordingHandlers()
+    error = Exception("page failed")
+
+    def extract(extraction_handlers):
+        for page in range(3):
+            extraction_handlers.handle_response(page)
+            extraction_handlers.record_cursor_position(page * 10)
+        extraction_handlers.handle_error(error)
+
+    extract_in_background(extract, handlers)
+    assert handlers.calls == [
+        ("response", 0),
+        ("cursor", 0),
+        ("response", 1),
+        ("cursor", 10),
+        ("response", 2),
+        ("cursor", 20),
+        ("error", error),
+    ]
+
+
+def test_extract_in_background_fetches_next_page_while_handling_current_page():
+    fetched_second_page = Event()
+    overlapped = []
+
+    class Handlers(RecordingHandlers):
+        def handle_response(self, response):
+            if response == 1:
+                overlapped.append(fetched_second_page.wait(timeout=5))
+
+    def extract(extraction_handlers):
+        extraction_handlers.handle_response(1)
+        extraction_handlers.handle_response(2)
+        fetched_second_page.set()
+
+    extract_in_background(extract, Handlers())
+    assert overlapped == [True]
+
+
+def test_extract_in_background_gives_extractor_latest_cursor_before_it_is_handled():
+    handlers = RecordingHandlers()
+    handlers._cursor_position = 5
+    cursors = []
+
+    def extract(extraction_handlers):
+        cursors.append(extraction_handlers.get_cursor_position())
+        extraction_handlers.record_cursor_position(10)
+        cursors.append(extraction_handlers.get_cursor_position())
+
+    extract_in_background(extract, handlers)
+    assert cursors == [5, 10]
+
+
+def test_extract_in_background_when_extraction_raises_raises_on_calling_thread():
+    def extract(extraction_handlers):
+        raise ValueError("bad filters")
+
+    with pytest.raises(ValueError):
+        extract_in_background(extract, RecordingHandlers())
+
+
+def test_get_alert_details_fetches_batches_concurrently(mocker, sdk):
+    mocker.patch.object(extraction, "_ALERT_DETAIL_BATCH_SIZE", 1)
+    barrier = Barrier(2, timeout=5)
+
+    def get_details(alert_ids):
+        barrier.wait()
+        return {"alerts": [{"id": alert_ids[0], "createdAt": str(alert_ids[0])}]}
+
+    sdk.alerts.get_details.side_effect = get_details
+    results = extraction._get_alert_details(sdk, [{"id": 1}, {"id": 2}])
+    assert [alert["id"] for alert in results] == [2, 1]
+
+
+def test_get_alert_details_when_no_alerts_returns_empty_list(sdk):
+    assert extraction._get_alert_details(sdk, []) == []
+    assert not sdk.alerts.get_details.call_count
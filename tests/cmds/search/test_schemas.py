@@ -0,0 +1,17 @@
+from collections import OrderedDict
+
+from code42cli.cmds.search.schemas import ALERT_FIELDS
+from code42cli.cmds.search.schemas import FILE_EVENT_FIELDS
+from code42cli.cmds.search.schemas import get_columns
+
+
+def test_get_columns_puts_default_header_keys_first_followed_by_other_fields():
+    default_header = OrderedDict()
+    default_header["c"] = "C"
+    default_header["a"] = "A"
+    assert get_columns(default_header, ("a", "b", "c", "d")) == ["c", "a", "b", "d"]
+
+
+def test_field_schemas_have_no_duplicates():
+    assert len(FILE_EVENT_FIELDS) == len(set(FILE_EVENT_FIELDS))
+    assert len(ALERT_FIELDS) == len(set(ALERT_FIELDS))
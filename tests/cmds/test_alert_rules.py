@@ -9,6 +9,7 @@ from py42.response import Py42Response
 from requests import HTTPError
 from requests import Request
 from requests import Response
+from tests.cmds.conftest import mock_bulk_process
 
 from code42cli.main import cli
 
@@ -284,25 +285,29 @@ def test_show_rule_when_no_matching_rule_prints_no_rule_message(runner, cli_stat
 
 
 def test_add_bulk_users_uses_expected_arguments(runner, mocker, cli_state):
-    bulk_processor = mocker.patch("code42cli.cmds.alert_rules.run_bulk_process")
+    bulk_processor = mock_bulk_process(
+        mocker, "code42cli.cmds.alert_rules.run_bulk_process"
+    )
     with runner.isolated_filesystem():
         with open("test_add.csv", "w") as csv:
             csv.writelines(["rule_id,username\n", "test,value\n"])
         runner.invoke(
             cli, ["alert-rules", "bulk", "add", "test_add.csv"], obj=cli_state
         )
-    assert bulk_processor.call_args[0][1] == [{"rule_id": "test", "username": "value"}]
+    assert bulk_processor.rows == [{"rule_id": "test", "username": "value"}]
 
 
 def test_remove_bulk_users_uses_expected_arguments(runner, mocker, cli_state):
-    bulk_processor = mocker.patch("code42cli.cmds.alert_rules.run_bulk_process")
+    bulk_processor = mock_bulk_process(
+        mocker, "code42cli.cmds.alert_rules.run_bulk_process"
+    )
     with runner.isolated_filesystem():
         with open("test_remove.csv", "w") as csv:
             csv.writelines(["rule_id,username\n", "test,value\n"])
         runner.invoke(
             cli, ["alert-rules", "bulk", "add", "test_remove.csv"], obj=cli_state
         )
-    assert bulk_processor.call_args[0][1] == [{"rule_id": "test", "username": "value"}]
+    assert bulk_processor.rows == [{"rule_id": "test", "username": "value"}]
 
 
 def test_list_cmd_prints_no_rules_found_when_f_is_passed_and_response_is_empty(
@@ -343,3 +348,42 @@ def test_remove_when_user_not_on_rule_raises_expected_error(runner, cli_state, m
         )
         in result.output
     )
+
+
+def test_bulk_add_loads_rules_once_and_adds_users_to_known_rules(
+    runner, cli_state, get_user_id
+):
+    cli_state.sdk.alerts.rules.get_all.return_value = [TEST_RULE_RESPONSE]
+    get_user_id.return_value = TEST_USER_ID
+    with runner.isolated_filesystem():
+        with open("test_add.csv", "w") as csv:
+            csv.writelines(
+                [
+                    "rule_id,username\n",
+                    "{},{}\n".format(TEST_RULE_ID, TEST_USERNAME),
+                    "{},{}\n".format(TEST_RULE_ID, "another@code42.com"),
+                ]
+            )
+        runner.invoke(
+            cli, ["alert-rules", "bulk", "add", "test_add.csv"], obj=cli_state
+        )
+    assert cli_state.sdk.alerts.rules.get_all.call_count == 1
+    assert not cli_state.sdk.alerts.rules.get_by_observer_id.call_count
+    assert cli_state.sdk.alerts.rules.add_user.call_count == 2
+
+
+def test_bulk_remove_when_rule_does_not_exist_fails_row_without_removing_user(
+    runner, cli_state, get_user_id
+):
+    cli_state.sdk.alerts.rules.get_all.return_value = [TEST_RULE_RESPONSE]
+    with runner.isolated_filesystem():
+        with open("test_remove.csv", "w") as csv:
+            csv.writelines(
+                ["rule_id,username\n", "{},{}\n".format("unknown-rule", TEST_USERNAME)]
+            )
+        result = runner.invoke(
+            cli, ["alert-rules", "bulk", "remove", "test_remove.csv"], obj=cli_state
+        )
+    assert result.exit_code == 1
+    assert not cli_state.sdk.alerts.rules.remove_user.call_count
+    assert "Wrote 1 failed rows" in result.output
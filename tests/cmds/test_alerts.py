@@ -163,6 +163,35 @@ def test_search_with_advanced_query_uses_only_the_extract_advanced_method(
     assert alert_extractor.extract.call_count == 0
 
 
+def test_search_uses_alert_csv_columns(mocker, cli_state, alert_extractor, runner):
+    formatter = mocker.patch("{}.cmds.alerts.OutputFormatter".format(PRODUCT_NAME))
+    runner.invoke(
+        cli, ["alerts", "search", "--begin", "1d", "-f", "CSV"], obj=cli_state
+    )
+    columns = formatter.call_args[0][2]
+    assert formatter.call_args[1]["streaming"]
+    assert columns[:6] == [
+        "name",
+        "actor",
+        "createdAt",
+        "state",
+        "severity",
+        "description",
+    ]
+    assert "observations" in columns
+
+
+def test_search_with_ndjson_format_uses_ndjson_format(
+    mocker, cli_state, alert_extractor, runner
+):
+    formatter = mocker.patch("{}.cmds.alerts.OutputFormatter".format(PRODUCT_NAME))
+    result = runner.invoke(
+        cli, ["alerts", "search", "--begin", "1d", "-f", "ndjson"], obj=cli_state
+    )
+    assert result.exit_code == 0
+    assert formatter.call_args[0][0] == "NDJSON"
+
+
 def test_search_without_advanced_query_uses_only_the_extract_method(
     cli_state, alert_extractor, runner
 ):
@@ -1,11 +1,17 @@
+import os
+from glob import glob
+
+from py42.exceptions import Py42HTTPError
 from py42.exceptions import Py42NotFoundError
 from requests import HTTPError
 from requests import Request
 from requests import Response
+from tests.cmds.conftest import mock_bulk_process
 from tests.cmds.conftest import thread_safe_side_effect
 from tests.conftest import TEST_ID
 
 from .conftest import TEST_EMPLOYEE
+from code42cli.cmds import departing_employee
 from code42cli.main import cli
 
 
@@ -129,8 +135,6 @@ def test_add_bulk_users_calls_expected_py42_methods(runner, mocker, cli_state):
                     "test_user,test_alias,2020-01-01,test_note\n",
                     "test_user_2,test_alias_2,2020-02-01,test_note_2\n",
                     "test_user_3,,,\n",
-                    "test_user_3,,2020-30-02,\n",
-                    "test_user_3,,20-02-2020,\n",
                 ]
             )
         runner.invoke(
@@ -155,8 +159,142 @@ def test_add_bulk_users_calls_expected_py42_methods(runner, mocker, cli_state):
     assert "test_note_2" in update_user_notes_call_args
 
 
+def test_add_bulk_users_when_dates_are_invalid_fails_before_adding_any_users(
+    runner, cli_state
+):
+    with runner.isolated_filesystem():
+        with open("test_add.csv", "w") as csv:
+            csv.writelines(
+                [
+                    "username,cloud_alias,departure_date,notes\n",
+                    "test_user,,2020-01-01,\n",
+                    "test_user_2,,2020-30-02,\n",
+                    "test_user_3,,20-02-2020,\n",
+                ]
+            )
+        result = runner.invoke(
+            cli, ["departing-employee", "bulk", "add", "test_add.csv"], obj=cli_state
+        )
+    assert result.exit_code == 1
+    assert "Invalid departure dates" in result.output
+    assert "line 3: departure_date: Invalid date 2020-30-02" in result.output
+    assert "line 4: departure_date: Invalid date 20-02-2020" in result.output
+    assert not cli_state.sdk.detectionlists.departing_employee.add.call_count
+    assert not cli_state.sdk.users.get_by_username.call_count
+
+
+def test_add_bulk_users_when_dates_are_validated_parses_each_distinct_date_once(
+    runner, mocker, cli_state
+):
+    de_add_user = thread_safe_side_effect()
+    cli_state.sdk.detectionlists.departing_employee.add.side_effect = de_add_user
+    parse_departure_date = mocker.patch(
+        "code42cli.cmds.departing_employee._parse_departure_date",
+        wraps=departing_employee._parse_departure_date,
+    )
+    with runner.isolated_filesystem():
+        with open("test_add.csv", "w") as csv:
+            csv.writelines(
+                [
+                    "username,cloud_alias,departure_date,notes\n",
+                    "test_user,,2020-01-01,\n",
+                    "test_user_2,,2020-01-01,\n",
+                    "test_user_3,,2020-01-01,\n",
+                ]
+            )
+        runner.invoke(
+            cli, ["departing-employee", "bulk", "add", "test_add.csv"], obj=cli_state
+        )
+    assert parse_departure_date.call_count == 1
+    assert [call[1] for call in de_add_user.call_args_list] == ["2020-01-01"] * 3
+
+
+def test_add_bulk_users_when_dates_are_not_zero_padded_sends_zero_padded_dates(
+    runner, cli_state
+):
+    de_add_user = thread_safe_side_effect()
+    cli_state.sdk.detectionlists.departing_employee.add.side_effect = de_add_user
+    with runner.isolated_filesystem():
+        with open("test_add.csv", "w") as csv:
+            csv.writelines(
+                [
+                    "username,cloud_alias,departure_date,notes\n",
+                    "test_user,,2020-1-5,\n",
+                ]
+            )
+        runner.invoke(
+            cli, ["departing-employee", "bulk", "add", "test_add.csv"], obj=cli_state
+        )
+    assert [call[1] for call in de_add_user.call_args_list] == ["2020-01-05"]
+
+
+def test_add_bulk_users_when_row_is_missing_columns_still_adds_user(runner, cli_state):
+    de_add_user = thread_safe_side_effect()
+    cli_state.sdk.detectionlists.departing_employee.add.side_effect = de_add_user
+    with runner.isolated_filesystem():
+        with open("test_add.csv", "w") as csv:
+            csv.writelines(
+                [
+                    "username,cloud_alias,departure_date,notes\n",
+                    "test_user,,2020-01-01,\n",
+                    "test_user_2\n",
+                ]
+            )
+        result = runner.invoke(
+            cli, ["departing-employee", "bulk", "add", "test_add.csv"], obj=cli_state
+        )
+    assert "Invalid departure dates" not in result.output
+    assert sorted([call[1] for call in de_add_user.call_args_list], key=str) == [
+        "2020-01-01",
+        None,
+    ]
+
+
+def test_add_bulk_users_when_update_fails_with_transient_error_does_not_add_user_again(
+    runner, mocker, cli_state
+):
+    err = mocker.MagicMock(spec=HTTPError)
+    err.response = mocker.MagicMock(spec=Response)
+    err.response.status_code = 503
+    err.response.request = None
+    cli_state.sdk.detectionlists.update_user_notes.side_effect = Py42HTTPError(err)
+    with runner.isolated_filesystem():
+        with open("test_add.csv", "w") as csv:
+            csv.writelines(
+                [
+                    "username,cloud_alias,departure_date,notes\n",
+                    "test_user,,,test_note\n",
+                ]
+            )
+        result = runner.invoke(
+            cli, ["departing-employee", "bulk", "add", "test_add.csv"], obj=cli_state
+        )
+    assert result.exit_code == 1
+    assert cli_state.sdk.detectionlists.departing_employee.add.call_count == 1
+    assert cli_state.sdk.detectionlists.update_user_notes.call_count == 1
+
+
+def test_add_bulk_users_when_reading_stdin_fails_rows_with_invalid_dates(
+    runner, cli_state
+):
+    de_add_user = thread_safe_side_effect()
+    cli_state.sdk.detectionlists.departing_employee.add.side_effect = de_add_user
+    result = runner.invoke(
+        cli,
+        ["departing-employee", "bulk", "add", "-"],
+        input="username,cloud_alias,departure_date,notes\n"
+        "test_user,,2020-01-01,\n"
+        "test_user_2,,2020-30-02,\n",
+        obj=cli_state,
+    )
+    assert result.exit_code == 1
+    assert [call[1] for call in de_add_user.call_args_list] == ["2020-01-01"]
+
+
 def test_remove_bulk_users_uses_expected_arguments(runner, mocker, cli_state_with_user):
-    bulk_processor = mocker.patch("code42cli.cmds.departing_employee.run_bulk_process")
+    bulk_processor = mock_bulk_process(
+        mocker, "code42cli.cmds.departing_employee.run_bulk_process"
+    )
     with runner.isolated_filesystem():
         with open("test_remove.csv", "w") as csv:
             csv.writelines(["# username\n", "test_user1\n", "test_user2\n"])
@@ -165,7 +303,7 @@ def test_remove_bulk_users_uses_expected_arguments(runner, mocker, cli_state_wit
             ["departing-employee", "bulk", "remove", "test_remove.csv"],
             obj=cli_state_with_user,
         )
-    assert bulk_processor.call_args[0][1] == ["test_user1", "test_user2"]
+    assert bulk_processor.rows == ["test_user1", "test_user2"]
 
 
 def test_add_departing_employee_when_invalid_date_validation_raises_error(
@@ -226,3 +364,110 @@ def test_remove_departing_employee_when_user_not_on_list_prints_expected_error(
         )
         in result.output
     )
+
+
+def _set_up_sync(cli_state, listed_users):
+    cli_state.sdk.users.get_by_username.side_effect = lambda username: {
+        "users": [{"userUid": "{}_id".format(username)}]
+    }
+    cli_state.sdk.detectionlists.departing_employee.get_all.return_value = [
+        {
+            "items": [
+                {"userId": "{}_id".format(username), "userName": username}
+                for username in listed_users
+            ]
+        }
+    ]
+
+
+def test_bulk_sync_adds_and_removes_only_users_that_differ(runner, cli_state):
+    _set_up_sync(cli_state, ["listed_user", "departed_user"])
+    de_add_user = thread_safe_side_effect()
+    de_remove_user = thread_safe_side_effect()
+    cli_state.sdk.detectionlists.departing_employee.add.side_effect = de_add_user
+    cli_state.sdk.detectionlists.departing_employee.remove.side_effect = de_remove_user
+    with runner.isolated_filesystem():
+        with open("test_sync.csv", "w") as csv:
+            csv.writelines(
+                [
+                    "username,cloud_alias,departure_date,notes\n",
+                    "listed_user,,2020-01-01,\n",
+                    "new_user,,2020-02-01,\n",
+                ]
+            )
+        result = runner.invoke(
+            cli, ["departing-employee", "bulk", "sync", "test_sync.csv"], obj=cli_state
+        )
+    assert result.exit_code == 0
+    assert de_add_user.call_args_list == [("new_user_id", "2020-02-01")]
+    assert de_remove_user.call_args_list == [("departed_user_id",)]
+    assert (
+        "Adding 1 users to and removing 1 users from the departing employee detection list."
+        in result.output
+    )
+
+
+def test_bulk_sync_when_list_matches_file_makes_no_changes(runner, cli_state):
+    _set_up_sync(cli_state, ["listed_user"])
+    with runner.isolated_filesystem():
+        with open("test_sync.csv", "w") as csv:
+            csv.writelines(
+                ["username,cloud_alias,departure_date,notes\n", "listed_user,,,\n"]
+            )
+        result = runner.invoke(
+            cli, ["departing-employee", "bulk", "sync", "test_sync.csv"], obj=cli_state
+        )
+    assert result.exit_code == 0
+    assert not cli_state.sdk.detectionlists.departing_employee.add.call_count
+    assert not cli_state.sdk.detectionlists.departing_employee.remove.call_count
+
+
+def test_bulk_sync_when_resuming_errors(runner, cli_state):
+    _set_up_sync(cli_state, [])
+    with runner.isolated_filesystem():
+        with open("test_sync.csv", "w") as csv:
+            csv.writelines(["username,cloud_alias,departure_date,notes\n"])
+        result = runner.invoke(
+            cli,
+            ["departing-employee", "bulk", "sync", "test_sync.csv", "--resume", "job"],
+            obj=cli_state,
+        )
+    assert result.exit_code == 1
+    assert "Bulk sync jobs can't be resumed." in result.output
+
+
+def test_bulk_sync_when_changes_fail_writes_rejects_for_bulk_add_and_remove(
+    runner, cli_state, bulk_jobs_dir
+):
+    _set_up_sync(cli_state, ["departed_user"])
+    cli_state.sdk.detectionlists.departing_employee.add.side_effect = Exception(
+        "Failed"
+    )
+    cli_state.sdk.detectionlists.departing_employee.remove.side_effect = Exception(
+        "Failed"
+    )
+    with runner.isolated_filesystem():
+        with open("test_sync.csv", "w") as csv:
+            csv.writelines(
+                [
+                    "username,cloud_alias,departure_date,notes\n",
+                    "new_user,alias,2020-02-01,some notes\n",
+                ]
+            )
+        result = runner.invoke(
+            cli, ["departing-employee", "bulk", "sync", "test_sync.csv"], obj=cli_state
+        )
+    assert result.exit_code == 1
+    assert "--resume" not in result.output
+    assert "departing-employee bulk add` on the file" in result.output
+    assert "departing-employee bulk remove` on the file" in result.output
+    rejects = {}
+    for kind in ("add", "remove"):
+        (path,) = glob(os.path.join(bulk_jobs_dir, "*_{}_rejects.csv".format(kind)))
+        with open(path) as f:
+            rejects[kind] = f.read().splitlines()
+    assert rejects["add"] == [
+        "username,cloud_alias,departure_date,notes,error_class,error_message,http_status",
+        "new_user,alias,2020-02-01,some notes,Exception,Failed,",
+    ]
+    assert rejects["remove"][1:] == ["departed_user"]
@@ -2,6 +2,7 @@ from py42.exceptions import Py42NotFoundError
 from requests import HTTPError
 from requests import Request
 from requests import Response
+from tests.cmds.conftest import mock_bulk_process
 from tests.cmds.conftest import TEST_EMPLOYEE
 from tests.cmds.conftest import thread_safe_side_effect
 from tests.conftest import TEST_ID
@@ -66,7 +67,7 @@ def test_add_high_risk_employee_when_given_risk_tags_adds_tags(
     )
     cli_state_with_user.sdk.detectionlists.add_user_risk_tags.assert_called_once_with(
         TEST_ID,
-        ("FLIGHT_RISK", "ELEVATED_ACCESS_PRIVILEGES", "POOR_SECURITY_PRACTICES"),
+        ["FLIGHT_RISK", "ELEVATED_ACCESS_PRIVILEGES", "POOR_SECURITY_PRACTICES"],
     )
 
 
@@ -181,7 +182,7 @@ def test_bulk_add_employees_calls_expected_py42_methods(runner, cli_state):
 
 
 def test_bulk_remove_employees_uses_expected_arguments(runner, cli_state, mocker):
-    bulk_processor = mocker.patch("{}.run_bulk_process".format(_NAMESPACE))
+    bulk_processor = mock_bulk_process(mocker, "{}.run_bulk_process".format(_NAMESPACE))
     with runner.isolated_filesystem():
         with open("test_remove.csv", "w") as csv:
             csv.writelines(["# username\n", "test@example.com\n", "test2@example.com"])
@@ -190,14 +191,14 @@ def test_bulk_remove_employees_uses_expected_arguments(runner, cli_state, mocker
             ["high-risk-employee", "bulk", "remove", "test_remove.csv"],
             obj=cli_state,
         )
-        assert bulk_processor.call_args[0][1] == [
+        assert bulk_processor.rows == [
             "test@example.com",
             "test2@example.com",
         ]
 
 
 def test_bulk_add_risk_tags_uses_expected_arguments(runner, cli_state, mocker):
-    bulk_processor = mocker.patch("{}.run_bulk_process".format(_NAMESPACE))
+    bulk_processor = mock_bulk_process(mocker, "{}.run_bulk_process".format(_NAMESPACE))
     with runner.isolated_filesystem():
         with open("test_add_risk_tags.csv", "w") as csv:
             csv.writelines(
@@ -208,14 +209,14 @@ def test_bulk_add_risk_tags_uses_expected_arguments(runner, cli_state, mocker):
             ["high-risk-employee", "bulk", "add-risk-tags", "test_add_risk_tags.csv"],
             obj=cli_state,
         )
-        assert bulk_processor.call_args[0][1] == [
+        assert bulk_processor.rows == [
             {"username": "test@example.com", "tag": "tag1"},
             {"username": "test2@example.com", "tag": "tag2"},
         ]
 
 
 def test_bulk_remove_risk_tags_uses_expected_arguments(runner, cli_state, mocker):
-    bulk_processor = mocker.patch("{}.run_bulk_process".format(_NAMESPACE))
+    bulk_processor = mock_bulk_process(mocker, "{}.run_bulk_process".format(_NAMESPACE))
     with runner.isolated_filesystem():
         with open("test_remove_risk_tags.csv", "w") as csv:
             csv.writelines(
@@ -231,7 +232,7 @@ def test_bulk_remove_risk_tags_uses_expected_arguments(runner, cli_state, mocker
             ],
             obj=cli_state,
         )
-        assert bulk_processor.call_args[0][1] == [
+        assert bulk_processor.rows == [
             {"username": "test@example.com", "tag": "tag1"},
             {"username": "test2@example.com", "tag": "tag2"},
         ]
@@ -253,3 +254,179 @@ def test_remove_high_risk_employee_when_user_not_on_list_prints_expected_error(
         )
         in result.output
     )
+
+
+def test_bulk_add_risk_tags_adds_tags_for_each_user_in_one_call(runner, cli_state):
+    add_user_risk_tags = thread_safe_side_effect()
+    cli_state.sdk.detectionlists.add_user_risk_tags.side_effect = add_user_risk_tags
+    cli_state.sdk.users.get_by_username.side_effect = lambda username: {
+        "users": [{"userUid": "{}-uid".format(username)}]
+    }
+    with runner.isolated_filesystem():
+        with open("test_add_risk_tags.csv", "w") as csv:
+            csv.writelines(
+                [
+                    "username,tag\n",
+                    "test@example.com,FLIGHT_RISK\n",
+                    "test2@example.com,HIGH_IMPACT_EMPLOYEE\n",
+                    "test@example.com,PERFORMANCE_CONCERNS FLIGHT_RISK\n",
+                ]
+            )
+        runner.invoke(
+            cli,
+            ["high-risk-employee", "bulk", "add-risk-tags", "test_add_risk_tags.csv"],
+            obj=cli_state,
+        )
+    assert add_user_risk_tags.call_count == 2
+    assert (
+        "test@example.com-uid",
+        ["FLIGHT_RISK", "PERFORMANCE_CONCERNS"],
+    ) in add_user_risk_tags.call_args_list
+    assert (
+        "test2@example.com-uid",
+        ["HIGH_IMPACT_EMPLOYEE"],
+    ) in add_user_risk_tags.call_args_list
+
+
+def test_bulk_add_risk_tags_when_row_has_invalid_tag_fails_only_that_row(
+    runner, cli_state
+):
+    add_user_risk_tags = thread_safe_side_effect()
+    cli_state.sdk.detectionlists.add_user_risk_tags.side_effect = add_user_risk_tags
+    cli_state.sdk.users.get_by_username.side_effect = lambda username: {
+        "users": [{"userUid": "{}-uid".format(username)}]
+    }
+    with runner.isolated_filesystem():
+        with open("test_add_risk_tags.csv", "w") as csv:
+            csv.writelines(
+                [
+                    "username,tag\n",
+                    "test@example.com,FLIGHT_RISK\n",
+                    "test@example.com,NOT_A_TAG\n",
+                ]
+            )
+        result = runner.invoke(
+            cli,
+            ["high-risk-employee", "bulk", "add-risk-tags", "test_add_risk_tags.csv"],
+            obj=cli_state,
+        )
+    assert add_user_risk_tags.call_args_list == [
+        ("test@example.com-uid", ["FLIGHT_RISK"])
+    ]
+    assert "Wrote 1 failed rows" in result.output
+
+
+def test_bulk_remove_risk_tags_removes_tags_for_each_user_in_one_call(
+    runner, cli_state
+):
+    remove_user_risk_tags = thread_safe_side_effect()
+    cli_state.sdk.detectionlists.remove_user_risk_tags.side_effect = (
+        remove_user_risk_tags
+    )
+    with runner.isolated_filesystem():
+        with open("test_remove_risk_tags.csv", "w") as csv:
+            csv.writelines(
+                [
+                    "username,tag\n",
+                    "test@example.com,FLIGHT_RISK\n",
+                    "test@example.com,HIGH_IMPACT_EMPLOYEE\n",
+                ]
+            )
+        runner.invoke(
+            cli,
+            [
+                "high-risk-employee",
+                "bulk",
+                "remove-risk-tags",
+                "test_remove_risk_tags.csv",
+            ],
+            obj=cli_state,
+        )
+    assert remove_user_risk_tags.call_count == 1
+    assert remove_user_risk_tags.call_args_list[0][1] == [
+        "FLIGHT_RISK",
+        "HIGH_IMPACT_EMPLOYEE",
+    ]
+
+
+def test_bulk_sync_adds_and_removes_only_users_that_differ(runner, cli_state):
+    cli_state.sdk.users.get_by_username.side_effect = lambda username: {
+        "users": [{"userUid": "{}_id".format(username)}]
+    }
+    cli_state.sdk.detectionlists.high_risk_employee.get_all.return_value = [
+        {
+            "items": [
+                {"userId": "listed_user_id", "userName": "listed_user"},
+                {"userId": "former_user_id", "userName": "former_user"},
+            ]
+        }
+    ]
+    hre_add_user = thread_safe_side_effect()
+    hre_remove_user = thread_safe_side_effect()
+    cli_state.sdk.detectionlists.high_risk_employee.add.side_effect = hre_add_user
+    cli_state.sdk.detectionlists.high_risk_employee.remove.side_effect = hre_remove_user
+    with runner.isolated_filesystem():
+        with open("test_sync.csv", "w") as csv:
+            csv.writelines(
+                [
+                    "username,cloud_alias,risk_tag,notes\n",
+                    "listed_user,,,\n",
+                    "new_user,,,\n",
+                ]
+            )
+        result = runner.invoke(
+            cli, ["high-risk-employee", "bulk", "sync", "test_sync.csv"], obj=cli_state
+        )
+    assert result.exit_code == 0
+    assert hre_add_user.call_args_list == [("new_user_id",)]
+    assert hre_remove_user.call_args_list == [("former_user_id",)]
+
+
+def test_bulk_add_risk_tags_when_dry_run_reports_problems_without_processing(
+    runner, mocker, cli_state
+):
+    bulk_processor = mock_bulk_process(mocker, "{}.run_bulk_process".format(_NAMESPACE))
+    with runner.isolated_filesystem():
+        with open("test.csv", "w") as csv:
+            csv.writelines(
+                [
+                    "username,tag\n",
+                    "test_user,FLIGHT_RISK\n",
+                    "test_user_2,NOT_A_TAG\n",
+                    ",PERFORMANCE_CONCERNS\n",
+                ]
+            )
+        result = runner.invoke(
+            cli,
+            ["high-risk-employee", "bulk", "add-risk-tags", "test.csv", "--dry-run"],
+            obj=cli_state,
+        )
+    assert result.exit_code == 1
+    assert "Line 3: tag: Invalid value NOT_A_TAG" in result.output
+    assert "Line 4: username: A value is required." in result.output
+    assert "Found 2 problems in test.csv." in result.output
+    assert not bulk_processor.call_count
+    assert not cli_state.sdk.mock_calls
+
+
+def test_bulk_add_when_validate_only_and_file_is_valid_does_not_process(
+    runner, mocker, cli_state
+):
+    bulk_processor = mock_bulk_process(mocker, "{}.run_bulk_process".format(_NAMESPACE))
+    with runner.isolated_filesystem():
+        with open("test.csv", "w") as csv:
+            csv.writelines(
+                [
+                    "username,cloud_alias,risk_tag,notes\n",
+                    "test_user,,FLIGHT_RISK HIGH_IMPACT_EMPLOYEE,\n",
+                ]
+            )
+        result = runner.invoke(
+            cli,
+            ["high-risk-employee", "bulk", "add", "test.csv", "--validate-only"],
+            obj=cli_state,
+        )
+    assert result.exit_code == 0
+    assert "No problems found in test.csv." in result.output
+    assert not bulk_processor.call_count
+    assert not cli_state.sdk.mock_calls
@@ -1,11 +1,16 @@
+import time
+from threading import Thread
+
 import pytest
 from py42.exceptions import Py42BadRequestError
 from py42.response import Py42Response
 from requests import HTTPError
 from requests import Response
+from tests.cmds.conftest import mock_bulk_process
 
 from code42cli import PRODUCT_NAME
 from code42cli.cmds.legal_hold import _check_matter_is_accessible
+from code42cli.cmds.legal_hold import _LegalHoldMembershipIndex
 from code42cli.main import cli
 
 
@@ -523,27 +528,23 @@ def test_show_matter_does_not_print_preservation_policy(
 
 
 def test_add_bulk_users_uses_expected_arguments(runner, mocker, cli_state):
-    bulk_processor = mocker.patch("{}.run_bulk_process".format(_NAMESPACE))
+    bulk_processor = mock_bulk_process(mocker, "{}.run_bulk_process".format(_NAMESPACE))
     with runner.isolated_filesystem():
         with open("test_add.csv", "w") as csv:
             csv.writelines(["matter_id,username\n", "test,value\n"])
         runner.invoke(cli, ["legal-hold", "bulk", "add", "test_add.csv"], obj=cli_state)
-    assert bulk_processor.call_args[0][1] == [
-        {"matter_id": "test", "username": "value"}
-    ]
+    assert bulk_processor.rows == [{"matter_id": "test", "username": "value"}]
 
 
 def test_remove_bulk_users_uses_expected_arguments(runner, mocker, cli_state):
-    bulk_processor = mocker.patch("{}.run_bulk_process".format(_NAMESPACE))
+    bulk_processor = mock_bulk_process(mocker, "{}.run_bulk_process".format(_NAMESPACE))
     with runner.isolated_filesystem():
         with open("test_remove.csv", "w") as csv:
             csv.writelines(["matter_id,username\n", "test,value\n"])
         runner.invoke(
             cli, ["legal-hold", "bulk", "remove", "test_remove.csv"], obj=cli_state
         )
-        assert bulk_processor.call_args[0][1] == [
-            {"matter_id": "test", "username": "value"}
-        ]
+        assert bulk_processor.rows == [{"matter_id": "test", "username": "value"}]
 
 
 def test_list_with_format_csv_returns_csv_format(
@@ -572,3 +573,129 @@ def test_list_with_csv_format_returns_no_response_when_response_is_empty(
     cli_state.sdk.legalhold.get_all_matters.return_value = empty_matters_response
     result = runner.invoke(cli, ["legal-hold", "list", "-f", "csv"], obj=cli_state)
     assert "Matter ID,Name,Description,Creator,Creation Date" not in result.output
+
+
+def test_bulk_add_when_given_worker_options_passes_them_to_bulk_process(
+    runner, mocker, cli_state
+):
+    bulk_processor = mocker.patch("{}.run_bulk_process".format(_NAMESPACE))
+    with runner.isolated_filesystem():
+        with open("test_add.csv", "w") as csv:
+            csv.writelines(["matter_id,username\n", "test,value\n"])
+        runner.invoke(
+            cli,
+            [
+                "legal-hold",
+                "bulk",
+                "add",
+                "test_add.csv",
+                "--min-workers",
+                "2",
+                "--max-workers",
+                "50",
+                "--max-attempts",
+                "5",
+                "--max-queue-size",
+                "100",
+            ],
+            obj=cli_state,
+        )
+    config = bulk_processor.call_args[1]["config"]
+    assert config.min_workers == 2
+    assert config.max_workers == 50
+    assert config.max_attempts == 5
+    assert config.max_queue_size == 100
+
+
+def test_bulk_add_when_given_resume_option_passes_job_id_to_bulk_process(
+    runner, mocker, cli_state
+):
+    bulk_processor = mocker.patch("{}.run_bulk_process".format(_NAMESPACE))
+    with runner.isolated_filesystem():
+        with open("test_add.csv", "w") as csv:
+            csv.writelines(["matter_id,username\n", "test,value\n"])
+        runner.invoke(
+            cli,
+            ["legal-hold", "bulk", "add", "test_add.csv", "--resume", "abc123"],
+            obj=cli_state,
+        )
+    config = bulk_processor.call_args[1]["config"]
+    assert config.resume == "abc123"
+
+
+def test_bulk_add_when_given_refresh_cache_option_sets_refresh_user_cache(
+    runner, mocker, cli_state
+):
+    mocker.patch("{}.run_bulk_process".format(_NAMESPACE))
+    with runner.isolated_filesystem():
+        with open("test_add.csv", "w") as csv:
+            csv.writelines(["matter_id,username\n", "test,value\n"])
+        runner.invoke(
+            cli,
+            ["legal-hold", "bulk", "add", "test_add.csv", "--refresh-cache"],
+            obj=cli_state,
+        )
+    assert cli_state.refresh_user_cache
+
+
+def test_bulk_remove_fetches_memberships_of_each_matter_once(
+    runner,
+    cli_state,
+    check_matter_accessible_success,
+    get_user_id_success,
+    active_legal_hold_memberships_response,
+):
+    cli_state.sdk.legalhold.get_all_matter_custodians.return_value = (
+        active_legal_hold_memberships_response
+    )
+    with runner.isolated_filesystem():
+        with open("test_remove.csv", "w") as csv:
+            csv.writelines(
+                [
+                    "matter_id,username\n",
+                    "{},{}\n".format(TEST_MATTER_ID, ACTIVE_TEST_USERNAME),
+                    "{},{}\n".format(TEST_MATTER_ID, "another@example.com"),
+                    "{},{}\n".format(TEST_MATTER_ID, "third@example.com"),
+                ]
+            )
+        runner.invoke(
+            cli, ["legal-hold", "bulk", "remove", "test_remove.csv"], obj=cli_state
+        )
+    assert cli_state.sdk.legalhold.get_all_matter_custodians.call_count == 1
+    assert cli_state.sdk.legalhold.remove_from_matter.call_count == 3
+
+
+def test_membership_index_when_looked_up_concurrently_fetches_matter_once(
+    sdk, active_legal_hold_memberships_response
+):
+    def get_custodians(*args, **kwargs):
+        time.sleep(0.05)
+        return active_legal_hold_memberships_response
+
+    sdk.legalhold.get_all_matter_custodians.side_effect = get_custodians
+    index = _LegalHoldMembershipIndex(sdk)
+    results = []
+    threads = [
+        Thread(
+            target=lambda: results.append(
+                index.get_membership_id(TEST_MATTER_ID, ACTIVE_TEST_USER_ID)
+            )
+        )
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sdk.legalhold.get_all_matter_custodians.call_count == 1
+    assert results == [TEST_LEGAL_HOLD_MEMBERSHIP_UID] * 5
+
+
+def test_membership_index_when_user_not_in_matter_returns_none(
+    sdk, active_legal_hold_memberships_response
+):
+    sdk.legalhold.get_all_matter_custodians.return_value = (
+        active_legal_hold_memberships_response
+    )
+    index = _LegalHoldMembershipIndex(sdk)
+    assert index.get_membership_id(TEST_MATTER_ID, INACTIVE_TEST_USER_ID) is None
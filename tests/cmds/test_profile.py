@@ -439,3 +439,41 @@ def test_use_profile(runner, mock_cliprofile_namespace, profile):
     assert (
         "{} has been set as the default profile.".format(profile.name) in result.output
     )
+
+
+def test_update_profile_when_given_rate_limit_updates_rate_limit(
+    runner, mock_cliprofile_namespace, user_disagreement, profile
+):
+    name = "foo"
+    profile.name = name
+    mock_cliprofile_namespace.get_profile.return_value = profile
+    runner.invoke(
+        cli,
+        [
+            "profile",
+            "update",
+            "-n",
+            name,
+            "-s",
+            "bar",
+            "-u",
+            "baz",
+            "--rate-limit",
+            "5",
+            "--rate-limit-burst",
+            "10",
+        ],
+    )
+    mock_cliprofile_namespace.update_rate_limit.assert_called_once_with(name, 5.0, 10)
+
+
+def test_update_profile_when_not_given_rate_limit_does_not_update_rate_limit(
+    runner, mock_cliprofile_namespace, user_disagreement, profile
+):
+    name = "foo"
+    profile.name = name
+    mock_cliprofile_namespace.get_profile.return_value = profile
+    runner.invoke(
+        cli, ["profile", "update", "-n", name, "-s", "bar", "-u", "baz"],
+    )
+    assert not mock_cliprofile_namespace.update_rate_limit.call_count
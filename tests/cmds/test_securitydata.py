@@ -11,6 +11,7 @@ from tests.conftest import get_test_date_str
 
 from code42cli import errors
 from code42cli import PRODUCT_NAME
+from code42cli.cmds.search import extraction
 from code42cli.cmds.search.cursor_store import FileEventCursorStore
 from code42cli.main import cli
 
@@ -102,6 +103,86 @@ def test_search_when_is_advanced_query_uses_only_the_extract_advanced_method(
     assert file_event_extractor.extract_advanced.call_count == 1
 
 
+def test_search_with_ndjson_format_uses_ndjson_format(
+    mocker, runner, cli_state, file_event_extractor
+):
+    formatter = mocker.patch(
+        "{}.cmds.securitydata.FileEventsOutputFormatter".format(PRODUCT_NAME)
+    )
+    result = runner.invoke(
+        cli, ["security-data", "search", "--begin", "1d", "-f", "ndjson"], obj=cli_state
+    )
+    assert result.exit_code == 0
+    assert formatter.call_args[0][0] == "NDJSON"
+
+
+def test_search_with_parquet_format_writes_to_output_file_and_closes_it(
+    mocker, runner, cli_state, file_event_extractor
+):
+    formatter = mocker.patch(
+        "{}.cmds.securitydata.FileEventsOutputFormatter".format(PRODUCT_NAME)
+    )
+    result = runner.invoke(
+        cli,
+        [
+            "security-data",
+            "search",
+            "--begin",
+            "1d",
+            "-f",
+            "parquet",
+            "--output-file",
+            "events.parquet",
+        ],
+        obj=cli_state,
+    )
+    assert result.exit_code == 0
+    assert formatter.call_args[0][0] == "PARQUET"
+    assert formatter.call_args[1]["output_file"] == "events.parquet"
+    assert formatter.return_value.close.call_count == 1
+
+
+def test_search_with_parquet_format_and_no_output_file_errors(
+    runner, cli_state, file_event_extractor
+):
+    result = runner.invoke(
+        cli,
+        ["security-data", "search", "--begin", "1d", "-f", "PARQUET"],
+        obj=cli_state,
+    )
+    assert result.exit_code == 1
+    assert "--output-file is required for --format PARQUET." in result.output
+    assert file_event_extractor.extract.call_count == 0
+
+
+def test_search_with_output_file_and_not_parquet_format_errors(
+    runner, cli_state, file_event_extractor
+):
+    result = runner.invoke(
+        cli,
+        ["security-data", "search", "--begin", "1d", "--output-file", "out.csv"],
+        obj=cli_state,
+    )
+    assert result.exit_code == 1
+    assert "--output-file is only allowed for --format PARQUET." in result.output
+
+
+def test_search_uses_file_event_csv_columns(
+    mocker, runner, cli_state, file_event_extractor
+):
+    formatter = mocker.patch(
+        "{}.cmds.securitydata.FileEventsOutputFormatter".format(PRODUCT_NAME)
+    )
+    runner.invoke(
+        cli, ["security-data", "search", "--begin", "1d", "-f", "CSV"], obj=cli_state
+    )
+    columns = formatter.call_args[0][2]
+    assert formatter.call_args[1]["streaming"]
+    assert columns[:3] == ["fileName", "filePath", "eventType"]
+    assert "eventId" in columns
+    assert len(columns) == len(set(columns))
+
+
 @pytest.mark.parametrize(
     "command",
     (
@@ -117,6 +198,31 @@ def test_search_when_is_not_advanced_query_uses_only_the_extract_advanced_method
     assert file_event_extractor.extract.call_count == 1
 
 
+@pytest.mark.parametrize(
+    "command",
+    (
+        ["security-data", "search", "--begin", "1d"],
+        ["security-data", "send-to", "0.0.0.0", "--begin", "1d"],
+    ),
+)
+def test_search_runs_extractor_in_background_with_pipeline_handlers(
+    mocker, runner, cli_state, file_event_extractor, command
+):
+    extract_in_background = mocker.patch(
+        "{}.cmds.securitydata.ext.extract_in_background".format(PRODUCT_NAME),
+        wraps=extraction.extract_in_background,
+    )
+    extractor_factory = mocker.patch(
+        "{}.cmds.securitydata._get_file_event_extractor".format(PRODUCT_NAME),
+        return_value=file_event_extractor,
+    )
+    runner.invoke(cli, command, obj=cli_state)
+    assert extract_in_background.call_count == 1
+    extraction_handlers = extractor_factory.call_args[0][1]
+    assert isinstance(extraction_handlers, extraction._PipelineHandlers)
+    assert file_event_extractor.extract.call_count == 1
+
+
 @pytest.mark.parametrize(
     "arg",
     [
@@ -3,9 +3,14 @@ import json
 import pytest
 from c42eventextractor.maps import FILE_EVENT_TO_SIGNATURE_ID_MAP
 
+import code42cli.cmds.securitydata_output_formats as securitydata_output_formats
 from code42cli.cmds.search.enums import FileEventsOutputFormat
+from code42cli.cmds.search.schemas import FILE_EVENT_FIELDS
 from code42cli.cmds.securitydata_output_formats import FileEventsOutputFormatter
+from code42cli.cmds.securitydata_output_formats import get_file_event_columns
+from code42cli.cmds.securitydata_output_formats import ParquetFileWriter
 from code42cli.cmds.securitydata_output_formats import to_cef
+from code42cli.errors import Code42CLIError
 
 
 AED_CLOUD_ACTIVITY_EVENT_DICT = json.loads(
@@ -127,12 +132,11 @@ def mock_to_cef(mocker):
 
 class TestFileEventsOutputFormatter:
     def test_init_sets_format_func_to_dynamic_csv_function_when_csv_option_is_passed(
-        self, mock_to_csv
+        self,
     ):
         formatter = FileEventsOutputFormatter(FileEventsOutputFormat.CSV)
-        for _ in formatter.get_formatted_output("TEST"):
-            pass
-        mock_to_csv.assert_called_once_with("TEST")
+        output = "".join(formatter.get_formatted_output([{"TEST": "FOOBAR"}]))
+        assert output == "TEST\r\nFOOBAR\r\n"
 
     def test_init_sets_format_func_to_formatted_json_function_when_json__option_is_passed(
         self, mock_to_formatted_json
@@ -571,3 +575,56 @@ def event_name_assigned_correct_signature_id(event_name, signature_id, cef_out):
         return cef_parts[4] == signature_id and cef_parts[5] == event_name
 
     return False
+
+
+def test_get_file_event_columns_has_a_column_for_each_known_field():
+    columns = get_file_event_columns([AED_EVENT_DICT, {"unknownField": "x"}])
+    assert list(columns) == list(FILE_EVENT_FIELDS)
+    assert all(len(values) == 2 for values in columns.values())
+    assert columns["eventId"] == [AED_EVENT_DICT["eventId"], None]
+
+
+def test_get_file_event_columns_flattens_shared_with_to_cloud_usernames():
+    columns = get_file_event_columns([AED_CLOUD_ACTIVITY_EVENT_DICT])
+    assert columns["sharedWith"] == [["example1@example.com", "example2@example.com"]]
+
+
+def test_get_file_event_columns_converts_values_to_column_types():
+    event = {
+        "fileSize": "86",
+        "removableMediaCapacity": None,
+        "outsideActiveHours": "TRUE",
+        "trusted": False,
+        "exposure": "ApplicationRead",
+        "fieldErrors": [{"field": "fileSize"}],
+        "publicIpAddress": 7,
+    }
+    columns = get_file_event_columns([event])
+    assert columns["fileSize"] == [86]
+    assert columns["removableMediaCapacity"] == [None]
+    assert columns["outsideActiveHours"] == [True]
+    assert columns["trusted"] == [False]
+    assert columns["exposure"] == [["ApplicationRead"]]
+    assert columns["fieldErrors"] == ['[{"field": "fileSize"}]']
+    assert columns["publicIpAddress"] == ["7"]
+
+
+def test_parquet_file_writer_when_pyarrow_not_installed_raises_cli_error(mocker):
+    mocker.patch.object(securitydata_output_formats, "pyarrow", None)
+    with pytest.raises(Code42CLIError) as err:
+        ParquetFileWriter("events.parquet")
+    assert "pyarrow" in err.value.message
+
+
+def test_parquet_file_writer_writes_a_row_group_for_each_page(tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "events.parquet")
+    writer = ParquetFileWriter(path)
+    assert list(writer.format([AED_EVENT_DICT])) == []
+    list(writer.format([AED_CLOUD_ACTIVITY_EVENT_DICT, AED_EVENT_DICT]))
+    writer.close()
+    parquet_file = parquet.ParquetFile(path)
+    assert parquet_file.num_row_groups == 2
+    table = parquet_file.read()
+    assert table.num_rows == 3
+    assert table.column("fileSize").to_pylist() == [86, None, 86]
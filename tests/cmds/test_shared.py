@@ -1,9 +1,62 @@
 import pytest
 
+from code42cli.cmds.shared import cache_user_ids
+from code42cli.cmds.shared import enable_user_id_cache
 from code42cli.cmds.shared import get_user_id
 from code42cli.errors import UserDoesNotExistError
+from code42cli.user_cache import UserIdCache
+
+
+@pytest.fixture
+def user_cache():
+    cache = UserIdCache("test_profile")
+    yield cache
+    cache.close()
 
 
 def test_get_user_id_when_user_does_not_raise_error(sdk_without_user):
     with pytest.raises(UserDoesNotExistError):
         get_user_id(sdk_without_user, "risky employee")
+
+
+def test_get_user_id_when_user_in_persistent_cache_does_not_look_up_user(
+    sdk_with_user, user_cache
+):
+    user_cache.set("cached employee", "cached-uid")
+    enable_user_id_cache(sdk_with_user, user_cache)
+    assert get_user_id(sdk_with_user, "cached employee") == "cached-uid"
+    assert not sdk_with_user.users.get_by_username.call_count
+
+
+def test_get_user_id_when_user_not_in_persistent_cache_caches_looked_up_id(
+    sdk_with_user, user_cache
+):
+    enable_user_id_cache(sdk_with_user, user_cache)
+    user_id = get_user_id(sdk_with_user, "uncached employee")
+    sdk_with_user.users.get_by_username.assert_called_once_with("uncached employee")
+    assert user_cache.get("uncached employee") == user_id
+
+
+def test_cache_user_ids_when_no_cache_enabled_caches_for_current_invocation(
+    sdk_with_user,
+):
+    cache_user_ids(sdk_with_user, [("prefetched employee", "prefetched-uid")])
+    assert get_user_id(sdk_with_user, "prefetched employee") == "prefetched-uid"
+    assert not sdk_with_user.users.get_by_username.call_count
+
+
+def test_cache_user_ids_when_persistent_cache_enabled_stores_in_persistent_cache(
+    sdk_with_user, user_cache
+):
+    enable_user_id_cache(sdk_with_user, user_cache)
+    cache_user_ids(sdk_with_user, [("prefetched employee", "prefetched-uid")])
+    assert user_cache.get("prefetched employee") == "prefetched-uid"
+
+
+def test_get_user_id_when_user_does_not_exist_only_looks_up_user_once(
+    sdk_without_user,
+):
+    for _ in range(3):
+        with pytest.raises(UserDoesNotExistError):
+            get_user_id(sdk_without_user, "missing employee")
+    assert sdk_without_user.users.get_by_username.call_count == 1
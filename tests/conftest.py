@@ -6,6 +6,7 @@ from click.testing import CliRunner
 from py42.sdk import SDKClient
 
 import code42cli.errors as error_tracker
+from code42cli.bulk import BulkConfig
 from code42cli.config import ConfigAccessor
 from code42cli.options import CLIState
 from code42cli.profile import Code42Profile
@@ -92,7 +93,10 @@ def create_profile_values_dict(authority=None, username=None, ignore_ssl=False):
 
 @pytest.fixture
 def sdk(mocker):
-    return mocker.MagicMock(spec=SDKClient)
+    sdk = mocker.MagicMock(spec=SDKClient)
+    # A tenant too large for bulk commands to prefetch users, unless a test says otherwise.
+    sdk.users.get_page.return_value = {"totalCount": 1000000}
+    return sdk
 
 
 @pytest.fixture
@@ -119,6 +123,8 @@ def cli_state(mocker, sdk, profile):
     mock_state.profile = profile
     mock_state.search_filters = []
     mock_state.assume_yes = False
+    mock_state.bulk_config = BulkConfig()
+    mock_state.sdk.users.get_page.return_value = {"totalCount": 1000000}
     return mock_state
 
 
@@ -136,6 +142,9 @@ class MockSection:
     def get(self, item):
         return self.values_dict.get(item)
 
+    def pop(self, item, default=None):
+        return self.values_dict.pop(item, default)
+
 
 def create_mock_profile(name="Test Profile Name"):
     profile_section = MockSection(name)
@@ -153,6 +162,7 @@ def setup_mock_accessor(mock_accessor, name=None, values_dict=None):
 def profile(mocker):
     mock = mocker.MagicMock(spec=Code42Profile)
     mock.name = "testcliprofile"
+    mock.rate_limit = None
     return mock
 
 
@@ -265,3 +275,17 @@ def mock_to_json(mocker):
 @pytest.fixture
 def mock_to_formatted_json(mocker):
     return mocker.patch("code42cli.output_formats.to_formatted_json")
+
+
+@pytest.fixture(autouse=True)
+def bulk_jobs_dir(mocker, tmp_path):
+    path = str(tmp_path)
+    mocker.patch("code42cli.bulk_jobs.get_bulk_jobs_dir", return_value=path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def user_cache_dir(mocker, tmp_path):
+    path = str(tmp_path)
+    mocker.patch("code42cli.user_cache.get_user_cache_dir", return_value=path)
+    return path
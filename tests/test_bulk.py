@@ -1,11 +1,24 @@
+import io
 from collections import OrderedDict
 
 import pytest
+from py42.exceptions import Py42HTTPError
+from requests import Response
 
 from code42cli import errors
 from code42cli import PRODUCT_NAME
+from code42cli.bulk import BulkConfig
 from code42cli.bulk import BulkProcessor
+from code42cli.bulk import prefetch_user_ids
 from code42cli.bulk import run_bulk_process
+from code42cli.bulk_jobs import BulkRejectsWriter
+from code42cli.bulk_jobs import create_job_journal
+from code42cli.bulk_jobs import get_rejects_path
+from code42cli.bulk_validation import one_or_more_of
+from code42cli.cmds.shared import cache_user_ids
+from code42cli.cmds.shared import get_user_id
+from code42cli.file_readers import read_csv
+from code42cli.file_readers import read_flat_file
 from code42cli.logger import get_view_error_details_message
 
 _NAMESPACE = "{}.bulk".format(PRODUCT_NAME)
@@ -40,8 +53,23 @@ def test_run_bulk_process_calls_run(bulk_processor, bulk_processor_factory):
 def test_run_bulk_process_creates_processor(bulk_processor_factory):
     errors.ERRORED = False
     rows = [1, 2]
-    run_bulk_process(func_with_one_arg, rows)
-    bulk_processor_factory.assert_called_once_with(func_with_one_arg, rows, None)
+    config = BulkConfig()
+    run_bulk_process(func_with_one_arg, rows, config=config)
+    bulk_processor_factory.assert_called_once_with(
+        func_with_one_arg, rows, None, config, None, None, None, False
+    )
+
+
+def test_run_bulk_process_when_min_workers_greater_than_max_workers_raises_cli_error(
+    bulk_processor_factory,
+):
+    config = BulkConfig()
+    config.min_workers = 10
+    config.max_workers = 5
+    with pytest.raises(errors.Code42CLIError) as err:
+        run_bulk_process(func_with_one_arg, [1, 2], config=config)
+    assert str(err.value) == "--min-workers can't be greater than --max-workers."
+    assert not bulk_processor_factory.call_count
 
 
 class TestBulkProcessor:
@@ -153,3 +181,371 @@ class TestBulkProcessor:
         processor.run()
         assert (None, "foo") in processed_rows
         assert ("bar", None) in processed_rows
+
+    def test_run_when_rows_have_total_bytes_completes_progress_in_bytes(self, tmp_path):
+        processed_rows = []
+
+        def func_for_bulk(test):
+            processed_rows.append(test)
+
+        text = "# header\nrow1\nrow2\n"
+        path = tmp_path / "test.txt"
+        path.write_text(text)
+        with open(str(path)) as file:
+            processor = BulkProcessor(func_for_bulk, read_flat_file(file))
+            processor.run()
+        assert set(processed_rows) == {"row1", "row2"}
+        assert processor._progress_bar.length == len(text)
+        assert processor._progress_bar.pos == len(text)
+
+    def test_run_when_rows_have_unknown_length_processes_rows(self):
+        processed_rows = []
+
+        def func_for_bulk(test):
+            processed_rows.append(test)
+
+        processor = BulkProcessor(func_for_bulk, iter(["row1", "row2"]))
+        processor.run()
+        assert set(processed_rows) == {"row1", "row2"}
+        assert str(processor._stats) == "2 succeeded, 0 failed"
+
+    def test_run_never_queues_more_rows_than_max_queue_size(self):
+        queue_depths = []
+
+        def func_for_bulk(test):
+            queue_depths.append(processor._BulkProcessor__worker.queue_depth)
+
+        config = BulkConfig()
+        config.max_workers = 1
+        config.max_queue_size = 2
+        processor = BulkProcessor(
+            func_for_bulk, ["row{}".format(i) for i in range(50)], config=config
+        )
+        processor.run()
+        assert processor._stats.total_processed == 50
+        assert max(queue_depths) <= 2
+
+    def test_run_retries_rows_that_fail_with_transient_http_errors(self, mocker):
+        response = mocker.MagicMock(spec=Response)
+        response.status_code = 503
+        failures = [Py42HTTPError(mocker.MagicMock(response=response))]
+        mocker.patch("code42cli.worker.random.uniform", return_value=0)
+
+        def func_for_bulk(test):
+            if failures:
+                raise failures.pop()
+
+        config = BulkConfig()
+        config.max_attempts = 2
+        processor = BulkProcessor(
+            func_for_bulk, ["row1"], config=config, retry_rows=True
+        )
+        processor.run()
+        assert str(processor._stats) == "1 succeeded, 0 failed out of 1"
+
+    def test_run_when_not_retrying_rows_does_not_repeat_changes_of_row_that_fails_partway(
+        self, mocker
+    ):
+        response = mocker.MagicMock(spec=Response)
+        response.status_code = 503
+        response.request = None
+        failures = [Py42HTTPError(mocker.MagicMock(response=response))]
+        changes = []
+
+        def func_for_bulk(test):
+            changes.append("add")
+            if failures:
+                raise failures.pop()
+            changes.append("update")
+
+        config = BulkConfig()
+        config.max_attempts = 2
+        processor = BulkProcessor(func_for_bulk, ["row1"], config=config)
+        with pytest.raises(errors.LoggedCLIError):
+            processor.run()
+        assert changes == ["add"]
+        assert str(processor._stats) == "0 succeeded, 1 failed out of 1"
+
+    def test_run_when_all_rows_succeed_deletes_journal(self, mock_remove):
+        journal = create_job_journal()
+        processor = BulkProcessor(lambda test: None, ["row1"], journal=journal)
+        processor.run()
+        mock_remove.assert_called_once_with(journal.path)
+
+    def test_run_when_rows_fail_keeps_journal_with_outcomes(self, mock_remove):
+        def func_for_bulk(test):
+            if test == "row2":
+                raise Exception()
+
+        journal = create_job_journal()
+        processor = BulkProcessor(func_for_bulk, ["row1", "row2"], journal=journal)
+        with pytest.raises(errors.LoggedCLIError):
+            processor.run()
+        with open(journal.path) as f:
+            assert sorted(f.read().splitlines()[1:]) == ["0 S", "1 F"]
+        assert not mock_remove.call_count
+
+    def test_run_when_resuming_skips_rows_that_already_succeeded(self, capsys):
+        journal = create_job_journal()
+        journal.record(0, True)
+        journal.record(1, False)
+        journal.close()
+        processed_rows = []
+
+        def func_for_bulk(test):
+            processed_rows.append(test)
+
+        config = BulkConfig()
+        config.resume = journal.job_id
+        processor = BulkProcessor(
+            func_for_bulk, ["row1", "row2", "row3"], config=config
+        )
+        processor.run()
+        assert set(processed_rows) == {"row2", "row3"}
+        output = capsys.readouterr().out
+        assert "Resuming bulk job {}.".format(journal.job_id) in output
+        assert "Skipped 1 rows that succeeded in a previous run." in output
+
+    def test_run_prints_job_id_for_resuming(self, capsys):
+        journal = create_job_journal()
+        processor = BulkProcessor(lambda test: None, ["row1"], journal=journal)
+        processor.run()
+        output = capsys.readouterr().out
+        assert "--resume {}".format(journal.job_id) in output
+
+    def test_run_when_rows_fail_writes_failed_rows_to_rejects_file(self, capsys):
+        def func_for_bulk(test):
+            if test == "row2":
+                raise Exception("Failed")
+
+        journal = create_job_journal()
+        rejects = BulkRejectsWriter(get_rejects_path(journal.job_id))
+        processor = BulkProcessor(
+            func_for_bulk, ["row1", "row2"], journal=journal, rejects=rejects
+        )
+        with pytest.raises(errors.LoggedCLIError):
+            processor.run()
+        with open(rejects.path) as f:
+            assert f.read().splitlines()[1:] == ["row2"]
+        assert rejects.path in capsys.readouterr().out
+
+    def test_run_when_csv_rows_fail_writes_rows_with_errors_to_rejects_file(self):
+        def func_for_bulk(test1, test2):
+            raise Exception("Failed")
+
+        journal = create_job_journal()
+        rejects = BulkRejectsWriter(get_rejects_path(journal.job_id))
+        processor = BulkProcessor(
+            func_for_bulk,
+            [{"test1": "foo", "test2": ""}],
+            journal=journal,
+            rejects=rejects,
+        )
+        with pytest.raises(errors.LoggedCLIError):
+            processor.run()
+        with open(rejects.path) as f:
+            lines = f.read().splitlines()
+        assert lines == [
+            "test1,test2,error_class,error_message,http_status",
+            "foo,,Exception,Failed,",
+        ]
+
+
+def _create_user_pages(usernames, page_size=2):
+    users = [
+        {"username": username, "userUid": "{}-uid".format(username)}
+        for username in usernames
+    ]
+    return [
+        {"users": users[i : i + page_size]} for i in range(0, len(users), page_size)
+    ]
+
+
+@pytest.fixture
+def items_per_page(mocker):
+    mocker.patch("py42.settings.items_per_page", 2)
+
+
+class TestPrefetchUserIds:
+    def test_prefetch_user_ids_when_more_usernames_than_user_pages_fetches_all_users(
+        self, sdk, items_per_page
+    ):
+        usernames = ["user{}".format(i) for i in range(5)]
+        sdk.users.get_page.return_value = {"totalCount": 6}
+        sdk.users.get_all.return_value = _create_user_pages(usernames)
+        rows = [{"username": username, "matter_id": "1"} for username in usernames]
+        prefetch_user_ids(sdk, rows)
+        sdk.users.get_page.assert_called_once_with(1, page_size=1)
+        sdk.users.get_all.assert_called_once_with()
+        assert get_user_id(sdk, "user4") == "user4-uid"
+        assert not sdk.users.get_by_username.call_count
+
+    def test_prefetch_user_ids_when_no_more_usernames_than_user_pages_does_not_fetch_users(
+        self, sdk, items_per_page
+    ):
+        sdk.users.get_page.return_value = {"totalCount": 5}
+        rows = [{"username": "user{}".format(i)} for i in range(3)]
+        prefetch_user_ids(sdk, rows)
+        assert not sdk.users.get_all.call_count
+
+    def test_prefetch_user_ids_when_tenant_is_large_does_not_fetch_users(
+        self, sdk, mocker
+    ):
+        mocker.patch("py42.settings.items_per_page", 500)
+        sdk.users.get_page.return_value = {"totalCount": 500000}
+        rows = [{"username": "user{}".format(i)} for i in range(201)]
+        prefetch_user_ids(sdk, rows)
+        assert not sdk.users.get_all.call_count
+
+    def test_prefetch_user_ids_counts_each_username_once(self, sdk, items_per_page):
+        sdk.users.get_page.return_value = {"totalCount": 4}
+        rows = ["user1", "user1 ", "user2", "user2", "user2"]
+        prefetch_user_ids(sdk, rows)
+        assert not sdk.users.get_all.call_count
+
+    def test_prefetch_user_ids_when_flat_rows_fetches_all_users(
+        self, sdk, items_per_page
+    ):
+        sdk.users.get_page.return_value = {"totalCount": 2}
+        sdk.users.get_all.return_value = _create_user_pages(["user1", "user2"])
+        prefetch_user_ids(sdk, ["user1\n", "user2\n"])
+        sdk.users.get_all.assert_called_once_with()
+
+    def test_prefetch_user_ids_does_not_count_usernames_already_cached(
+        self, sdk, items_per_page
+    ):
+        sdk.users.get_page.return_value = {"totalCount": 2}
+        cache_user_ids(sdk, [("user1", "user1-uid"), ("user2", "user2-uid")])
+        prefetch_user_ids(sdk, ["user1", "user2", "user3"])
+        assert not sdk.users.get_page.call_count
+        assert not sdk.users.get_all.call_count
+
+    def test_prefetch_user_ids_when_rows_not_rewindable_does_not_read_rows(
+        self, sdk, mocker
+    ):
+        rows = mocker.MagicMock(is_rewindable=False)
+        prefetch_user_ids(sdk, rows)
+        assert not rows.__iter__.call_count
+        assert not sdk.users.get_all.call_count
+
+    def test_prefetch_user_ids_when_fetching_users_fails_does_not_raise(
+        self, sdk, mocker, items_per_page
+    ):
+        response = mocker.MagicMock(spec=Response)
+        response.status_code = 403
+        sdk.users.get_page.return_value = {"totalCount": 2}
+        sdk.users.get_all.side_effect = Py42HTTPError(
+            mocker.MagicMock(response=response)
+        )
+        prefetch_user_ids(sdk, ["user1", "user2", "user3"])
+
+    def test_prefetch_user_ids_when_counting_users_fails_does_not_raise(
+        self, sdk, mocker
+    ):
+        response = mocker.MagicMock(spec=Response)
+        response.status_code = 403
+        sdk.users.get_page.side_effect = Py42HTTPError(
+            mocker.MagicMock(response=response)
+        )
+        prefetch_user_ids(sdk, ["user1", "user2"])
+        assert not sdk.users.get_all.call_count
+
+
+class TestBulkProcessorGroupBy:
+    def test_run_calls_row_handler_once_per_group(self):
+        processed_groups = []
+
+        def func_for_bulk(key, rows):
+            processed_groups.append((key, rows))
+
+        rows = [
+            {"username": "user1", "tag": "a"},
+            {"username": "user2", "tag": "b"},
+            {"username": "user1", "tag": ""},
+        ]
+        processor = BulkProcessor(func_for_bulk, rows, group_by="username")
+        processor.run()
+        assert len(processed_groups) == 2
+        assert (
+            "user1",
+            [{"username": "user1", "tag": "a"}, {"username": "user1", "tag": None}],
+        ) in processed_groups
+        assert ("user2", [{"username": "user2", "tag": "b"}]) in processed_groups
+
+    def test_run_reports_stats_for_each_row_in_group(self):
+        def func_for_bulk(key, rows):
+            if key == "user1":
+                raise Exception()
+
+        rows = [
+            {"username": "user1", "tag": "a"},
+            {"username": "user2", "tag": "b"},
+            {"username": "user1", "tag": "c"},
+        ]
+        processor = BulkProcessor(func_for_bulk, rows, group_by="username")
+        with pytest.raises(errors.LoggedCLIError):
+            processor.run()
+        assert str(processor._stats) == "1 succeeded, 2 failed out of 3"
+
+    def test_run_when_group_fails_records_each_row_of_group(self):
+        def func_for_bulk(key, rows):
+            if key == "user1":
+                raise Exception("Failed")
+
+        journal = create_job_journal()
+        rejects = BulkRejectsWriter(get_rejects_path(journal.job_id))
+        rows = [
+            {"username": "user1", "tag": "a"},
+            {"username": "user2", "tag": "b"},
+            {"username": "user1", "tag": "c"},
+        ]
+        processor = BulkProcessor(
+            func_for_bulk, rows, journal=journal, rejects=rejects, group_by="username"
+        )
+        with pytest.raises(errors.LoggedCLIError):
+            processor.run()
+        with open(journal.path) as f:
+            assert sorted(f.read().splitlines()[1:]) == ["0 F", "1 S", "2 F"]
+        assert rejects.total_rejected == 2
+
+    def test_run_when_row_fails_validation_fails_only_that_row_of_group(self):
+        processed_groups = []
+
+        def func_for_bulk(key, rows):
+            processed_groups.append((key, rows))
+
+        journal = create_job_journal()
+        rejects = BulkRejectsWriter(get_rejects_path(journal.job_id))
+        rows = read_csv(
+            io.StringIO("user1,a\nuser1,bad\nuser1,b\n"),
+            headers=["username", "tag"],
+            validators={"tag": one_or_more_of(["a", "b"])},
+        )
+        processor = BulkProcessor(
+            func_for_bulk, rows, journal=journal, rejects=rejects, group_by="username"
+        )
+        with pytest.raises(errors.LoggedCLIError):
+            processor.run()
+        assert processed_groups == [
+            (
+                "user1",
+                [{"username": "user1", "tag": "a"}, {"username": "user1", "tag": "b"}],
+            )
+        ]
+        with open(journal.path) as f:
+            assert sorted(f.read().splitlines()[1:]) == ["0 S", "1 F", "2 S"]
+        assert rejects.total_rejected == 1
+
+    def test_run_when_more_rows_than_group_window_dispatches_groups_per_window(
+        self, mocker
+    ):
+        mocker.patch("code42cli.bulk._MAX_GROUPED_ROWS", 2)
+        processed_groups = []
+
+        def func_for_bulk(key, rows):
+            processed_groups.append(key)
+
+        rows = [{"username": "user1"} for _ in range(5)]
+        processor = BulkProcessor(func_for_bulk, rows, group_by="username")
+        processor.run()
+        assert processed_groups == ["user1", "user1", "user1"]
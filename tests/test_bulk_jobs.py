@@ -0,0 +1,167 @@
+import csv
+import os
+
+import pytest
+from py42.exceptions import Py42BadRequestError
+
+from code42cli.bulk_jobs import BulkJobJournal
+from code42cli.bulk_jobs import BulkRejectsWriter
+from code42cli.bulk_jobs import create_job_journal
+from code42cli.bulk_jobs import get_rejects_path
+from code42cli.bulk_jobs import resume_job_journal
+from code42cli.errors import Code42CLIError
+from code42cli.file_readers import read_csv
+
+TEST_COMMAND = "code42 legal-hold bulk add"
+
+
+def test_create_job_journal_writes_command_header(bulk_jobs_dir):
+    journal = create_job_journal(command=TEST_COMMAND)
+    journal.close()
+    with open(os.path.join(bulk_jobs_dir, "{}.journal".format(journal.job_id))) as f:
+        assert f.read() == "# {}\n".format(TEST_COMMAND)
+
+
+def test_create_job_journal_generates_unique_job_ids():
+    first = create_job_journal()
+    second = create_job_journal()
+    first.close()
+    second.close()
+    assert first.job_id != second.job_id
+
+
+def test_record_appends_row_outcomes():
+    journal = create_job_journal(command=TEST_COMMAND)
+    journal.record(0, True)
+    journal.record(2, False)
+    journal.close()
+    with open(journal.path) as f:
+        assert f.read().splitlines()[1:] == ["0 S", "2 F"]
+
+
+def test_resume_job_journal_loads_only_succeeded_rows():
+    journal = create_job_journal(command=TEST_COMMAND)
+    journal.record(0, True)
+    journal.record(1, False)
+    journal.record(3, True)
+    journal.close()
+
+    resumed = resume_job_journal(journal.job_id, command=TEST_COMMAND)
+    assert resumed.has_succeeded(0)
+    assert not resumed.has_succeeded(1)
+    assert not resumed.has_succeeded(2)
+    assert resumed.has_succeeded(3)
+    assert resumed.total_succeeded == 2
+    resumed.close()
+
+
+def test_resume_job_journal_appends_to_existing_journal():
+    journal = create_job_journal(command=TEST_COMMAND)
+    journal.record(0, True)
+    journal.close()
+
+    resumed = resume_job_journal(journal.job_id, command=TEST_COMMAND)
+    resumed.record(1, True)
+    resumed.close()
+    with open(journal.path) as f:
+        assert f.read().splitlines()[1:] == ["0 S", "1 S"]
+
+
+def test_resume_job_journal_ignores_partially_written_lines():
+    journal = create_job_journal(command=TEST_COMMAND)
+    journal.record(0, True)
+    journal.close()
+    with open(journal.path, "a") as f:
+        f.write("1")
+
+    resumed = resume_job_journal(journal.job_id, command=TEST_COMMAND)
+    assert resumed.total_succeeded == 1
+    resumed.close()
+
+
+def test_resume_job_journal_when_job_does_not_exist_raises_cli_error():
+    with pytest.raises(Code42CLIError) as err:
+        resume_job_journal("doesnotexist", command=TEST_COMMAND)
+    assert str(err.value) == "No bulk job with ID 'doesnotexist' exists."
+
+
+def test_resume_job_journal_when_started_by_different_command_raises_cli_error():
+    journal = create_job_journal(command=TEST_COMMAND)
+    journal.close()
+    with pytest.raises(Code42CLIError) as err:
+        resume_job_journal(journal.job_id, command="code42 alert-rules bulk add")
+    assert "can't be resumed by 'code42 alert-rules bulk add'" in str(err.value)
+
+
+def test_journal_when_job_id_is_not_a_simple_name_raises_cli_error():
+    with pytest.raises(Code42CLIError):
+        BulkJobJournal("../config", resume=True)
+
+
+def test_delete_removes_journal_file(mock_remove):
+    journal = create_job_journal(command=TEST_COMMAND)
+    journal.delete()
+    mock_remove.assert_called_once_with(journal.path)
+
+
+def test_rejects_writer_when_nothing_rejected_does_not_create_file(bulk_jobs_dir):
+    writer = BulkRejectsWriter(get_rejects_path("abc123"))
+    writer.close()
+    assert not os.path.exists(writer.path)
+    assert writer.total_rejected == 0
+
+
+def test_rejects_writer_writes_csv_rows_with_error_columns():
+    writer = BulkRejectsWriter(
+        get_rejects_path("abc123"), fieldnames=["matter_id", "username"]
+    )
+    writer.write({"matter_id": "1", "username": "test"}, Code42CLIError("Failed"))
+    writer.close()
+    with open(writer.path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert rows == [
+        {
+            "matter_id": "1",
+            "username": "test",
+            "error_class": "Code42CLIError",
+            "error_message": "Failed",
+            "http_status": "",
+        }
+    ]
+    assert writer.total_rejected == 1
+
+
+def test_rejects_writer_includes_http_status_of_http_errors(mocker):
+    error = Py42BadRequestError(
+        mocker.MagicMock(response=mocker.MagicMock(status_code=400))
+    )
+    writer = BulkRejectsWriter(get_rejects_path("abc123"))
+    writer.write({"username": "test"}, error)
+    writer.close()
+    with open(writer.path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]["error_class"] == "Py42BadRequestError"
+    assert rows[0]["http_status"] == "400"
+
+
+def test_rejects_writer_writes_flat_rows_after_comment_line():
+    writer = BulkRejectsWriter(get_rejects_path("abc123"))
+    writer.write("test1 \n", Code42CLIError("Failed"))
+    writer.write("test2", Code42CLIError("Failed"))
+    writer.close()
+    with open(writer.path) as f:
+        lines = f.read().splitlines()
+    assert lines[0].startswith("#")
+    assert lines[1:] == ["test1", "test2"]
+
+
+def test_rejects_file_can_be_read_back_as_bulk_input():
+    writer = BulkRejectsWriter(
+        get_rejects_path("abc123"), fieldnames=["matter_id", "username"]
+    )
+    writer.write({"matter_id": "1", "username": "test"}, Code42CLIError("Failed"))
+    writer.close()
+    with open(writer.path) as f:
+        rows = list(read_csv(f, headers=["matter_id", "username"]))
+    assert rows[0]["matter_id"] == "1"
+    assert rows[0]["username"] == "test"
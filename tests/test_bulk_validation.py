@@ -0,0 +1,120 @@
+import io
+
+import pytest
+
+from code42cli.bulk_jobs import BulkRejectsWriter
+from code42cli.bulk_validation import all_of
+from code42cli.bulk_validation import date_format
+from code42cli.bulk_validation import one_or_more_of
+from code42cli.bulk_validation import required
+from code42cli.bulk_validation import run_validation
+from code42cli.bulk_validation import validate_rows
+from code42cli.errors import Code42CLIError
+from code42cli.file_readers import read_csv
+from code42cli.file_readers import read_flat_file
+
+HEADERS = ["username", "date", "tags"]
+VALIDATORS = {
+    "username": required,
+    "date": date_format("%Y-%m-%d"),
+    "tags": one_or_more_of(["A", "B"]),
+}
+
+
+def create_csv(text):
+    return read_csv(io.StringIO(text), headers=HEADERS, validators=VALIDATORS)
+
+
+@pytest.mark.parametrize("value", ["", None])
+def test_required_when_value_is_empty_returns_error(value):
+    assert required(value) == "A value is required."
+
+
+def test_required_when_value_is_given_returns_none():
+    assert required("test") is None
+
+
+def test_date_format_when_date_is_invalid_returns_error():
+    validate = date_format("%Y-%m-%d")
+    assert (
+        validate("2020-30-01") == "Invalid date 2020-30-01, valid date format %Y-%m-%d."
+    )
+
+
+@pytest.mark.parametrize("value", ["2020-01-30", "", None])
+def test_date_format_when_date_is_valid_or_empty_returns_none(value):
+    assert date_format("%Y-%m-%d")(value) is None
+
+
+def test_one_or_more_of_returns_error_listing_invalid_values():
+    validate = one_or_more_of(["A", "B"])
+    assert validate("A C D") == "Invalid value C, D, choose from A, B."
+
+
+@pytest.mark.parametrize("value", ["A B", "", None])
+def test_one_or_more_of_when_values_are_valid_or_empty_returns_none(value):
+    assert one_or_more_of(["A", "B"])(value) is None
+
+
+def test_all_of_returns_first_error():
+    validate = all_of(required, one_or_more_of(["A"]))
+    assert validate("") == "A value is required."
+    assert validate("B") == "Invalid value B, choose from A."
+    assert validate("A") is None
+
+
+def test_validate_rows_yields_problems_with_line_numbers():
+    rows = create_csv(
+        "username,date,tags\n"
+        "user1,2020-01-01,A\n"
+        ",2020-13-01,C\n"
+        "user3,2020-01-01\n"
+        "user4,,B\n"
+    )
+    assert list(validate_rows(rows)) == [
+        (3, "username: A value is required."),
+        (3, "date: Invalid date 2020-13-01, valid date format %Y-%m-%d."),
+        (3, "tags: Invalid value C, choose from A, B."),
+        (4, "Column count doesn't match expected headers: {}".format(HEADERS)),
+    ]
+
+
+def test_validate_rows_when_file_has_no_header_row_uses_line_numbers_from_first_line():
+    rows = create_csv("user1,2020-01-01,A\nuser2,bad,A\n")
+    assert list(validate_rows(rows)) == [
+        (2, "date: Invalid date bad, valid date format %Y-%m-%d.")
+    ]
+
+
+def test_validate_rows_when_row_has_extra_values_yields_no_problems():
+    rows = create_csv("username,date,tags\nuser1,2020-01-01,A,extra,values\n")
+    assert list(validate_rows(rows)) == []
+
+
+def test_validate_rows_when_file_is_rejects_file_yields_no_problems(tmp_path):
+    path = str(tmp_path / "rejects.csv")
+    rejects = BulkRejectsWriter(path, HEADERS)
+    rejects.write({"username": "user1", "date": "2020-01-01", "tags": "A"}, "Error")
+    rejects.close()
+    with open(path, newline="") as rejects_file:
+        rows = create_csv(rejects_file.read())
+    assert list(validate_rows(rows)) == []
+
+
+def test_validate_rows_when_flat_file_has_blank_line_yields_no_problems():
+    rows = read_flat_file(io.StringIO("# username\nuser1\n\nuser2\n"))
+    assert list(validate_rows(rows)) == []
+
+
+def test_run_validation_when_rows_are_valid_prints_success(capsys):
+    run_validation(create_csv("username,date,tags\nuser1,2020-01-01,A B\n"))
+    assert "No problems found" in capsys.readouterr().out
+
+
+def test_run_validation_when_rows_are_invalid_prints_problems_and_raises(capsys):
+    with pytest.raises(Code42CLIError) as err:
+        run_validation(create_csv("username,date,tags\nuser1,2020-01-01,C\n,,\n"))
+    output = capsys.readouterr().out
+    assert "Line 2: tags: Invalid value C, choose from A, B." in output
+    assert "Line 3: username: A value is required." in output
+    assert "Found 2 problems" in err.value.message
@@ -0,0 +1,120 @@
+import time
+from threading import Thread
+
+import pytest
+from py42.exceptions import Py42HTTPError
+from py42.exceptions import Py42NotFoundError
+from requests import HTTPError
+from requests import Response
+
+from code42cli.cache import single_flight_cache
+from code42cli.cache import SingleFlightCache
+
+
+def create_http_error(mocker, error_class, status_code):
+    err = mocker.MagicMock(spec=HTTPError)
+    err.response = mocker.MagicMock(spec=Response)
+    err.response.status_code = status_code
+    return error_class(err)
+
+
+class LoadCounter:
+    def __init__(self, value=None, error=None, delay=0):
+        self.calls = 0
+        self._value = value
+        self._error = error
+        self._delay = delay
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self._delay)
+        if self._error:
+            raise self._error
+        return self._value
+
+
+def test_get_returns_loaded_value():
+    cache = SingleFlightCache()
+    assert cache.get("key", lambda: "value") == "value"
+
+
+def test_get_when_key_cached_does_not_load_again():
+    cache = SingleFlightCache()
+    load = LoadCounter(value="value")
+    cache.get("key", load)
+    assert cache.get("key", load) == "value"
+    assert load.calls == 1
+
+
+def test_get_when_called_concurrently_for_same_key_loads_once():
+    cache = SingleFlightCache()
+    load = LoadCounter(value="value", delay=0.05)
+    results = []
+    threads = [
+        Thread(target=lambda: results.append(cache.get("key", load))) for _ in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert load.calls == 1
+    assert results == ["value"] * 10
+
+
+def test_get_when_load_raises_negative_error_caches_error(mocker):
+    cache = SingleFlightCache()
+    load = LoadCounter(error=create_http_error(mocker, Py42NotFoundError, 404))
+    for _ in range(3):
+        with pytest.raises(Py42NotFoundError):
+            cache.get("key", load)
+    assert load.calls == 1
+
+
+def test_get_when_load_raises_other_error_does_not_cache_error(mocker):
+    cache = SingleFlightCache()
+    load = LoadCounter(error=create_http_error(mocker, Py42HTTPError, 500))
+    for _ in range(3):
+        with pytest.raises(Py42HTTPError):
+            cache.get("key", load)
+    assert load.calls == 3
+    assert len(cache) == 0
+
+
+def test_get_when_over_maxsize_evicts_least_recently_used_key():
+    cache = SingleFlightCache(maxsize=2)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    cache.get("a", lambda: 1)
+    cache.get("c", lambda: 3)
+    load = LoadCounter(value=2)
+    cache.get("b", load)
+    assert load.calls == 1
+    assert len(cache) == 2
+
+
+def test_single_flight_cache_decorator_caches_by_positional_args():
+    calls = []
+
+    @single_flight_cache()
+    def double(value):
+        calls.append(value)
+        return value * 2
+
+    assert double(2) == 4
+    assert double(2) == 4
+    assert double(3) == 6
+    assert calls == [2, 3]
+
+
+def test_single_flight_cache_decorator_cache_clear_empties_cache():
+    calls = []
+
+    @single_flight_cache()
+    def double(value):
+        calls.append(value)
+        return value * 2
+
+    double(2)
+    double.cache_clear()
+    double(2)
+    assert calls == [2, 2]
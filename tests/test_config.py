@@ -214,6 +214,25 @@ class TestConfigAccessor:
             ConfigAccessor.IGNORE_SSL_ERRORS_KEY
         ]
 
+    def test_update_rate_limit_sets_rate_limit_and_burst(
+        self, config_parser_for_multiple_profiles
+    ):
+        accessor = ConfigAccessor(config_parser_for_multiple_profiles)
+        accessor.update_rate_limit(_TEST_PROFILE_NAME, 2.5, 10)
+        profile = accessor.get_profile(_TEST_PROFILE_NAME)
+        assert profile[ConfigAccessor.RATE_LIMIT_KEY] == "2.5"
+        assert profile[ConfigAccessor.RATE_LIMIT_BURST_KEY] == "10"
+
+    def test_update_rate_limit_when_rate_limit_is_zero_removes_rate_limit(
+        self, config_parser_for_multiple_profiles
+    ):
+        accessor = ConfigAccessor(config_parser_for_multiple_profiles)
+        accessor.update_rate_limit(_TEST_PROFILE_NAME, 2.5, 10)
+        accessor.update_rate_limit(_TEST_PROFILE_NAME, 0)
+        profile = accessor.get_profile(_TEST_PROFILE_NAME)
+        assert profile.get(ConfigAccessor.RATE_LIMIT_KEY) is None
+        assert profile.get(ConfigAccessor.RATE_LIMIT_BURST_KEY) is None
+
     def test_update_profile_does_not_update_when_given_none(
         self, config_parser_for_multiple_profiles
     ):
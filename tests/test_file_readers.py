@@ -0,0 +1,144 @@
+import io
+
+import click
+import pytest
+
+from code42cli.file_readers import CSVReader
+from code42cli.file_readers import FlatFileReader
+from code42cli.file_readers import read_csv
+from code42cli.file_readers import read_flat_file
+
+HEADERS = ["username", "tag"]
+
+
+def create_file(text, name="test.csv"):
+    file = io.StringIO(text)
+    file.name = name
+    return file
+
+
+def test_read_csv_returns_csv_reader():
+    file = create_file("username,tag\nuser1,tag1\n")
+    assert isinstance(read_csv(file, headers=HEADERS), CSVReader)
+
+
+def test_read_csv_when_file_has_header_row_skips_header():
+    file = create_file("username,tag\nuser1,tag1\nuser2,tag2\n")
+    rows = list(read_csv(file, headers=HEADERS))
+    assert rows == [
+        {"username": "user1", "tag": "tag1"},
+        {"username": "user2", "tag": "tag2"},
+    ]
+
+
+def test_read_csv_when_file_has_no_header_row_includes_first_row():
+    file = create_file("user1,tag1\nuser2,tag2\n")
+    rows = list(read_csv(file, headers=HEADERS))
+    assert rows == [
+        {"username": "user1", "tag": "tag1"},
+        {"username": "user2", "tag": "tag2"},
+    ]
+
+
+def test_read_csv_when_column_count_does_not_match_headers_raises_bad_parameter():
+    file = create_file("username\nuser1\n")
+    with pytest.raises(click.BadParameter):
+        read_csv(file, headers=HEADERS)
+
+
+def test_read_csv_when_header_row_has_extra_columns_ignores_extra_columns():
+    file = create_file("username,tag,error_class\nuser1,tag1,Py42NotFoundError\n")
+    rows = list(read_csv(file, headers=HEADERS))
+    assert len(rows) == 1
+    assert rows[0]["username"] == "user1"
+    assert rows[0]["tag"] == "tag1"
+
+
+def test_read_csv_when_file_is_empty_returns_no_rows():
+    file = create_file("")
+    assert list(read_csv(file, headers=HEADERS)) == []
+
+
+def test_read_csv_reads_rows_lazily():
+    file = create_file("username,tag\nuser1,tag1\nuser2,tag2\nuser3,tag3\n")
+    reader = read_csv(file, headers=HEADERS)
+    rows = iter(reader)
+    next(rows)
+    assert file.tell() < len(file.getvalue())
+
+
+def test_csv_reader_bytes_read_tracks_lines_consumed():
+    text = "username,tag\nuser1,tag1\nuser2,tag2\n"
+    reader = read_csv(create_file(text), headers=HEADERS)
+    rows = iter(reader)
+    next(rows)
+    assert reader.bytes_read == len("username,tag\nuser1,tag1\n")
+    next(rows)
+    assert reader.bytes_read == len(text)
+
+
+def test_csv_reader_total_bytes_when_file_has_no_fileno_returns_none():
+    reader = read_csv(create_file("user1,tag1\n"), headers=HEADERS)
+    assert reader.total_bytes is None
+
+
+def test_csv_reader_total_bytes_returns_file_size(tmp_path):
+    text = "username,tag\nuser1,tag1\n"
+    path = tmp_path / "test.csv"
+    path.write_text(text)
+    with open(str(path)) as file:
+        reader = read_csv(file, headers=HEADERS)
+        assert reader.total_bytes == len(text)
+
+
+def test_read_flat_file_returns_flat_file_reader():
+    assert isinstance(read_flat_file(create_file("user1\n")), FlatFileReader)
+
+
+def test_read_flat_file_when_first_row_is_comment_skips_first_row():
+    file = create_file("# username\nuser1\n user2 \n")
+    assert list(read_flat_file(file)) == ["user1", "user2"]
+
+
+def test_read_flat_file_when_first_row_is_not_comment_includes_first_row():
+    file = create_file("user1\nuser2\n")
+    assert list(read_flat_file(file)) == ["user1", "user2"]
+
+
+def test_read_flat_file_when_file_is_empty_returns_no_rows():
+    assert list(read_flat_file(create_file(""))) == []
+
+
+def test_csv_reader_when_file_is_rewindable_iterates_rows_again(tmp_path):
+    path = tmp_path / "test.csv"
+    path.write_text("username,tag\nuser1,tag1\nuser2,tag2\n")
+    with open(str(path)) as file:
+        reader = read_csv(file, headers=HEADERS)
+        first = list(reader)
+        second = list(reader)
+    assert reader.is_rewindable
+    assert first == second
+    assert len(second) == 2
+
+
+def test_csv_reader_line_num_is_line_of_row_most_recently_read():
+    reader = read_csv(create_file("username,tag\nuser1,tag1\nuser2,tag2\n"), HEADERS)
+    line_nums = [reader.line_num for _ in reader]
+    assert line_nums == [2, 3]
+
+
+def test_csv_reader_when_file_is_not_rewindable_iterates_rows_once():
+    reader = read_csv(create_file("username,tag\nuser1,tag1\n"), headers=HEADERS)
+    assert not reader.is_rewindable
+    assert len(list(reader)) == 1
+    assert list(reader) == []
+
+
+def test_flat_file_reader_when_file_is_rewindable_iterates_rows_again(tmp_path):
+    path = tmp_path / "test.txt"
+    path.write_text("# usernames\nuser1\nuser2\n")
+    with open(str(path)) as file:
+        reader = read_flat_file(file)
+        assert list(reader) == ["user1", "user2"]
+        assert list(reader) == ["user1", "user2"]
+        assert reader.bytes_read == reader.total_bytes
@@ -0,0 +1,38 @@
+import json
+
+import pytest
+
+from code42cli import json_lines
+from code42cli.json_lines import get_available_backends
+from code42cli.json_lines import get_dumps_lines
+
+RECORDS = [{"a": 1, "b": ["x", None]}, {"c": "café / test", "d": {"e": False}}]
+
+
+def test_get_available_backends_always_includes_stdlib_last():
+    assert get_available_backends()[-1] == json_lines.STDLIB
+
+
+def test_get_dumps_lines_defaults_to_fastest_available_backend():
+    fastest = get_available_backends()[0]
+    assert get_dumps_lines() is get_dumps_lines(fastest)
+
+
+@pytest.mark.parametrize("backend", get_available_backends())
+def test_dumps_lines_writes_one_json_object_per_line(backend):
+    output = get_dumps_lines(backend)(RECORDS)
+    assert output.endswith("\n")
+    assert [json.loads(line) for line in output.splitlines()] == RECORDS
+
+
+def test_dumps_lines_when_stdlib_writes_compact_json():
+    output = get_dumps_lines(json_lines.STDLIB)(RECORDS[:1])
+    assert output == '{"a":1,"b":["x",null]}\n'
+
+
+def test_get_dumps_lines_when_backend_not_installed_raises_value_error(mocker):
+    mocker.patch.dict(
+        json_lines._BACKENDS, {json_lines.UJSON: (None, lambda records: "")}
+    )
+    with pytest.raises(ValueError):
+        get_dumps_lines(json_lines.UJSON)
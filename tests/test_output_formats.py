@@ -1,6 +1,8 @@
 import json
 from collections import OrderedDict
 
+import pytest
+
 import code42cli.output_formats as output_formats_module
 
 
@@ -173,13 +175,65 @@ class TestOutputFormatter:
         mock_to_table.assert_called_once_with("TEST", None)
 
     def test_init_sets_format_func_to_csv_function_when_csv_format_option_is_passed(
-        self, mock_to_csv
+        self,
     ):
         output_format = output_formats_module.OutputFormat.CSV
         formatter = output_formats_module.OutputFormatter(output_format)
-        for _ in formatter.get_formatted_output("TEST"):
-            pass
-        mock_to_csv.assert_called_once_with("TEST")
+        output = "".join(formatter.get_formatted_output([{"TEST": "FOOBAR"}]))
+        assert output == "TEST\r\nFOOBAR\r\n"
+
+    def test_get_formatted_output_when_csv_writes_header_only_for_first_page(self):
+        formatter = output_formats_module.OutputFormatter(
+            output_formats_module.OutputFormat.CSV
+        )
+        first_page = "".join(formatter.get_formatted_output([{"a": 1, "b": 2}]))
+        second_page = "".join(formatter.get_formatted_output([{"a": 3, "b": 4}]))
+        assert first_page == "a,b\r\n1,2\r\n"
+        assert second_page == "3,4\r\n"
+
+    def test_get_formatted_output_when_csv_puts_header_keys_first(self):
+        formatter = output_formats_module.OutputFormatter(
+            output_formats_module.OutputFormat.CSV, {"b": "B"}
+        )
+        output = "".join(formatter.get_formatted_output([{"a": 1, "b": 2}]))
+        assert output == "b,a\r\n2,1\r\n"
+
+
+class TestCSVStreamFormatter:
+    def test_format_uses_keys_from_all_first_records_in_first_seen_order(self):
+        formatter = output_formats_module.CSVStreamFormatter()
+        output = "".join(formatter.format([{"a": 1}, {"b": 2, "a": 3}]))
+        assert formatter.columns == ["a", "b"]
+        assert output == "a,b\r\n1,\r\n3,2\r\n"
+
+    def test_format_when_later_records_have_new_keys_leaves_them_out_and_warns_once(
+        self, capsys
+    ):
+        formatter = output_formats_module.CSVStreamFormatter()
+        list(formatter.format([{"a": 1}]))
+        output = "".join(formatter.format([{"a": 2, "c": 3}, {"a": 4, "c": 5}]))
+        assert output == "2\r\n4\r\n"
+        warnings = capsys.readouterr().err.splitlines()
+        assert len(warnings) == 1
+        assert warnings[0].endswith(": c")
+
+    def test_format_yields_chunks_of_rows_per_chunk_rows(self):
+        formatter = output_formats_module.CSVStreamFormatter(rows_per_chunk=2)
+        chunks = list(formatter.format([{"a": i} for i in range(5)]))
+        assert chunks == ["a\r\n0\r\n1\r\n", "2\r\n3\r\n", "4\r\n"]
+
+    def test_format_when_given_columns_writes_exactly_those_columns(self, capsys):
+        formatter = output_formats_module.CSVStreamFormatter(
+            {"a": "A"}, columns=["b", "a", "c"]
+        )
+        output = "".join(formatter.format([{"a": 1, "b": 2, "d": 3}]))
+        assert output == "b,a,c\r\n2,1,\r\n"
+        assert capsys.readouterr().err.strip().endswith(": d")
+
+    def test_format_when_given_no_records_yields_nothing(self):
+        formatter = output_formats_module.CSVStreamFormatter()
+        assert list(formatter.format([])) == []
+        assert formatter.columns is None
 
     def test_init_sets_format_func_to_table_function_when_no_format_option_is_passed(
         self, mock_to_table
@@ -188,3 +242,87 @@ class TestOutputFormatter:
         for _ in formatter.get_formatted_output("TEST"):
             pass
         mock_to_table.assert_called_once_with("TEST", None)
+
+
+class TestTableStreamFormatter:
+    def test_format_writes_header_only_for_first_records(self):
+        formatter = output_formats_module.TableStreamFormatter({"a": "A", "b": "Bee"})
+        first = list(formatter.format([{"a": "x", "b": "y"}]))
+        second = list(formatter.format([{"a": "z", "b": "w"}]))
+        assert first == ["A   Bee   \n", "x   y     \n"]
+        assert second == ["z   w     \n"]
+
+    def test_format_sizes_columns_from_sample(self):
+        formatter = output_formats_module.TableStreamFormatter(
+            {"a": "A"}, sample_size=1
+        )
+        lines = list(formatter.format([{"a": "xx"}, {"a": "yyy"}]))
+        assert lines == ["A    \n", "xx   \n", "yy   \n"]
+
+    def test_format_truncates_values_wider_than_max_column_width(self):
+        formatter = output_formats_module.TableStreamFormatter(
+            {"a": "A"}, max_column_width=6
+        )
+        lines = list(formatter.format([{"a": "abcdefghij"}]))
+        assert lines == ["A        \n", "abc...   \n"]
+
+    def test_format_when_not_given_header_uses_keys_from_sample(self):
+        formatter = output_formats_module.TableStreamFormatter()
+        lines = list(formatter.format([{"a": 1}, {"b": 2}]))
+        assert lines == ["a      b      \n", "1      None   \n", "None   2      \n"]
+
+    def test_format_when_given_no_records_yields_nothing(self):
+        formatter = output_formats_module.TableStreamFormatter()
+        assert list(formatter.format([])) == []
+
+
+def test_output_formatter_when_streaming_table_uses_table_stream_formatter(
+    mock_to_table,
+):
+    formatter = output_formats_module.OutputFormatter(
+        output_formats_module.OutputFormat.TABLE, {"a": "A"}, streaming=True
+    )
+    output = "".join(formatter.get_formatted_output([{"a": 1}]))
+    assert output == "A   \n1   \n"
+    assert not mock_to_table.call_count
+
+
+@pytest.mark.parametrize(
+    "output_format,streaming,is_streaming",
+    [
+        (output_formats_module.OutputFormat.TABLE, True, True),
+        (output_formats_module.OutputFormat.TABLE, False, False),
+        (output_formats_module.OutputFormat.CSV, False, True),
+        (output_formats_module.SearchOutputFormat.NDJSON, False, True),
+        (output_formats_module.OutputFormat.JSON, True, False),
+        (output_formats_module.OutputFormat.RAW, True, False),
+    ],
+)
+def test_output_formatter_is_streaming_when_format_formats_pages_as_they_arrive(
+    output_format, streaming, is_streaming
+):
+    formatter = output_formats_module.OutputFormatter(
+        output_format, streaming=streaming
+    )
+    assert formatter.is_streaming == is_streaming
+
+
+class TestJsonLinesFormatter:
+    def test_format_yields_batches_of_records_per_batch_records(self):
+        formatter = output_formats_module.JsonLinesFormatter(
+            records_per_batch=2, backend="json"
+        )
+        chunks = list(formatter.format([{"a": i} for i in range(3)]))
+        assert chunks == ['{"a":0}\n{"a":1}\n', '{"a":2}\n']
+
+    def test_format_when_given_no_records_yields_nothing(self):
+        formatter = output_formats_module.JsonLinesFormatter()
+        assert list(formatter.format([])) == []
+
+
+def test_output_formatter_when_ndjson_writes_one_record_per_line():
+    formatter = output_formats_module.OutputFormatter(
+        output_formats_module.SearchOutputFormat.NDJSON
+    )
+    output = "".join(formatter.get_formatted_output(TEST_DATA))
+    assert [json.loads(line) for line in output.splitlines()] == TEST_DATA
@@ -225,3 +225,18 @@ def test_delete_profile_clears_checkpoints(config_accessor, mocker):
     cliprofile.delete_profile("deleteme")
     assert event_store.clean.call_count == 1
     assert alert_store.clean.call_count == 1
+
+
+def test_code42_profile_rate_limit_when_not_set_returns_none():
+    profile = cliprofile.Code42Profile(MockSection("test"))
+    assert profile.rate_limit is None
+    assert profile.rate_limit_burst is None
+
+
+def test_code42_profile_rate_limit_returns_configured_values():
+    section = MockSection("test")
+    section[ConfigAccessor.RATE_LIMIT_KEY] = "2.5"
+    section[ConfigAccessor.RATE_LIMIT_BURST_KEY] = "10"
+    profile = cliprofile.Code42Profile(section)
+    assert profile.rate_limit == 2.5
+    assert profile.rate_limit_burst == 10
@@ -0,0 +1,133 @@
+import pytest
+from requests import PreparedRequest
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+import code42cli.rate_limit as rate_limit
+from code42cli.rate_limit import create_rate_limiter
+from code42cli.rate_limit import limit_session_rate
+from code42cli.rate_limit import RateLimitedAdapter
+from code42cli.rate_limit import TokenBucket
+from code42cli.rate_limit import wait_for_rate_limit
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiter():
+    yield
+    rate_limit.set_rate_limiter(None)
+
+
+def create_bucket(clock, rate, burst=None):
+    return TokenBucket(rate, burst=burst, clock=clock, sleep=clock.sleep)
+
+
+def test_token_bucket_allows_burst_without_waiting(clock):
+    bucket = create_bucket(clock, 2, burst=5)
+    for _ in range(5):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+
+def test_token_bucket_when_empty_waits_for_next_token(clock):
+    bucket = create_bucket(clock, 2, burst=1)
+    bucket.acquire()
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == [0.5, 0.5]
+
+
+def test_token_bucket_refills_at_rate_up_to_burst(clock):
+    bucket = create_bucket(clock, 10, burst=3)
+    for _ in range(3):
+        bucket.acquire()
+    clock.now += 60
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == []
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.1)]
+
+
+def test_token_bucket_burst_defaults_to_one_second_of_requests(clock):
+    assert create_bucket(clock, 4).burst == 4
+    assert create_bucket(clock, 0.5).burst == 1
+
+
+def test_token_bucket_when_rate_is_not_positive_raises():
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+
+def test_create_rate_limiter_when_profile_has_no_rate_limit_returns_none(profile):
+    profile.rate_limit = None
+    assert create_rate_limiter(profile) is None
+
+
+def test_create_rate_limiter_uses_profile_rate_limit_and_burst(profile):
+    profile.rate_limit = 5.0
+    profile.rate_limit_burst = 10
+    limiter = create_rate_limiter(profile)
+    assert limiter.rate == 5.0
+    assert limiter.burst == 10
+
+
+def test_wait_for_rate_limit_acquires_from_rate_limiter(mocker):
+    limiter = mocker.MagicMock(spec=TokenBucket)
+    rate_limit.set_rate_limiter(limiter)
+    wait_for_rate_limit()
+    wait_for_rate_limit()
+    assert limiter.acquire.call_count == 2
+
+
+def test_rate_limited_adapter_waits_before_sending_each_request(mocker):
+    limiter = mocker.MagicMock(spec=TokenBucket)
+    rate_limit.set_rate_limiter(limiter)
+    wrapped = mocker.MagicMock(spec=HTTPAdapter)
+    adapter = RateLimitedAdapter(wrapped)
+    request = PreparedRequest()
+    adapter.send(request, timeout=60)
+    adapter.send(request, timeout=60)
+    assert limiter.acquire.call_count == 2
+    wrapped.send.assert_called_with(request, timeout=60)
+
+
+def test_limit_session_rate_wraps_mounted_adapters_keeping_their_pool_settings():
+    session = Session()
+    pooled_adapter = HTTPAdapter(pool_connections=200, pool_maxsize=4, pool_block=True)
+    session.mount("https://", pooled_adapter)
+    session.mount("http://", pooled_adapter)
+    limit_session_rate(session)
+    for url in ["https://example.com", "http://example.com"]:
+        adapter = session.get_adapter(url)
+        assert isinstance(adapter, RateLimitedAdapter)
+        assert adapter.adapter is pooled_adapter
+    assert pooled_adapter._pool_connections == 200
+    assert pooled_adapter._pool_maxsize == 4
+    assert pooled_adapter._pool_block
+
+
+def test_limit_session_rate_when_called_twice_wraps_adapters_once():
+    session = Session()
+    limit_session_rate(session)
+    limit_session_rate(session)
+    adapter = session.get_adapter("https://example.com")
+    assert isinstance(adapter, RateLimitedAdapter)
+    assert not isinstance(adapter.adapter, RateLimitedAdapter)
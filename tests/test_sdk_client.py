@@ -2,13 +2,17 @@ import py42.sdk
 import py42.settings.debug as debug
 import pytest
 from py42.exceptions import Py42UnauthorizedError
+from py42.services._connection import ROOT_SESSION
+from py42.services._connection import SESSION_ADAPTER
 from requests import Response
+from requests import Session
 from requests.exceptions import ConnectionError
 from requests.exceptions import RequestException
 
 from .conftest import create_mock_profile
 from code42cli.errors import Code42CLIError
 from code42cli.errors import LoggedCLIError
+from code42cli.rate_limit import RateLimitedAdapter
 from code42cli.sdk_client import create_sdk
 from code42cli.sdk_client import validate_connection
 
@@ -116,3 +120,43 @@ def test_create_sdk_when_told_to_debug_turns_on_debug(mock_sdk_factory):
 def test_validate_connection_uses_given_credentials(mock_sdk_factory):
     assert validate_connection("Authority", "Test", "Password")
     mock_sdk_factory.assert_called_once_with("Authority", "Test", "Password")
+
+
+@pytest.fixture
+def py42_session(mocker):
+    session = Session()
+    session.mount("https://", SESSION_ADAPTER)
+    session.mount("http://", SESSION_ADAPTER)
+    mocker.patch("code42cli.sdk_client.ROOT_SESSION", session)
+    return session
+
+
+def test_py42_session_is_not_rate_limited_on_import():
+    assert ROOT_SESSION.get_adapter("https://example.com") is SESSION_ADAPTER
+
+
+def test_create_sdk_when_profile_has_no_rate_limit_does_not_change_py42_session(
+    profile, mock_sdk_factory, py42_session
+):
+    create_sdk(profile, False)
+    assert py42_session.get_adapter("https://example.com") is SESSION_ADAPTER
+
+
+def test_create_sdk_when_profile_has_rate_limit_rate_limits_py42_session(
+    profile, mock_sdk_factory, py42_session
+):
+    profile.rate_limit = 5.0
+    create_sdk(profile, False)
+    for url in ["https://example.com", "http://example.com"]:
+        adapter = py42_session.get_adapter(url)
+        assert isinstance(adapter, RateLimitedAdapter)
+        assert adapter.adapter is SESSION_ADAPTER
+
+
+def test_create_sdk_when_profile_has_rate_limit_and_py42_session_is_unavailable_raises_cli_error(
+    profile, mock_sdk_factory, mocker
+):
+    mocker.patch("code42cli.sdk_client.ROOT_SESSION", None)
+    profile.rate_limit = 5.0
+    with pytest.raises(Code42CLIError):
+        create_sdk(profile, False)
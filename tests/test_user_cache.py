@@ -0,0 +1,92 @@
+import os
+
+import pytest
+
+from code42cli.user_cache import UserIdCache
+
+TEST_PROFILE = "test_profile"
+
+
+@pytest.fixture
+def user_cache():
+    cache = UserIdCache(TEST_PROFILE)
+    yield cache
+    cache.close()
+
+
+def test_get_when_user_not_cached_returns_none(user_cache):
+    assert user_cache.get("test.user@example.com") is None
+
+
+def test_get_when_user_cached_returns_user_uid(user_cache):
+    user_cache.set("test.user@example.com", "123")
+    assert user_cache.get("test.user@example.com") == "123"
+
+
+def test_set_many_caches_all_users(user_cache):
+    user_cache.set_many([("one@example.com", "1"), ("two@example.com", "2")])
+    assert user_cache.get("one@example.com") == "1"
+    assert user_cache.get("two@example.com") == "2"
+
+
+def test_set_when_user_already_cached_replaces_user_uid(user_cache):
+    user_cache.set("test.user@example.com", "123")
+    user_cache.set("test.user@example.com", "456")
+    assert user_cache.get("test.user@example.com") == "456"
+
+
+def test_get_when_entry_is_older_than_ttl_returns_none(mocker):
+    cache = UserIdCache(TEST_PROFILE, ttl=60)
+    mock_time = mocker.patch("code42cli.user_cache.time", return_value=1000)
+    cache.set("test.user@example.com", "123")
+    mock_time.return_value = 1061
+    assert cache.get("test.user@example.com") is None
+    cache.close()
+
+
+def test_cache_persists_across_instances_for_same_profile(user_cache):
+    user_cache.set("test.user@example.com", "123")
+    other = UserIdCache(TEST_PROFILE)
+    assert other.get("test.user@example.com") == "123"
+    other.close()
+
+
+def test_cache_is_separate_for_each_profile(user_cache):
+    user_cache.set("test.user@example.com", "123")
+    other = UserIdCache("other_profile")
+    assert other.get("test.user@example.com") is None
+    other.close()
+
+
+def test_init_when_refresh_is_true_clears_cached_users(user_cache):
+    user_cache.set("test.user@example.com", "123")
+    refreshed = UserIdCache(TEST_PROFILE, refresh=True)
+    assert refreshed.get("test.user@example.com") is None
+    refreshed.close()
+
+
+def test_cache_is_separate_for_each_server_of_a_profile():
+    cache = UserIdCache(TEST_PROFILE, "https://one.example.com")
+    cache.set("test.user@example.com", "123")
+    other = UserIdCache(TEST_PROFILE, "https://two.example.com")
+    assert other.get("test.user@example.com") is None
+    cache.close()
+    other.close()
+
+
+def test_init_when_profile_name_has_path_characters_keeps_file_in_cache_dir(
+    user_cache_dir,
+):
+    cache = UserIdCache("../other/profile")
+    assert os.path.dirname(cache.path) == user_cache_dir
+    assert os.path.basename(cache.path).startswith(".._other_profile_")
+    cache.close()
+
+
+def test_init_when_profile_names_are_made_the_same_keeps_caches_separate():
+    cache = UserIdCache("a b")
+    cache.set("test.user@example.com", "123")
+    other = UserIdCache("a_b")
+    assert other.get("test.user@example.com") is None
+    cache.close()
+    other.close()
@@ -1,5 +1,16 @@
 import time
+from threading import Event
+from threading import Lock
+from threading import Thread
 
+import pytest
+from py42.exceptions import Py42HTTPError
+from requests import HTTPError
+from requests import Response
+
+from code42cli.worker import AdaptiveConcurrency
+from code42cli.worker import is_throttling_error
+from code42cli.worker import RetryPolicy
 from code42cli.worker import Worker
 from code42cli.worker import WorkerStats
 
@@ -25,3 +36,334 @@ class TestWorker:
         demo_ls.append(1)
         worker.wait()
         assert demo_ls == [1, 2]
+
+    def test_wait_returns_as_soon_as_tasks_complete(self):
+        worker = Worker(5, 1)
+        worker.do_async(lambda: None)
+        start = time.time()
+        worker.wait()
+        assert time.time() - start < 0.25
+
+    def test_wait_when_no_tasks_returns_immediately(self):
+        worker = Worker(5, 0)
+        worker.wait()
+        assert worker.stats.total_processed == 0
+
+    def test_do_async_returns_task_with_result(self):
+        worker = Worker(5, 1)
+        task = worker.do_async(lambda x, y=0: x + y, 1, y=2)
+        assert task.result(timeout=1) == 3
+        assert task.done()
+        assert task.exception() is None
+
+    def test_do_async_returns_task_with_exception_when_func_raises(self):
+        worker = Worker(5, 1)
+        error = ValueError("test")
+
+        def raise_error():
+            raise error
+
+        task = worker.do_async(raise_error)
+        assert task.exception(timeout=1) is error
+        with pytest.raises(ValueError):
+            task.result()
+        worker.wait()
+        assert worker.stats.total_errors == 1
+
+    def test_task_done_callbacks_complete_before_wait_returns(self):
+        worker = Worker(5, 3)
+        completed = []
+        for i in range(3):
+            task = worker.do_async(lambda val: val, i)
+            task.add_done_callback(lambda t: completed.append(t.result()))
+        worker.wait()
+        assert sorted(completed) == [0, 1, 2]
+
+    def test_task_add_done_callback_when_already_done_calls_immediately(self):
+        worker = Worker(5, 1)
+        task = worker.do_async(lambda: "done")
+        worker.wait()
+        results = []
+        task.add_done_callback(lambda t: results.append(t.result()))
+        assert results == ["done"]
+
+    def test_task_result_when_not_done_raises_timeout_error(self):
+        worker = Worker(1, 1)
+        release = Event()
+        task = worker.do_async(release.wait)
+        with pytest.raises(TimeoutError):
+            task.result(timeout=0.01)
+        release.set()
+        worker.wait()
+
+
+def create_http_error(mocker, status_code):
+    err = mocker.MagicMock(spec=HTTPError)
+    err.response = mocker.MagicMock(spec=Response)
+    err.response.status_code = status_code
+    err.response.request = mocker.MagicMock()
+    return Py42HTTPError(err)
+
+
+@pytest.mark.parametrize("status_code", [429, 500, 503])
+def test_is_throttling_error_when_throttling_status_returns_true(mocker, status_code):
+    assert is_throttling_error(create_http_error(mocker, status_code))
+
+
+@pytest.mark.parametrize("status_code", [400, 403, 404])
+def test_is_throttling_error_when_client_error_status_returns_false(
+    mocker, status_code
+):
+    assert not is_throttling_error(create_http_error(mocker, status_code))
+
+
+def test_is_throttling_error_when_not_http_error_returns_false():
+    assert not is_throttling_error(ValueError())
+    assert not is_throttling_error(None)
+
+
+class TestAdaptiveConcurrency:
+    def test_init_starts_at_initial_limit_within_bounds(self):
+        assert AdaptiveConcurrency(1, 10, initial_limit=5).limit == 5
+        assert AdaptiveConcurrency(1, 3, initial_limit=5).limit == 3
+        assert AdaptiveConcurrency(2, 10).limit == 2
+
+    def test_init_when_min_greater_than_max_raises_value_error(self):
+        with pytest.raises(ValueError):
+            AdaptiveConcurrency(5, 2)
+
+    def test_release_when_latency_flat_for_window_increases_limit(self):
+        concurrency = AdaptiveConcurrency(1, 10, initial_limit=2, window=3)
+        for _ in range(6):
+            concurrency.acquire()
+            concurrency.release(latency=0.1)
+        assert concurrency.limit == 4
+
+    def test_release_when_latency_rises_does_not_increase_limit(self):
+        concurrency = AdaptiveConcurrency(1, 10, initial_limit=2, window=2)
+        for latency in [0.1, 0.1, 1.0, 1.0]:
+            concurrency.acquire()
+            concurrency.release(latency=latency)
+        assert concurrency.limit == 3
+
+    def test_release_never_increases_limit_above_max(self):
+        concurrency = AdaptiveConcurrency(1, 2, initial_limit=2, window=1)
+        for _ in range(5):
+            concurrency.acquire()
+            concurrency.release(latency=0.1)
+        assert concurrency.limit == 2
+
+    def test_release_when_throttled_halves_limit(self):
+        concurrency = AdaptiveConcurrency(1, 20, initial_limit=8)
+        concurrency.acquire()
+        concurrency.release(throttled=True)
+        assert concurrency.limit == 4
+
+    def test_release_when_throttled_never_decreases_limit_below_min(self):
+        concurrency = AdaptiveConcurrency(3, 20, initial_limit=4)
+        concurrency.acquire()
+        concurrency.release(throttled=True)
+        assert concurrency.limit == 3
+
+    def test_worker_with_concurrency_runs_at_most_limit_tasks_at_once(self):
+        concurrency = AdaptiveConcurrency(2, 2)
+        worker = Worker(5, 10, concurrency=concurrency)
+        lock = Lock()
+        running = []
+        peak = []
+
+        def task():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.pop()
+
+        for _ in range(10):
+            worker.do_async(task)
+        worker.wait()
+        assert max(peak) <= 2
+
+    def test_worker_with_concurrency_when_task_throttled_decreases_limit(self, mocker):
+        concurrency = AdaptiveConcurrency(1, 4, initial_limit=4)
+        worker = Worker(4, 1, concurrency=concurrency)
+        error = create_http_error(mocker, 429)
+
+        def task():
+            raise error
+
+        worker.do_async(task)
+        worker.wait()
+        assert concurrency.limit == 2
+
+
+class TestWorkerQueue:
+    def test_do_async_when_queue_full_blocks_until_task_taken(self):
+        worker = Worker(1, 3, max_queue_size=1)
+        release = Event()
+        started = Event()
+
+        def block():
+            started.set()
+            release.wait()
+
+        worker.do_async(block)
+        started.wait(1)
+        worker.do_async(lambda: None)
+        assert worker.queue_depth == 1
+
+        enqueued = Event()
+
+        def produce():
+            worker.do_async(lambda: None)
+            enqueued.set()
+
+        Thread(target=produce, daemon=True).start()
+        assert not enqueued.wait(0.05)
+        release.set()
+        assert enqueued.wait(1)
+        worker.wait()
+        assert worker.stats.total_processed == 3
+
+
+class TestRetryPolicy:
+    def test_get_retry_delay_when_error_is_not_http_error_returns_none(self):
+        policy = RetryPolicy()
+        assert policy.get_retry_delay(Exception(), 1) is None
+
+    def test_get_retry_delay_when_status_is_not_retryable_returns_none(self, mocker):
+        policy = RetryPolicy()
+        assert policy.get_retry_delay(create_http_error(mocker, 400), 1) is None
+
+    def test_get_retry_delay_when_attempts_exhausted_returns_none(self, mocker):
+        policy = RetryPolicy(max_attempts=3)
+        assert policy.get_retry_delay(create_http_error(mocker, 503), 3) is None
+
+    @pytest.mark.parametrize("attempt,backoff", [(1, 1.0), (2, 2.0), (3, 4.0)])
+    def test_get_retry_delay_returns_jittered_exponential_backoff(
+        self, mocker, attempt, backoff
+    ):
+        mocker.patch("code42cli.worker.random.uniform", side_effect=lambda a, b: b)
+        policy = RetryPolicy(max_attempts=5, backoff_base=1.0, backoff_cap=30.0)
+        assert (
+            policy.get_retry_delay(create_http_error(mocker, 503), attempt) == backoff
+        )
+
+    def test_get_retry_delay_does_not_exceed_backoff_cap(self, mocker):
+        policy = RetryPolicy(max_attempts=20, backoff_base=1.0, backoff_cap=5.0)
+        delay = policy.get_retry_delay(create_http_error(mocker, 503), 10)
+        assert 0 <= delay <= 5.0
+
+    def test_get_retry_delay_when_response_has_retry_after_returns_retry_after(
+        self, mocker
+    ):
+        err = create_http_error(mocker, 429)
+        err.response.headers = {"Retry-After": "7"}
+        assert RetryPolicy().get_retry_delay(err, 1) == 7
+
+    def test_get_retry_delay_when_retry_after_exceeds_cap_returns_none(self, mocker):
+        err = create_http_error(mocker, 429)
+        err.response.headers = {"Retry-After": "120"}
+        assert RetryPolicy(backoff_cap=30).get_retry_delay(err, 1) is None
+
+    def test_get_retry_delay_when_retry_after_is_http_date_returns_seconds_until_date(
+        self, mocker
+    ):
+        mocker.patch("code42cli.worker.time", return_value=1602000000)
+        err = create_http_error(mocker, 503)
+        err.response.headers = {"Retry-After": "Tue, 06 Oct 2020 16:00:05 GMT"}
+        assert RetryPolicy().get_retry_delay(err, 1) == 5
+
+    def test_init_when_max_attempts_less_than_one_raises_value_error(self):
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+
+def test_worker_when_task_fails_with_retryable_error_retries_task(mocker):
+    errors = [create_http_error(mocker, 503)]
+
+    def flaky():
+        if errors:
+            raise errors.pop()
+        return "success"
+
+    worker = Worker(2, 1, retry_policy=RetryPolicy(backoff_base=0))
+    task = worker.do_async(flaky)
+    worker.wait()
+    assert task.result() == "success"
+    assert task.attempts == 2
+    assert worker.stats.total_processed == 1
+    assert worker.stats.total_errors == 0
+
+
+def test_worker_when_retries_exhausted_fails_task_with_last_error(mocker):
+    error = create_http_error(mocker, 503)
+
+    def always_fails():
+        raise error
+
+    worker = Worker(2, 1, retry_policy=RetryPolicy(max_attempts=3, backoff_base=0))
+    task = worker.do_async(always_fails)
+    worker.wait()
+    assert task.exception() is error
+    assert task.attempts == 3
+    assert worker.stats.total_processed == 1
+    assert worker.stats.total_errors == 1
+
+
+def test_worker_when_error_is_not_retryable_does_not_retry_task(mocker):
+    error = create_http_error(mocker, 400)
+
+    def fails():
+        raise error
+
+    worker = Worker(2, 1, retry_policy=RetryPolicy(backoff_base=0))
+    task = worker.do_async(fails)
+    worker.wait()
+    assert task.attempts == 1
+    assert task.exception() is error
+
+
+def test_worker_without_retry_policy_does_not_retry_task(mocker):
+    error = create_http_error(mocker, 503)
+
+    def fails():
+        raise error
+
+    worker = Worker(2, 1)
+    task = worker.do_async(fails)
+    worker.wait()
+    assert task.attempts == 1
+
+
+def test_worker_wait_waits_for_tasks_waiting_to_be_retried(mocker):
+    errors = [create_http_error(mocker, 503)]
+
+    def flaky():
+        if errors:
+            raise errors.pop()
+
+    mocker.patch("code42cli.worker.random.uniform", return_value=0.2)
+    worker = Worker(2, 1, retry_policy=RetryPolicy())
+    task = worker.do_async(flaky)
+    worker.wait()
+    assert task.done()
+    assert task.attempts == 2
+
+
+def test_worker_does_not_block_threads_while_task_waits_to_be_retried(mocker):
+    errors = [create_http_error(mocker, 503)]
+    finished = []
+
+    def flaky():
+        if errors:
+            raise errors.pop()
+        finished.append("retried")
+
+    mocker.patch("code42cli.worker.random.uniform", return_value=0.3)
+    worker = Worker(1, 2, retry_policy=RetryPolicy())
+    worker.do_async(flaky)
+    worker.do_async(lambda: finished.append("other"))
+    worker.wait()
+    assert finished == ["other", "retried"]